@@ -69,7 +69,8 @@ class IssueSerializer(BaseSerializer):
             "description_stripped",
         ]
 
-    def validate(self, data):
+    def validate_content(self, data):
+        """Checks of the payload which do not need the database"""
         if (
             data.get("start_date", None) is not None
             and data.get("target_date", None) is not None
@@ -88,6 +89,11 @@ class IssueSerializer(BaseSerializer):
         except Exception:
             raise serializers.ValidationError("Invalid HTML passed")
 
+        return data
+
+    def validate(self, data):
+        data = self.validate_content(data)
+
         # Validate assignees are from project
         if data.get("assignees", []):
             data["assignees"] = ProjectMember.objects.filter(
@@ -275,6 +281,32 @@ class IssueSerializer(BaseSerializer):
         return data
 
 
+class IssueBulkSerializer(IssueSerializer):
+    """
+    Issue of a batch, the related ids are only parsed here and resolved
+    for the whole batch at once instead of with queries per issue
+    """
+
+    assignees = serializers.ListField(
+        child=serializers.UUIDField(), write_only=True, required=False
+    )
+    labels = serializers.ListField(
+        child=serializers.UUIDField(), write_only=True, required=False
+    )
+    type_id = serializers.UUIDField(
+        source="type", required=False, allow_null=True
+    )
+    type = serializers.UUIDField(required=False, allow_null=True)
+    parent = serializers.UUIDField(required=False, allow_null=True)
+    state = serializers.UUIDField(required=False, allow_null=True)
+    estimate_point = serializers.UUIDField(required=False, allow_null=True)
+    created_by = serializers.UUIDField(required=False, allow_null=True)
+    created_at = serializers.DateTimeField(required=False)
+
+    def validate(self, data):
+        return self.validate_content(data)
+
+
 class IssueLiteSerializer(BaseSerializer):
     class Meta:
         model = Issue
@@ -10,14 +10,12 @@ from django.db.models import (
     CharField,
     Exists,
     F,
-    Func,
     Max,
-    OuterRef,
     Q,
     Value,
     When,
-    Subquery,
 )
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 # Third party imports
@@ -39,7 +37,10 @@ from plane.app.permissions import (
     ProjectLitePermission,
     ProjectMemberPermission,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import (
+    bulk_issue_activity,
+    issue_activity,
+)
 from plane.db.models import (
     Issue,
     IssueActivity,
@@ -49,7 +50,11 @@ from plane.db.models import (
     Label,
     Project,
     ProjectMember,
-    CycleIssue,
+)
+from plane.utils.issue_bulk import (
+    ISSUE_BULK_MAX_ITEMS,
+    bulk_create_issues,
+    bulk_update_issues,
 )
 
 from .base import BaseAPIView
@@ -73,12 +78,7 @@ class WorkspaceIssueAPIEndpoint(BaseAPIView):
     def get_queryset(self):
         return (
             Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project__identifier=self.kwargs.get("project__identifier"))
@@ -96,12 +96,7 @@ class WorkspaceIssueAPIEndpoint(BaseAPIView):
     ):
         if issue__identifier and project__identifier:
             issue = Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             ).get(
                 workspace__slug=slug,
                 project__identifier=project__identifier,
@@ -134,12 +129,7 @@ class IssueAPIEndpoint(BaseAPIView):
     def get_queryset(self):
         return (
             Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
@@ -174,12 +164,7 @@ class IssueAPIEndpoint(BaseAPIView):
 
         if pk:
             issue = Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             ).get(workspace__slug=slug, project_id=project_id, pk=pk)
             return Response(
                 IssueSerializer(
@@ -204,27 +189,10 @@ class IssueAPIEndpoint(BaseAPIView):
 
         issue_queryset = (
             self.get_queryset()
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
         )
 
@@ -567,6 +535,69 @@ class IssueAPIEndpoint(BaseAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class IssueBulkAPIEndpoint(BaseAPIView):
+    """
+    Create or update a batch of issues of a project in one request, the
+    result of every issue is returned in the order of the batch
+    """
+
+    model = Issue
+    webhook_event = "issue"
+    permission_classes = [ProjectEntityPermission]
+
+    def get_batch(self, request):
+        issues = request.data.get("issues")
+        if not isinstance(issues, list) or not issues:
+            return None, Response(
+                {"error": "issues must be a non empty list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(issues) > ISSUE_BULK_MAX_ITEMS:
+            return None, Response(
+                {
+                    "error": "A batch can hold at most "
+                    f"{ISSUE_BULK_MAX_ITEMS} issues"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return issues, None
+
+    def track(self, request, type, project_id, activities):
+        if activities:
+            bulk_issue_activity.delay(
+                type=type,
+                activities=activities,
+                actor_id=str(request.user.id),
+                project_id=str(project_id),
+                epoch=int(timezone.now().timestamp()),
+                origin=request.META.get("HTTP_ORIGIN"),
+            )
+
+    def post(self, request, slug, project_id):
+        issues, error = self.get_batch(request)
+        if error is not None:
+            return error
+
+        project = Project.objects.get(workspace__slug=slug, pk=project_id)
+        results, activities = bulk_create_issues(
+            project, issues, request.user
+        )
+        self.track(request, "issue.activity.created", project_id, activities)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    def patch(self, request, slug, project_id):
+        issues, error = self.get_batch(request)
+        if error is not None:
+            return error
+
+        project = Project.objects.get(workspace__slug=slug, pk=project_id)
+        results, activities = bulk_update_issues(
+            project, issues, request.user
+        )
+        self.track(request, "issue.activity.updated", project_id, activities)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
 class LabelAPIEndpoint(BaseAPIView):
     """
     This viewset automatically provides `list`, `create`, `retrieve`,
@@ -4,6 +4,7 @@ import json
 # Django imports
 from django.core import serializers
 from django.db.models import Count, F, Func, OuterRef, Prefetch, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 
@@ -21,8 +22,6 @@ from plane.app.permissions import ProjectEntityPermission
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     Module,
     ModuleIssue,
     ModuleLink,
@@ -378,12 +377,7 @@ class ModuleIssueAPIEndpoint(BaseAPIView):
                 issue_module__deleted_at__isnull=True,
             )
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .annotate(bridge_id=F("issue_module__id"))
             .filter(project_id=project_id)
@@ -395,20 +389,9 @@ class ModuleIssueAPIEndpoint(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .order_by(order_by)
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
         )
         return self.paginate(
@@ -1,4 +1,4 @@
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.membership import get_member_roles
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
@@ -30,24 +30,17 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
                 for role in allowed_roles
             ]
 
-            # Check role permissions
+            # Check role permissions against the resolved member roles
+            member_roles = get_member_roles(request)
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
-                    return view_func(instance, request, *args, **kwargs)
+                role = member_roles.workspace_role(kwargs["slug"])
             else:
-                if ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
-                    return view_func(instance, request, *args, **kwargs)
+                role = member_roles.project_role(
+                    kwargs["slug"], kwargs["project_id"]
+                )
+
+            if role in allowed_role_values:
+                return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
             return Response(
@@ -54,6 +54,11 @@ urlpatterns = [
         IssuePaginatedViewSet.as_view({"get": "list"}),
         name="project-issues-paginated",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/v2/issues/changes/",
+        IssuePaginatedViewSet.as_view({"get": "changes"}),
+        name="project-issue-changes",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:pk>/",
         IssueViewSet.as_view(
@@ -309,6 +314,24 @@ urlpatterns = [
         ),
         name="issue-relation",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/issue-relation/blockers/",
+        IssueRelationViewSet.as_view(
+            {
+                "get": "blockers",
+            }
+        ),
+        name="issue-relation-blockers",
+    ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/issue-relation/critical-path/",
+        IssueRelationViewSet.as_view(
+            {
+                "get": "critical_path",
+            }
+        ),
+        name="issue-relation-critical-path",
+    ),
     ## End Issue Relation
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/deleted-issues/",
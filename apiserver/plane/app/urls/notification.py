@@ -3,6 +3,7 @@ from django.urls import path
 
 from plane.app.views import (
     NotificationViewSet,
+    NotificationStateEndpoint,
     UnreadNotificationEndpoint,
     MarkAllReadNotificationViewSet,
     UserNotificationPreferenceEndpoint,
@@ -64,6 +65,11 @@ urlpatterns = [
         ),
         name="mark-all-read-notifications",
     ),
+    path(
+        "workspaces/<str:slug>/users/notifications/bulk-state/",
+        NotificationStateEndpoint.as_view(),
+        name="bulk-notification-state",
+    ),
     path(
         "users/me/notification-preferences/",
         UserNotificationPreferenceEndpoint.as_view(),
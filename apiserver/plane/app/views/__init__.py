@@ -232,6 +232,7 @@ from .analytic.base import (
 
 from .notification.base import (
     NotificationViewSet,
+    NotificationStateEndpoint,
     UnreadNotificationEndpoint,
     UserNotificationPreferenceEndpoint,
 )
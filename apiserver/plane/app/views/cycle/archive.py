@@ -1,7 +1,6 @@
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
 from django.db.models import (
     Case,
     CharField,
@@ -19,7 +18,7 @@ from django.db.models import (
     Sum,
     FloatField,
 )
-from django.db.models.functions import Coalesce, Cast, Concat
+from django.db.models.functions import Coalesce, Cast
 from django.utils import timezone
 
 # Third party imports
@@ -27,7 +26,11 @@ from rest_framework import status
 from rest_framework.response import Response
 from plane.app.permissions import allow_permission, ROLE
 from plane.db.models import Cycle, UserFavorite, Issue, Label, User, Project
-from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_snapshot import (
+    get_progress_snapshot,
+    progress_stats,
+    snapshot_burndown,
+)
 
 # Module imports
 from .. import BaseAPIView
@@ -404,249 +407,30 @@ class CycleArchiveUnarchiveEndpoint(BaseAPIView):
                 estimate__type="points",
             ).exists()
 
-            data["estimate_distribution"] = {}
-            if estimate_type:
-                assignee_distribution = (
-                    Issue.issue_objects.filter(
-                        issue_cycle__cycle_id=pk,
-                        issue_cycle__deleted_at__isnull=True,
-                        workspace__slug=slug,
-                        project_id=project_id,
-                    )
-                    .annotate(display_name=F("assignees__display_name"))
-                    .annotate(assignee_id=F("assignees__id"))
-                    .annotate(
-                        avatar_url=Case(
-                            # If `avatar_asset` exists, use it to generate the asset URL
-                            When(
-                                assignees__avatar_asset__isnull=False,
-                                then=Concat(
-                                    Value("/api/assets/v2/static/"),
-                                    "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                    Value("/"),
-                                ),
-                            ),
-                            # If `avatar_asset` is None, fall back to using `avatar` field directly
-                            When(
-                                assignees__avatar_asset__isnull=True,
-                                then="assignees__avatar",
-                            ),
-                            default=Value(None),
-                            output_field=models.CharField(),
-                        )
-                    )
-                    .values("display_name", "assignee_id", "avatar_url")
-                    .annotate(
-                        total_estimates=Sum(
-                            Cast("estimate_point__value", FloatField())
-                        )
-                    )
-                    .annotate(
-                        completed_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=False,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .annotate(
-                        pending_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=True,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .order_by("display_name")
-                )
+            # Read the precomputed progress of the cycle
+            stats = progress_stats(
+                get_progress_snapshot(cycle_id=pk), estimates=estimate_type
+            )
+            data["estimate_distribution"] = stats["estimate_distribution"]
 
-                label_distribution = (
-                    Issue.issue_objects.filter(
-                        issue_cycle__cycle_id=pk,
-                        issue_cycle__deleted_at__isnull=True,
-                        workspace__slug=slug,
-                        project_id=project_id,
-                    )
-                    .annotate(label_name=F("labels__name"))
-                    .annotate(color=F("labels__color"))
-                    .annotate(label_id=F("labels__id"))
-                    .values("label_name", "color", "label_id")
-                    .annotate(
-                        total_estimates=Sum(
-                            Cast("estimate_point__value", FloatField())
-                        )
-                    )
-                    .annotate(
-                        completed_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=False,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .annotate(
-                        pending_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=True,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .order_by("label_name")
-                )
-                data["estimate_distribution"] = {
-                    "assignees": assignee_distribution,
-                    "labels": label_distribution,
-                    "completion_chart": {},
-                }
+            if estimate_type:
+                data["estimate_distribution"]["completion_chart"] = {}
 
                 if data["start_date"] and data["end_date"]:
                     data["estimate_distribution"]["completion_chart"] = (
-                        burndown_plot(
-                            queryset=queryset,
-                            slug=slug,
-                            project_id=project_id,
-                            plot_type="points",
-                            cycle_id=pk,
+                        snapshot_burndown(
+                            queryset, plot_type="points", cycle_id=pk
                         )
                     )
 
-            # Assignee Distribution
-            assignee_distribution = (
-                Issue.issue_objects.filter(
-                    issue_cycle__cycle_id=pk,
-                    issue_cycle__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(first_name=F("assignees__first_name"))
-                .annotate(last_name=F("assignees__last_name"))
-                .annotate(assignee_id=F("assignees__id"))
-                .annotate(
-                    avatar_url=Case(
-                        # If `avatar_asset` exists, use it to generate the asset URL
-                        When(
-                            assignees__avatar_asset__isnull=False,
-                            then=Concat(
-                                Value("/api/assets/v2/static/"),
-                                "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                Value("/"),
-                            ),
-                        ),
-                        # If `avatar_asset` is None, fall back to using `avatar` field directly
-                        When(
-                            assignees__avatar_asset__isnull=True,
-                            then="assignees__avatar",
-                        ),
-                        default=Value(None),
-                        output_field=models.CharField(),
-                    )
-                )
-                .annotate(display_name=F("assignees__display_name"))
-                .values(
-                    "first_name",
-                    "last_name",
-                    "assignee_id",
-                    "avatar_url",
-                    "display_name",
-                )
-                .annotate(
-                    total_issues=Count(
-                        "id",
-                        filter=Q(
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    ),
-                )
-                .annotate(
-                    completed_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("first_name", "last_name")
-            )
-
-            # Label Distribution
-            label_distribution = (
-                Issue.issue_objects.filter(
-                    issue_cycle__cycle_id=pk,
-                    issue_cycle__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(label_name=F("labels__name"))
-                .annotate(color=F("labels__color"))
-                .annotate(label_id=F("labels__id"))
-                .values("label_name", "color", "label_id")
-                .annotate(
-                    total_issues=Count(
-                        "id",
-                        filter=Q(
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    ),
-                )
-                .annotate(
-                    completed_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("label_name")
-            )
-
             data["distribution"] = {
-                "assignees": assignee_distribution,
-                "labels": label_distribution,
+                **stats["distribution"],
                 "completion_chart": {},
             }
 
             if queryset.start_date and queryset.end_date:
-                data["distribution"]["completion_chart"] = burndown_plot(
-                    queryset=queryset,
-                    slug=slug,
-                    project_id=project_id,
-                    plot_type="issues",
-                    cycle_id=pk,
+                data["distribution"]["completion_chart"] = snapshot_burndown(
+                    queryset, plot_type="issues", cycle_id=pk
                 )
 
             return Response(
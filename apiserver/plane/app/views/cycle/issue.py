@@ -3,7 +3,8 @@ import json
 
 # Django imports
 from django.core import serializers
-from django.db.models import F, Func, OuterRef, Q, Subquery
+from django.db.models import F, Func, OuterRef, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -23,8 +24,7 @@ from plane.db.models import (
     Cycle,
     CycleIssue,
     Issue,
-    FileAsset,
-    IssueLink,
+    IssueCounter,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -107,35 +107,13 @@ class CycleIssueViewSet(BaseViewSet):
                 "issue_cycle__cycle",
             )
             .filter(**filters)
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         )
         filters = issue_filters(request.query_params, "GET")
@@ -316,6 +294,8 @@ class CycleIssueViewSet(BaseViewSet):
         CycleIssue.objects.bulk_update(
             updated_records, ["cycle_id"], batch_size=100
         )
+        # Bulk writes skip the signals keeping the cycle of the issues
+        IssueCounter.refresh(issues)
         # Capture Issue Activity
         issue_activity.delay(
             type="cycle.activity.created",
@@ -362,4 +342,5 @@ class CycleIssueViewSet(BaseViewSet):
             origin=request.META.get("HTTP_ORIGIN"),
         )
         cycle_issue.delete()
+        IssueCounter.refresh([issue_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
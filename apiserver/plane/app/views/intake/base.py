@@ -3,7 +3,7 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, Count, OuterRef, Func, F, Prefetch, Subquery
+from django.db.models import Q, Count, F, Prefetch
 from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
@@ -22,11 +22,8 @@ from plane.db.models import (
     IntakeIssue,
     Issue,
     State,
-    IssueLink,
-    FileAsset,
     Project,
     ProjectMember,
-    CycleIssue,
 )
 from plane.app.serializers import (
     IssueCreateSerializer,
@@ -36,6 +33,7 @@ from plane.app.serializers import (
     IntakeIssueDetailSerializer,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.membership import get_member_roles
 from plane.bgtasks.issue_activities_task import issue_activity
 
 
@@ -113,35 +111,13 @@ class IntakeIssueViewSet(BaseViewSet):
                     ),
                 )
             )
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .annotate(
                 label_ids=Coalesce(
@@ -221,13 +197,7 @@ class IntakeIssueViewSet(BaseViewSet):
             intake_issue = intake_issue.filter(status__in=intake_status)
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
         ):
             intake_issue = intake_issue.filter(created_by=request.user)
@@ -598,13 +568,7 @@ class IntakeIssueViewSet(BaseViewSet):
             .get(intake_id=intake_id.id, issue_id=pk, project_id=project_id)
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
             and not intake_issue.created_by == request.user
         ):
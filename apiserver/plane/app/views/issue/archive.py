@@ -3,7 +3,8 @@ import json
 
 # Django imports
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import F, Func, OuterRef, Q, Prefetch, Exists, Subquery
+from django.db.models import F, Func, OuterRef, Q, Prefetch, Exists
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -23,12 +24,14 @@ from plane.app.serializers import (
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
+    IssueChange,
+    IssueCounter,
     IssueLink,
     IssueSubscriber,
-    IssueReaction,
-    CycleIssue
+    IssueReaction
 )
+from plane.db.models.recent_visit import EntityNameEnum
+from plane.db.models.search import schedule_search_documents_update
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -65,35 +68,13 @@ class IssueArchiveViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         )
 
@@ -377,8 +358,19 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
                 origin=request.META.get("HTTP_ORIGIN"),
             )
             issue.archived_at = timezone.now().date()
+            issue.updated_at = timezone.now()
             bulk_archive_issues.append(issue)
-        Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+        Issue.objects.bulk_update(
+            bulk_archive_issues, ["archived_at", "updated_at"]
+        )
+        # Bulk updates skip the signals counting the sub issues
+        IssueCounter.refresh(
+            [issue.parent_id for issue in bulk_archive_issues]
+        )
+        IssueChange.record_issues(bulk_archive_issues)
+        schedule_search_documents_update(
+            EntityNameEnum.ISSUE, [issue.id for issue in bulk_archive_issues]
+        )
 
         return Response(
             {"archived_at": str(timezone.now().date())},
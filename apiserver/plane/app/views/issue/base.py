@@ -8,13 +8,11 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
     Exists,
     F,
-    Func,
     OuterRef,
     Prefetch,
     Q,
     UUIDField,
     Value,
-    Subquery,
     Case,
     When,
 )
@@ -38,15 +36,16 @@ from plane.app.serializers import (
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
+    IssueChange,
+    IssueCounter,
     IssueLink,
     IssueUserProperty,
     IssueReaction,
     IssueSubscriber,
     Project,
-    ProjectMember,
-    CycleIssue,
 )
+from plane.db.models.recent_visit import EntityNameEnum
+from plane.db.models.search import schedule_search_documents_update
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -62,6 +61,20 @@ from .. import BaseAPIView, BaseViewSet
 from plane.utils.user_timezone_converter import user_timezone_converter
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.utils.global_paginator import paginate
+from plane.utils.membership import get_member_roles
+from plane.utils.issue_changes import (
+    changes_page_size,
+    changes_settled_at,
+    decode_changes_cursor,
+    encode_changes_cursor,
+    get_issue_changes,
+    is_changes_cursor_expired,
+    latest_change_sequence,
+)
+from plane.utils.conditional_request import (
+    conditional_get,
+    project_issues_version,
+)
 from plane.bgtasks.webhook_task import model_activity
 
 
@@ -87,35 +100,13 @@ class IssueListEndpoint(BaseAPIView):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         ).distinct()
 
@@ -217,40 +208,19 @@ class IssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         ).distinct()
 
     @method_decorator(gzip_page)
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    @conditional_get(project_issues_version)
     def list(self, request, slug, project_id):
         extra_filters = {}
         if request.GET.get("updated_at__gt", None) is not None:
@@ -290,13 +260,7 @@ class IssueViewSet(BaseViewSet):
             user_id=request.user.id,
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
         ):
             issue_queryset = issue_queryset.filter(created_by=request.user)
@@ -495,29 +459,13 @@ class IssueViewSet(BaseViewSet):
                     default=None,
                 )
             )
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-                )
             .filter(pk=pk)
             .annotate(
                 label_ids=Coalesce(
@@ -593,13 +541,7 @@ class IssueViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
@@ -777,9 +719,18 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk__in=issue_ids
         )
 
-        total_issues = len(issues)
+        # Read before the delete, which clears the cached rows of issues
+        deleted_issues = list(issues)
+        total_issues = len(deleted_issues)
 
         issues.delete()
+        # Bulk deletes skip the signals counting the sub issues and logging
+        # the changes
+        IssueCounter.refresh([issue.parent_id for issue in deleted_issues])
+        IssueChange.record_issues(deleted_issues)
+        schedule_search_documents_update(
+            EntityNameEnum.ISSUE, [issue.id for issue in deleted_issues]
+        )
 
         return Response(
             {"message": f"{total_issues} issues were deleted"},
@@ -807,6 +758,36 @@ class DeletedIssuesListViewSet(BaseAPIView):
 
 
 class IssuePaginatedViewSet(BaseViewSet):
+    # Fields of the issues returned by the list and the changes feed
+    required_fields = [
+        "id",
+        "name",
+        "state_id",
+        "state__group",
+        "sort_order",
+        "completed_at",
+        "estimate_point",
+        "priority",
+        "start_date",
+        "target_date",
+        "sequence_id",
+        "project_id",
+        "parent_id",
+        "cycle_id",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "is_draft",
+        "archived_at",
+        "module_ids",
+        "label_ids",
+        "assignee_ids",
+        "link_count",
+        "attachment_count",
+        "sub_issues_count",
+    ]
+
     def get_queryset(self):
         workspace_slug = self.kwargs.get("slug")
         project_id = self.kwargs.get("project_id")
@@ -820,38 +801,55 @@ class IssuePaginatedViewSet(BaseViewSet):
                 "workspace", "project", "state", "parent"
             )
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         ).distinct()
 
+    def annotate_related_ids(self, queryset):
+        return queryset.annotate(
+            label_ids=Coalesce(
+                ArrayAgg(
+                    "labels__id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(labels__id__isnull=True)
+                        & Q(label_issue__deleted_at__isnull=True),
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+            assignee_ids=Coalesce(
+                ArrayAgg(
+                    "assignees__id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(assignees__id__isnull=True)
+                        & Q(assignees__member_project__is_active=True)
+                        & Q(issue_assignee__deleted_at__isnull=True)
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+            module_ids=Coalesce(
+                ArrayAgg(
+                    "issue_module__module_id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(issue_module__module_id__isnull=True)
+                        & Q(issue_module__module__archived_at__isnull=True)
+                        & Q(issue_module__deleted_at__isnull=True)
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+        )
+
     def process_paginated_result(self, fields, results, timezone):
         paginated_data = results.values(*fields)
 
@@ -864,40 +862,13 @@ class IssuePaginatedViewSet(BaseViewSet):
         return paginated_data
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    @conditional_get(project_issues_version)
     def list(self, request, slug, project_id):
         cursor = request.GET.get("cursor", None)
         is_description_required = request.GET.get("description", "false")
         updated_at = request.GET.get("updated_at__gt", None)
 
-        # required fields
-        required_fields = [
-            "id",
-            "name",
-            "state_id",
-            "state__group",
-            "sort_order",
-            "completed_at",
-            "estimate_point",
-            "priority",
-            "start_date",
-            "target_date",
-            "sequence_id",
-            "project_id",
-            "parent_id",
-            "cycle_id",
-            "created_at",
-            "updated_at",
-            "created_by",
-            "updated_by",
-            "is_draft",
-            "archived_at",
-            "module_ids",
-            "label_ids",
-            "assignee_ids",
-            "link_count",
-            "attachment_count",
-            "sub_issues_count",
-        ]
+        required_fields = list(self.required_fields)
 
         if str(is_description_required).lower() == "true":
             required_fields.append("description_html")
@@ -912,14 +883,10 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         # validation for guest user
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
-        project_member = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            role=5,
-            is_active=True,
-        )
-        if project_member.exists() and not project.guest_view_all_features:
+        if (
+            get_member_roles(request).is_project_guest(slug, project_id)
+            and not project.guest_view_all_features
+        ):
             base_queryset = base_queryset.filter(created_by=request.user)
             queryset = queryset.filter(created_by=request.user)
 
@@ -928,43 +895,7 @@ class IssuePaginatedViewSet(BaseViewSet):
             base_queryset = base_queryset.filter(updated_at__gt=updated_at)
             queryset = queryset.filter(updated_at__gt=updated_at)
 
-        queryset = queryset.annotate(
-            label_ids=Coalesce(
-                ArrayAgg(
-                    "labels__id",
-                    distinct=True,
-                    filter=Q(
-                        ~Q(labels__id__isnull=True)
-                        & Q(label_issue__deleted_at__isnull=True),
-                    ),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            assignee_ids=Coalesce(
-                ArrayAgg(
-                    "assignees__id",
-                    distinct=True,
-                    filter=Q(
-                        ~Q(assignees__id__isnull=True)
-                        & Q(assignees__member_project__is_active=True)
-                        & Q(issue_assignee__deleted_at__isnull=True)
-                    ),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            module_ids=Coalesce(
-                ArrayAgg(
-                    "issue_module__module_id",
-                    distinct=True,
-                    filter=Q(
-                        ~Q(issue_module__module_id__isnull=True)
-                        & Q(issue_module__module__archived_at__isnull=True)
-                        & Q(issue_module__deleted_at__isnull=True)
-                    ),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-        )
+        queryset = self.annotate_related_ids(queryset)
 
         paginated_data = paginate(
             base_queryset=base_queryset,
@@ -977,6 +908,90 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         return Response(paginated_data, status=status.HTTP_200_OK)
 
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def changes(self, request, slug, project_id):
+        is_description_required = request.GET.get("description", "false")
+        per_page = changes_page_size(request.GET.get("per_page"))
+        settled_at = changes_settled_at()
+
+        required_fields = list(self.required_fields)
+        if str(is_description_required).lower() == "true":
+            required_fields.append("description_html")
+
+        # Guests without access to every issue only see their own
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        scope = (
+            "own"
+            if get_member_roles(request).is_project_guest(slug, project_id)
+            and not project.guest_view_all_features
+            else "all"
+        )
+
+        # The client refetches the project before following the feed
+        # from the returned cursor
+        cursor = decode_changes_cursor(request.GET.get("cursor"))
+        if (
+            cursor is None
+            or cursor.scope != scope
+            or is_changes_cursor_expired(cursor)
+        ):
+            return Response(
+                {
+                    "cursor": encode_changes_cursor(
+                        latest_change_sequence(project_id, settled_at),
+                        settled_at,
+                        scope,
+                    ),
+                    "resync": True,
+                    "has_more": False,
+                    "issues": [],
+                    "deleted": [],
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        changes = get_issue_changes(
+            project_id, cursor.sequence, settled_at, per_page
+        )
+        issue_ids = [change["issue_id"] for change in changes]
+
+        queryset = self.get_queryset().filter(pk__in=issue_ids)
+        if scope == "own":
+            queryset = queryset.filter(created_by=request.user)
+        issues = list(
+            self.process_paginated_result(
+                required_fields,
+                self.annotate_related_ids(queryset),
+                request.user.user_timezone,
+            )
+        )
+
+        # Deleted, archived, moved or hidden issues are sent as tombstones
+        visible_ids = {issue["id"] for issue in issues}
+        has_more = len(changes) == per_page
+        return Response(
+            {
+                "cursor": encode_changes_cursor(
+                    (
+                        changes[-1]["last_sequence"]
+                        if changes
+                        else cursor.sequence
+                    ),
+                    cursor.synced_at if has_more else settled_at,
+                    scope,
+                ),
+                "resync": False,
+                "has_more": has_more,
+                "issues": issues,
+                "deleted": [
+                    issue_id
+                    for issue_id in issue_ids
+                    if issue_id not in visible_ids
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
 
 class IssueDetailEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
@@ -988,13 +1003,7 @@ class IssueDetailEndpoint(BaseAPIView):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
+            .annotate(cycle_id=F("counter__cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -1032,28 +1041,12 @@ class IssueDetailEndpoint(BaseAPIView):
                     Value([], output_field=ArrayField(UUIDField())),
                 ),
             )
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         )
         issue = issue.filter(**filters)
@@ -1158,10 +1151,13 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
                 issue.target_date = target_date
                 issues_to_update.append(issue)
 
-        # Bulk update issues
+        # Bulk updates skip the auto updated_at
+        for issue in issues_to_update:
+            issue.updated_at = timezone.now()
         Issue.objects.bulk_update(
-            issues_to_update, ["start_date", "target_date"]
+            issues_to_update, ["start_date", "target_date", "updated_at"]
         )
+        IssueChange.record_issues(issues_to_update)
 
         return Response(
             {"message": "Issues updated successfully"},
@@ -25,6 +25,7 @@ from plane.db.models import (
     Issue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.membership import get_member_roles
 
 
 class IssueCommentViewSet(BaseViewSet):
@@ -76,13 +77,7 @@ class IssueCommentViewSet(BaseViewSet):
         project = Project.objects.get(pk=project_id)
         issue = Issue.objects.get(pk=issue_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
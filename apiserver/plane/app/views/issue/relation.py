@@ -1,17 +1,14 @@
 # Python imports
 import json
+from collections import defaultdict
 
 # Django imports
 from django.utils import timezone
 from django.db.models import (
     Q,
-    OuterRef,
     F,
-    Func,
     UUIDField,
     Value,
-    CharField,
-    Subquery,
 )
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.functions import Coalesce
@@ -33,11 +30,14 @@ from plane.db.models import (
     Project,
     IssueRelation,
     Issue,
-    FileAsset,
-    IssueLink,
-    CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.issue_relation_graph import (
+    IssueRelationGraph,
+    RelationCycleError,
+    get_issue_relation_graph,
+    invalidate_issue_relation_graph,
+)
 from plane.utils.issue_relation_mapper import get_actual_relation
 
 
@@ -48,101 +48,18 @@ class IssueRelationViewSet(BaseViewSet):
         ProjectEntityPermission,
     ]
 
-    def list(self, request, slug, project_id, issue_id):
-        issue_relations = (
-            IssueRelation.objects.filter(
-                Q(issue_id=issue_id) | Q(related_issue=issue_id)
-            )
-            .filter(workspace__slug=self.kwargs.get("slug"))
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("issue")
-            .order_by("-created_at")
-            .distinct()
-        )
-        # get all blocking issues
-        blocking_issues = issue_relations.filter(
-            relation_type="blocked_by", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all blocked by issues
-        blocked_by_issues = issue_relations.filter(
-            relation_type="blocked_by", issue_id=issue_id
-        ).values_list("related_issue_id", flat=True)
-
-        # get all duplicate issues
-        duplicate_issues = issue_relations.filter(
-            issue_id=issue_id, relation_type="duplicate"
-        ).values_list("related_issue_id", flat=True)
-
-        # get all relates to issues
-        duplicate_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="duplicate"
-        ).values_list("issue_id", flat=True)
-
-        # get all relates to issues
-        relates_to_issues = issue_relations.filter(
-            issue_id=issue_id, relation_type="relates_to"
-        ).values_list("related_issue_id", flat=True)
-
-        # get all relates to issues
-        relates_to_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="relates_to"
-        ).values_list("issue_id", flat=True)
-
-        # get all start after issues
-        start_after_issues = issue_relations.filter(
-            relation_type="start_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all start_before issues
-        start_before_issues = issue_relations.filter(
-            relation_type="start_before", issue_id=issue_id
-        ).values_list("related_issue_id", flat=True)
-
-        # get all finish after issues
-        finish_after_issues = issue_relations.filter(
-            relation_type="finish_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all finish before issues
-        finish_before_issues = issue_relations.filter(
-            relation_type="finish_before", issue_id=issue_id
-        ).values_list("related_issue_id", flat=True)
-
-        queryset = (
-            Issue.issue_objects.filter(workspace__slug=slug)
+    def get_related_issues(self, slug, issue_ids):
+        return (
+            Issue.issue_objects.filter(workspace__slug=slug, pk__in=issue_ids)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .annotate(
                 label_ids=Coalesce(
@@ -169,104 +86,80 @@ class IssueRelationViewSet(BaseViewSet):
                     Value([], output_field=ArrayField(UUIDField())),
                 ),
             )
-        ).distinct()
+            .distinct()
+            .values(
+                "id",
+                "name",
+                "state_id",
+                "sort_order",
+                "priority",
+                "sequence_id",
+                "project_id",
+                "label_ids",
+                "assignee_ids",
+                "created_at",
+                "updated_at",
+                "created_by",
+                "updated_by",
+            )
+        )
+
+    def list(self, request, slug, project_id, issue_id):
+        # Every relation of the issue in a single query
+        related = IssueRelationGraph(
+            IssueRelation.objects.filter(
+                Q(issue_id=issue_id) | Q(related_issue=issue_id)
+            )
+            .filter(workspace__slug=self.kwargs.get("slug"))
+            .order_by()
+            .values_list("issue_id", "related_issue_id", "relation_type")
+        ).related(issue_id)
+
+        relation_names = defaultdict(list)
+        for name, issue_ids in related.items():
+            for related_issue_id in dict.fromkeys(issue_ids):
+                relation_names[related_issue_id].append(name)
+
+        response_data = {name: [] for name in related}
+        for issue in self.get_related_issues(slug, list(relation_names)):
+            for name in relation_names[str(issue["id"])]:
+                response_data[name].append({**issue, "relation_type": name})
 
-        # Fields
-        fields = [
-            "id",
-            "name",
-            "state_id",
-            "sort_order",
-            "priority",
-            "sequence_id",
-            "project_id",
-            "label_ids",
-            "assignee_ids",
-            "created_at",
-            "updated_at",
-            "created_by",
-            "updated_by",
-            "relation_type",
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    def blockers(self, request, slug, project_id, issue_id):
+        """Every issue the issue waits on, directly or through others"""
+        depths = get_issue_relation_graph(project_id).transitive_blockers(
+            issue_id
+        )
+        issues = [
+            {**issue, "depth": depths[str(issue["id"])]}
+            for issue in self.get_related_issues(slug, list(depths))
         ]
+        issues.sort(key=lambda issue: issue["depth"])
+        return Response(issues, status=status.HTTP_200_OK)
 
-        response_data = {
-            "blocking": queryset.filter(pk__in=blocking_issues)
-            .annotate(
-                relation_type=Value("blocking", output_field=CharField())
-            )
-            .values(*fields),
-            "blocked_by": queryset.filter(pk__in=blocked_by_issues)
-            .annotate(
-                relation_type=Value("blocked_by", output_field=CharField())
-            )
-            .values(*fields),
-            "duplicate": queryset.filter(pk__in=duplicate_issues)
-            .annotate(
-                relation_type=Value(
-                    "duplicate",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields)
-            | queryset.filter(pk__in=duplicate_issues_related)
-            .annotate(
-                relation_type=Value(
-                    "duplicate",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields),
-            "relates_to": queryset.filter(pk__in=relates_to_issues)
-            .annotate(
-                relation_type=Value(
-                    "relates_to",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields)
-            | queryset.filter(pk__in=relates_to_issues_related)
-            .annotate(
-                relation_type=Value(
-                    "relates_to",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields),
-            "start_after": queryset.filter(pk__in=start_after_issues)
-            .annotate(
-                relation_type=Value(
-                    "start_after",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields),
-            "start_before": queryset.filter(pk__in=start_before_issues)
-            .annotate(
-                relation_type=Value(
-                    "start_before",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields),
-            "finish_after": queryset.filter(pk__in=finish_after_issues)
-            .annotate(
-                relation_type=Value(
-                    "finish_after",
-                    output_field=CharField(),
-                )
-            )
-            .values(*fields),
-            "finish_before": queryset.filter(pk__in=finish_before_issues)
-            .annotate(
-                relation_type=Value(
-                    "finish_before",
-                    output_field=CharField(),
-                )
+    def critical_path(self, request, slug, project_id, issue_id):
+        """Longest chain of dependencies to go through before the issue"""
+        try:
+            path = get_issue_relation_graph(project_id).critical_path(issue_id)
+        except RelationCycleError as e:
+            return Response(
+                {
+                    "error": "Issue dependencies contain a cycle",
+                    "cycle": e.cycle,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            .values(*fields),
-        }
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        issues = {
+            str(issue["id"]): issue
+            for issue in self.get_related_issues(slug, path)
+        }
+        return Response(
+            [issues[pk] for pk in path if pk in issues],
+            status=status.HTTP_200_OK,
+        )
 
     def create(self, request, slug, project_id, issue_id):
         relation_type = request.data.get("relation_type", None)
@@ -305,6 +198,7 @@ class IssueRelationViewSet(BaseViewSet):
             batch_size=10,
             ignore_conflicts=True,
         )
+        invalidate_issue_relation_graph(project_id)
 
         issue_activity.delay(
             type="issue_relation.activity.created",
@@ -352,6 +246,7 @@ class IssueRelationViewSet(BaseViewSet):
             cls=DjangoJSONEncoder,
         )
         issue_relation.delete()
+        invalidate_issue_relation_graph(project_id)
         issue_activity.delay(
             type="issue_relation.activity.deleted",
             requested_data=json.dumps(request.data, cls=DjangoJSONEncoder),
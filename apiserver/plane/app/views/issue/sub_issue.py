@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.utils import timezone
-from django.db.models import OuterRef, Func, F, Q, Value, UUIDField, Subquery
+from django.db.models import F, Q, Value, UUIDField
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -20,9 +20,8 @@ from plane.app.serializers import IssueSerializer
 from plane.app.permissions import ProjectEntityPermission
 from plane.db.models import (
     Issue,
-    IssueLink,
-    FileAsset,
-    CycleIssue,
+    IssueChange,
+    IssueCounter,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.user_timezone_converter import user_timezone_converter
@@ -42,35 +41,13 @@ class SubIssuesEndpoint(BaseAPIView):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .annotate(
                 label_ids=Coalesce(
@@ -172,8 +149,20 @@ class SubIssuesEndpoint(BaseAPIView):
 
         for sub_issue in sub_issues:
             sub_issue.parent = parent_issue
+            sub_issue.updated_at = timezone.now()
 
-        _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+        _ = Issue.objects.bulk_update(
+            sub_issues, ["parent", "updated_at"], batch_size=10
+        )
+
+        # Bulk updates skip the signals counting the sub issues
+        IssueCounter.refresh(
+            [
+                issue_id,
+                *[sub_issue._loaded_parent_id for sub_issue in sub_issues],
+            ]
+        )
+        IssueChange.record_issues(sub_issues)
 
         updated_sub_issues = Issue.issue_objects.filter(
             id__in=sub_issue_ids
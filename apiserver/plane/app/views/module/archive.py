@@ -14,12 +14,9 @@ from django.db.models import (
     Value,
     Sum,
     FloatField,
-    Case,
-    When,
 )
-from django.db.models.functions import Coalesce, Cast, Concat
+from django.db.models.functions import Coalesce, Cast
 from django.utils import timezone
-from django.db import models
 
 # Third party imports
 from rest_framework import status
@@ -31,7 +28,11 @@ from plane.app.serializers import (
     ModuleDetailSerializer,
 )
 from plane.db.models import Issue, Module, ModuleLink, UserFavorite, Project
-from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_snapshot import (
+    get_progress_snapshot,
+    progress_stats,
+    snapshot_burndown,
+)
 from plane.utils.user_timezone_converter import user_timezone_converter
 
 
@@ -367,253 +368,31 @@ class ModuleArchiveUnarchiveEndpoint(BaseAPIView):
             data = ModuleDetailSerializer(queryset.first()).data
             modules = queryset.first()
 
-            data["estimate_distribution"] = {}
-
-            if estimate_type:
-                assignee_distribution = (
-                    Issue.issue_objects.filter(
-                        issue_module__module_id=pk,
-                        issue_module__deleted_at__isnull=True,
-                        workspace__slug=slug,
-                        project_id=project_id,
-                    )
-                    .annotate(first_name=F("assignees__first_name"))
-                    .annotate(last_name=F("assignees__last_name"))
-                    .annotate(assignee_id=F("assignees__id"))
-                    .annotate(display_name=F("assignees__display_name"))
-                    .annotate(
-                        avatar_url=Case(
-                            # If `avatar_asset` exists, use it to generate the asset URL
-                            When(
-                                assignees__avatar_asset__isnull=False,
-                                then=Concat(
-                                    Value("/api/assets/v2/static/"),
-                                    "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                    Value("/"),
-                                ),
-                            ),
-                            # If `avatar_asset` is None, fall back to using `avatar` field directly
-                            When(
-                                assignees__avatar_asset__isnull=True,
-                                then="assignees__avatar",
-                            ),
-                            default=Value(None),
-                            output_field=models.CharField(),
-                        )
-                    )
-                    .values(
-                        "first_name",
-                        "last_name",
-                        "assignee_id",
-                        "avatar_url",
-                        "display_name",
-                    )
-                    .annotate(
-                        total_estimates=Sum(
-                            Cast("estimate_point__value", FloatField())
-                        ),
-                    )
-                    .annotate(
-                        completed_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=False,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .annotate(
-                        pending_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=True,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .order_by("first_name", "last_name")
-                )
-
-                label_distribution = (
-                    Issue.issue_objects.filter(
-                        issue_module__module_id=pk,
-                        workspace__slug=slug,
-                        project_id=project_id,
-                    )
-                    .annotate(label_name=F("labels__name"))
-                    .annotate(color=F("labels__color"))
-                    .annotate(label_id=F("labels__id"))
-                    .values("label_name", "color", "label_id")
-                    .annotate(
-                        total_estimates=Sum(
-                            Cast("estimate_point__value", FloatField())
-                        ),
-                    )
-                    .annotate(
-                        completed_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=False,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .annotate(
-                        pending_estimates=Sum(
-                            Cast("estimate_point__value", FloatField()),
-                            filter=Q(
-                                completed_at__isnull=True,
-                                archived_at__isnull=True,
-                                is_draft=False,
-                            ),
-                        )
-                    )
-                    .order_by("label_name")
-                )
-                data["estimate_distribution"][
-                    "assignees"
-                ] = assignee_distribution
-                data["estimate_distribution"]["labels"] = label_distribution
-
-                if modules and modules.start_date and modules.target_date:
-                    data["estimate_distribution"]["completion_chart"] = (
-                        burndown_plot(
-                            queryset=modules,
-                            slug=slug,
-                            project_id=project_id,
-                            plot_type="points",
-                            module_id=pk,
-                        )
-                    )
-
-            assignee_distribution = (
-                Issue.issue_objects.filter(
-                    issue_module__module_id=pk,
-                    issue_module__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(first_name=F("assignees__first_name"))
-                .annotate(last_name=F("assignees__last_name"))
-                .annotate(assignee_id=F("assignees__id"))
-                .annotate(display_name=F("assignees__display_name"))
-                .annotate(
-                    avatar_url=Case(
-                        # If `avatar_asset` exists, use it to generate the asset URL
-                        When(
-                            assignees__avatar_asset__isnull=False,
-                            then=Concat(
-                                Value("/api/assets/v2/static/"),
-                                "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                Value("/"),
-                            ),
-                        ),
-                        # If `avatar_asset` is None, fall back to using `avatar` field directly
-                        When(
-                            assignees__avatar_asset__isnull=True,
-                            then="assignees__avatar",
-                        ),
-                        default=Value(None),
-                        output_field=models.CharField(),
-                    )
-                )
-                .values(
-                    "first_name",
-                    "last_name",
-                    "assignee_id",
-                    "avatar_url",
-                    "display_name",
-                )
-                .annotate(
-                    total_issues=Count(
-                        "id",
-                        filter=Q(
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    ),
-                )
-                .annotate(
-                    completed_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("first_name", "last_name")
+            # Read the precomputed progress of the module
+            stats = progress_stats(
+                get_progress_snapshot(module_id=pk), estimates=estimate_type
             )
+            data["estimate_distribution"] = stats["estimate_distribution"]
 
-            label_distribution = (
-                Issue.issue_objects.filter(
-                    issue_module__module_id=pk,
-                    issue_module__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(label_name=F("labels__name"))
-                .annotate(color=F("labels__color"))
-                .annotate(label_id=F("labels__id"))
-                .values("label_name", "color", "label_id")
-                .annotate(
-                    total_issues=Count(
-                        "id",
-                        filter=Q(
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    ),
-                )
-                .annotate(
-                    completed_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
+            if (
+                estimate_type
+                and modules
+                and modules.start_date
+                and modules.target_date
+            ):
+                data["estimate_distribution"]["completion_chart"] = (
+                    snapshot_burndown(
+                        modules, plot_type="points", module_id=pk
                     )
                 )
-                .annotate(
-                    pending_issues=Count(
-                        "id",
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("label_name")
-            )
 
             data["distribution"] = {
-                "assignees": assignee_distribution,
-                "labels": label_distribution,
+                **stats["distribution"],
                 "completion_chart": {},
             }
             if modules and modules.start_date and modules.target_date:
-                data["distribution"]["completion_chart"] = burndown_plot(
-                    queryset=modules,
-                    slug=slug,
-                    project_id=project_id,
-                    plot_type="issues",
-                    module_id=pk,
+                data["distribution"]["completion_chart"] = snapshot_burndown(
+                    modules, plot_type="issues", module_id=pk
                 )
 
             return Response(
@@ -1,6 +1,7 @@
 # Django imports
 from django.db.models import Exists, OuterRef, Q, Case, When, BooleanField
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 # Third party imports
 from rest_framework import status
@@ -15,9 +16,21 @@ from plane.db.models import (
     IssueAssignee,
     IssueSubscriber,
     Notification,
+    NotificationCategory,
     UserNotificationPreference,
     WorkspaceMember,
 )
+from plane.utils.notification_counter import (
+    get_unread_counts,
+    is_unread_notification,
+    sync_unread_counts,
+)
+from plane.utils.notification_state import (
+    NOTIFICATION_TRANSITIONS,
+    NOTIFICATION_TYPES,
+    filter_notifications,
+    transition_notifications,
+)
 from plane.utils.paginator import BasePaginator
 from plane.app.permissions import allow_permission, ROLE
 
@@ -68,7 +81,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
             .annotate(is_intake_issue=Exists(intake_issue))
             .annotate(
                 is_mentioned_notification=Case(
-                    When(sender__icontains="mentioned", then=True),
+                    When(category=NotificationCategory.MENTIONED, then=True),
                     default=False,
                     output_field=BooleanField(),
                 )
@@ -101,10 +114,12 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
             notifications = notifications.filter(read_at__isnull=False)
 
         if mentioned:
-            notifications = notifications.filter(sender__icontains="mentioned")
+            notifications = notifications.filter(
+                category=NotificationCategory.MENTIONED
+            )
         else:
             notifications = notifications.exclude(
-                sender__icontains="mentioned"
+                category=NotificationCategory.MENTIONED
             )
 
         type = type.split(",")
@@ -182,6 +197,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             workspace__slug=slug, pk=pk, receiver=request.user
         )
+        was_unread = is_unread_notification(notification)
         # Only read_at and snoozed_till can be updated
         notification_data = {
             "snoozed_till": request.data.get("snoozed_till", None),
@@ -192,6 +208,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
 
         if serializer.is_valid():
             serializer.save()
+            sync_unread_counts(slug, notification, was_unread)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -202,8 +219,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_unread = is_unread_notification(notification)
         notification.read_at = timezone.now()
         notification.save()
+        sync_unread_counts(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -214,8 +233,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_unread = is_unread_notification(notification)
         notification.read_at = None
         notification.save()
+        sync_unread_counts(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -226,8 +247,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_unread = is_unread_notification(notification)
         notification.archived_at = timezone.now()
         notification.save()
+        sync_unread_counts(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -238,8 +261,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_unread = is_unread_notification(notification)
         notification.archived_at = None
         notification.save()
+        sync_unread_counts(slug, notification, was_unread)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -250,36 +275,13 @@ class UnreadNotificationEndpoint(BaseAPIView):
         level="WORKSPACE",
     )
     def get(self, request, slug):
-        # Watching Issues Count
-        unread_notifications_count = (
-            Notification.objects.filter(
-                workspace__slug=slug,
-                receiver_id=request.user.id,
-                read_at__isnull=True,
-                archived_at__isnull=True,
-                snoozed_till__isnull=True,
-            )
-            .exclude(sender__icontains="mentioned")
-            .count()
-        )
-
-        mention_notifications_count = Notification.objects.filter(
-            workspace__slug=slug,
-            receiver_id=request.user.id,
-            read_at__isnull=True,
-            archived_at__isnull=True,
-            snoozed_till__isnull=True,
-            sender__icontains="mentioned",
-        ).count()
+        # Counters are kept in redis and only counted on a miss
+        counts = get_unread_counts(slug, request.user.id)
 
         return Response(
             {
-                "total_unread_notifications_count": int(
-                    unread_notifications_count
-                ),
-                "mention_unread_notifications_count": int(
-                    mention_notifications_count
-                ),
+                "total_unread_notifications_count": counts["unread"],
+                "mention_unread_notifications_count": counts["mention"],
             },
             status=status.HTTP_200_OK,
         )
@@ -290,81 +292,67 @@ class MarkAllReadNotificationViewSet(BaseViewSet):
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE"
     )
     def create(self, request, slug):
-        snoozed = request.data.get("snoozed", False)
-        archived = request.data.get("archived", False)
-        type = request.data.get("type", "all")
-
-        notifications = (
-            Notification.objects.filter(
-                workspace__slug=slug,
-                receiver_id=request.user.id,
-                read_at__isnull=True,
-            )
-            .select_related("workspace", "project", "triggered_by", "receiver")
-            .order_by("snoozed_till", "-created_at")
+        notifications = filter_notifications(
+            slug,
+            request.user,
+            snoozed=request.data.get("snoozed", False),
+            archived=request.data.get("archived", False),
+            type=request.data.get("type", "all"),
+        )
+        count = transition_notifications(slug, notifications, "read")
+        return Response(
+            {"message": "Successful", "count": count},
+            status=status.HTTP_200_OK,
         )
 
-        # Filter for snoozed notifications
-        if snoozed:
-            notifications = notifications.filter(
-                Q(snoozed_till__lt=timezone.now())
-                | Q(snoozed_till__isnull=False)
-            )
-        else:
-            notifications = notifications.filter(
-                Q(snoozed_till__gte=timezone.now())
-                | Q(snoozed_till__isnull=True),
-            )
-
-        # Filter for archived or unarchive
-        if archived:
-            notifications = notifications.filter(archived_at__isnull=False)
-        else:
-            notifications = notifications.filter(archived_at__isnull=True)
 
-        # Subscribed issues
-        if type == "watching":
-            issue_ids = IssueSubscriber.objects.filter(
-                workspace__slug=slug, subscriber_id=request.user.id
-            ).values_list("issue_id", flat=True)
-            notifications = notifications.filter(
-                entity_identifier__in=issue_ids
+class NotificationStateEndpoint(BaseAPIView):
+    @allow_permission(
+        allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE"
+    )
+    def post(self, request, slug):
+        action = request.data.get("action")
+        type = request.data.get("type", "all")
+        if action not in NOTIFICATION_TRANSITIONS:
+            return Response(
+                {
+                    "error": "action must be one of "
+                    + ", ".join(NOTIFICATION_TRANSITIONS)
+                },
+                status=status.HTTP_400_BAD_REQUEST,
             )
-
-        # Assigned Issues
-        if type == "assigned":
-            issue_ids = IssueAssignee.objects.filter(
-                workspace__slug=slug, assignee_id=request.user.id
-            ).values_list("issue_id", flat=True)
-            notifications = notifications.filter(
-                entity_identifier__in=issue_ids
+        if type not in NOTIFICATION_TYPES:
+            return Response(
+                {
+                    "error": "type must be one of "
+                    + ", ".join(NOTIFICATION_TYPES)
+                },
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Created issues
-        if type == "created":
-            if WorkspaceMember.objects.filter(
-                workspace__slug=slug,
-                member=request.user,
-                role__lt=15,
-                is_active=True,
-            ).exists():
-                notifications = Notification.objects.none()
-            else:
-                issue_ids = Issue.objects.filter(
-                    workspace__slug=slug, created_by=request.user
-                ).values_list("pk", flat=True)
-                notifications = notifications.filter(
-                    entity_identifier__in=issue_ids
+        snoozed_till = None
+        if action == "snooze":
+            snoozed_till = parse_datetime(
+                str(request.data.get("snoozed_till", ""))
+            )
+            if snoozed_till is None:
+                return Response(
+                    {"error": "snoozed_till is required to snooze"},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
 
-        updated_notifications = []
-        for notification in notifications:
-            notification.read_at = timezone.now()
-            updated_notifications.append(notification)
-        Notification.objects.bulk_update(
-            updated_notifications, ["read_at"], batch_size=100
+        notifications = filter_notifications(
+            slug,
+            request.user,
+            snoozed=request.data.get("snoozed", False),
+            archived=request.data.get("archived", False),
+            type=type,
+            ids=request.data.get("notification_ids"),
+        )
+        count = transition_notifications(
+            slug, notifications, action, snoozed_till=snoozed_till
         )
-        return Response({"message": "Successful"}, status=status.HTTP_200_OK)
+        return Response({"count": count}, status=status.HTTP_200_OK)
 
 
 class UserNotificationPreferenceEndpoint(BaseAPIView):
@@ -35,6 +35,11 @@ from plane.db.models import (
     Project,
 )
 from plane.utils.error_codes import ERROR_CODES
+from plane.utils.membership import get_member_roles
+from plane.utils.conditional_request import (
+    conditional_get,
+    project_pages_version,
+)
 from ..base import BaseAPIView, BaseViewSet
 from plane.bgtasks.page_transaction_task import page_transaction
 from plane.bgtasks.page_version_task import page_version
@@ -224,13 +229,7 @@ class PageViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
             and not page.owned_by == request.user
         ):
@@ -313,17 +312,12 @@ class PageViewSet(BaseViewSet):
             ROLE.GUEST,
         ]
     )
+    @conditional_get(project_pages_version)
     def list(self, request, slug, project_id):
         queryset = self.get_queryset()
         project = Project.objects.get(pk=project_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
         ):
             queryset = queryset.filter(owned_by=request.user)
@@ -407,14 +401,10 @@ class PageViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if page.owned_by_id != request.user.id and (
-            not ProjectMember.objects.filter(
-                workspace__slug=slug,
-                member=request.user,
-                role=20,
-                project_id=project_id,
-                is_active=True,
-            ).exists()
+        if (
+            page.owned_by_id != request.user.id
+            and get_member_roles(request).project_role(slug, project_id)
+            != ROLE.ADMIN.value
         ):
             return Response(
                 {"error": "Only admin or owner can delete the page"},
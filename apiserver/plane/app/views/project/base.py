@@ -54,6 +54,7 @@ from plane.utils.cache import cache_response
 from plane.bgtasks.webhook_task import model_activity
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.utils.exception_logger import log_exception
+from plane.utils.membership import get_member_roles
 
 
 class ProjectViewSet(BaseViewSet):
@@ -159,23 +160,14 @@ class ProjectViewSet(BaseViewSet):
             if field
         ]
         projects = self.get_queryset().order_by("sort_order", "name")
-        if WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=slug,
-            is_active=True,
-            role=5,
-        ).exists():
+        workspace_role = get_member_roles(request).workspace_role(slug)
+        if workspace_role == ROLE.GUEST.value:
             projects = projects.filter(
                 project_projectmember__member=self.request.user,
                 project_projectmember__is_active=True,
             )
 
-        if WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=slug,
-            is_active=True,
-            role=15,
-        ).exists():
+        if workspace_role == ROLE.MEMBER.value:
             projects = projects.filter(
                 Q(
                     project_projectmember__member=self.request.user,
@@ -27,6 +27,7 @@ from plane.db.models import (
     WorkspaceMember,
     IssueUserProperty,
 )
+from plane.utils.membership import invalidate_member_roles
 
 
 class ProjectInvitationsViewset(BaseViewSet):
@@ -172,6 +173,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_member_roles([request.user.id])
 
         IssueUserProperty.objects.bulk_create(
             [
@@ -27,6 +27,7 @@ from plane.db.models import (
 )
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_member_roles
 from plane.app.permissions.base import allow_permission, ROLE
 
 
@@ -182,6 +183,9 @@ class ProjectMemberViewSet(BaseViewSet):
         _ = IssueUserProperty.objects.bulk_create(
             bulk_issue_props, batch_size=10, ignore_conflicts=True
         )
+        invalidate_member_roles(
+            [member.get("member_id") for member in members]
+        )
 
         project_members = ProjectMember.objects.filter(
             project_id=project_id,
@@ -383,6 +387,7 @@ class AddTeamToProjectEndpoint(BaseAPIView):
         ProjectMember.objects.bulk_create(
             project_members, batch_size=10, ignore_conflicts=True
         )
+        invalidate_member_roles(team_members)
 
         _ = IssueUserProperty.objects.bulk_create(
             issue_props, batch_size=10, ignore_conflicts=True
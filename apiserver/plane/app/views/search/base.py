@@ -2,10 +2,9 @@
 import re
 
 # Django imports
-from django.db.models import Q, OuterRef, Subquery, Value, UUIDField, CharField
-from django.contrib.postgres.aggregates import ArrayAgg
-from django.contrib.postgres.fields import ArrayField
-from django.db.models.functions import Coalesce
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import Case, F, IntegerField, Q, Value, When, Window
+from django.db.models.functions import RowNumber
 
 # Third party imports
 from rest_framework import status
@@ -16,13 +15,19 @@ from plane.app.views.base import BaseAPIView
 from plane.db.models import (
     Workspace,
     Project,
-    Issue,
-    Cycle,
-    Module,
-    Page,
-    IssueView,
-    ProjectPage,
+    SearchDocument,
 )
+from plane.db.models.recent_visit import EntityNameEnum
+from plane.utils.issue_search import search_documents
+
+# Result key of every indexed entity
+SEARCH_RESULT_KEYS = {
+    EntityNameEnum.ISSUE: "issue",
+    EntityNameEnum.CYCLE: "cycle",
+    EntityNameEnum.MODULE: "module",
+    EntityNameEnum.VIEW: "issue_view",
+    EntityNameEnum.PAGE: "page",
+}
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -60,166 +65,78 @@ class GlobalSearchEndpoint(BaseAPIView):
             .values("name", "id", "identifier", "workspace__slug")
         )
 
-    def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-
-        issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
+    def filter_documents(self, query, slug, project_id, workspace_search):
+        """
+        Search issues, cycles, modules, pages and views with a single ranked
+        query over the search index, keeping the top 100 of every type
+        """
+        projects = Project.objects.filter(
+            project_projectmember__member=self.request.user,
+            project_projectmember__is_active=True,
+            archived_at__isnull=True,
             workspace__slug=slug,
         )
-
         if workspace_search == "false" and project_id:
-            issues = issues.filter(project_id=project_id)
-
-        return issues.distinct().values(
-            "name",
-            "id",
-            "sequence_id",
-            "project__identifier",
-            "project_id",
-            "workspace__slug",
-        )[:100]
-
-    def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        cycles = Cycle.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
-        )
-
-        if workspace_search == "false" and project_id:
-            cycles = cycles.filter(project_id=project_id)
-
-        return cycles.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
-        )
-
-    def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+            projects = projects.filter(pk=project_id)
+
+        # Match whole integers only (exclude decimal numbers)
+        sequences = [
+            int(sequence) for sequence in re.findall(r"\b\d+\b", query)
+        ]
+        sequence_match = (
+            Q(
+                entity_name=EntityNameEnum.ISSUE,
+                metadata__sequence_id__in=sequences,
+            )
+            if sequences
+            else None
         )
 
-        if workspace_search == "false" and project_id:
-            modules = modules.filter(project_id=project_id)
-
-        return modules.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+        documents = search_documents(
+            query,
+            SearchDocument.objects.filter(
+                workspace__slug=slug,
+                project_ids__overlap=ArraySubquery(projects.values("id")),
+            ),
+            condition=sequence_match,
         )
 
-    def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        pages = (
-            Page.objects.filter(
-                q,
-                projects__project_projectmember__member=self.request.user,
-                projects__project_projectmember__is_active=True,
-                projects__archived_at__isnull=True,
-                workspace__slug=slug,
+        ordering = [F("rank").desc()]
+        if sequence_match is not None:
+            # Exact sequence matches always come first
+            documents = documents.annotate(
+                sequence_match=Case(
+                    When(sequence_match, then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
             )
-            .annotate(
-                project_ids=Coalesce(
-                    ArrayAgg(
-                        "projects__id",
-                        distinct=True,
-                        filter=~Q(projects__id=True),
-                    ),
-                    Value([], output_field=ArrayField(UUIDField())),
-                ),
+            ordering.insert(0, F("sequence_match").desc())
+
+        documents = (
+            documents.annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=[F("entity_name")],
+                    order_by=ordering,
+                )
             )
-            .annotate(
-                project_identifiers=Coalesce(
-                    ArrayAgg(
-                        "projects__identifier",
-                        distinct=True,
-                        filter=~Q(projects__id=True),
-                    ),
-                    Value([], output_field=ArrayField(CharField())),
-                ),
-            )
-        )
-
-        if workspace_search == "false" and project_id:
-            project_subquery = ProjectPage.objects.filter(
-                page_id=OuterRef("id"),
-                project_id=project_id,
-            ).values_list("project_id", flat=True)[:1]
-
-            pages = pages.annotate(
-                project_id=Subquery(project_subquery)
-            ).filter(project_id=project_id)
-
-        return pages.distinct().values(
-            "name",
-            "id",
-            "project_ids",
-            "project_identifiers",
-            "workspace__slug",
-        )
-
-    def filter_views(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        issue_views = IssueView.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+            .filter(row_number__lte=100)
+            .order_by("entity_name", "row_number")
+            .values("entity_name", "entity_identifier", "name", "metadata")
         )
 
-        if workspace_search == "false" and project_id:
-            issue_views = issue_views.filter(project_id=project_id)
-
-        return issue_views.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
-        )
+        results = {key: [] for key in SEARCH_RESULT_KEYS.values()}
+        for document in documents:
+            results[SEARCH_RESULT_KEYS[document["entity_name"]]].append(
+                {
+                    "name": document["name"],
+                    "id": document["entity_identifier"],
+                    **document["metadata"],
+                    "workspace__slug": slug,
+                }
+            )
+        return results
 
     def get(self, request, slug):
         query = request.query_params.get("search", False)
@@ -247,11 +164,6 @@ class GlobalSearchEndpoint(BaseAPIView):
         MODELS_MAPPER = {
             "workspace": self.filter_workspaces,
             "project": self.filter_projects,
-            "issue": self.filter_issues,
-            "cycle": self.filter_cycles,
-            "module": self.filter_modules,
-            "issue_view": self.filter_views,
-            "page": self.filter_pages,
         }
 
         results = {}
@@ -259,4 +171,8 @@ class GlobalSearchEndpoint(BaseAPIView):
         for model in MODELS_MAPPER.keys():
             func = MODELS_MAPPER.get(model, None)
             results[model] = func(query, slug, project_id, workspace_search)
+
+        results.update(
+            self.filter_documents(query, slug, project_id, workspace_search)
+        )
         return Response({"results": results}, status=status.HTTP_200_OK)
@@ -9,8 +9,9 @@ from rest_framework.response import Response
 
 # Module imports
 from .base import BaseAPIView
-from plane.db.models import Issue, ProjectMember
+from plane.db.models import Issue
 from plane.utils.issue_search import search_issues
+from plane.utils.membership import get_member_roles
 
 
 class IssueSearchEndpoint(BaseAPIView):
@@ -85,12 +86,7 @@ class IssueSearchEndpoint(BaseAPIView):
         if target_date == "none":
             issues = issues.filter(target_date__isnull=True)
 
-        if ProjectMember.objects.filter(
-            project_id=project_id,
-            member=self.request.user,
-            is_active=True,
-            role=5,
-        ).exists():
+        if get_member_roles(request).is_project_guest(slug, project_id):
             issues = issues.filter(created_by=self.request.user)
 
         return Response(
@@ -4,12 +4,10 @@ from django.contrib.postgres.fields import ArrayField
 from django.db.models import (
     Exists,
     F,
-    Func,
     OuterRef,
     Q,
     UUIDField,
     Value,
-    Subquery,
 )
 from django.db.models.functions import Coalesce
 from django.utils.decorators import method_decorator
@@ -30,14 +28,10 @@ from plane.app.serializers import (
 )
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     IssueView,
     Workspace,
     WorkspaceMember,
-    ProjectMember,
     Project,
-    CycleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -50,6 +44,7 @@ from plane.utils.paginator import (
     GroupedOffsetPaginator,
     SubGroupedOffsetPaginator,
 )
+from plane.utils.membership import get_member_roles
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from .. import BaseViewSet
 from plane.db.models import (
@@ -88,12 +83,7 @@ class WorkspaceViewViewSet(BaseViewSet):
             for field in request.GET.get("fields", "").split(",")
             if field
         ]
-        if WorkspaceMember.objects.filter(
-            workspace__slug=slug,
-            member=request.user,
-            role=5,
-            is_active=True,
-        ).exists():
+        if get_member_roles(request).workspace_role(slug) == ROLE.GUEST.value:
             queryset = queryset.filter(owned_by=request.user)
         views = IssueViewSerializer(
             queryset, many=True, fields=fields if fields else None
@@ -193,12 +183,7 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
     def get_queryset(self):
         return (
             Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(
@@ -207,35 +192,13 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
             .annotate(
                 label_ids=Coalesce(
@@ -288,13 +251,7 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
         issue_queryset = (
             self.get_queryset()
             .filter(**filters)
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
+            .annotate(cycle_id=F("counter__cycle_id"))
         )
 
         # check for the project member role, if the role is 5 then check for the guest_view_all_features if it is true then show all the issues else show only the issues created by the user
@@ -460,13 +417,7 @@ class IssueViewViewSet(BaseViewSet):
         queryset = self.get_queryset()
         project = Project.objects.get(id=project_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
         ):
             queryset = queryset.filter(owned_by=request.user)
@@ -492,13 +443,7 @@ class IssueViewViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).is_project_guest(slug, project_id)
             and not project.guest_view_all_features
             and not issue_view.owned_by == request.user
         ):
@@ -563,13 +508,8 @@ class IssueViewViewSet(BaseViewSet):
             workspace__slug=slug,
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=20,
-                is_active=True,
-            ).exists()
+            get_member_roles(request).project_role(slug, project_id)
+            == ROLE.ADMIN.value
             or project_view.owned_by_id == request.user.id
         ):
             project_view.delete()
@@ -175,7 +175,10 @@ class WorkSpaceViewSet(BaseViewSet):
         path="/api/users/me/workspaces/", multiple=True, user=False
     )
     @invalidate_cache(
-        path="/api/users/me/settings/", multiple=True, user=False
+        path="/api/users/me/settings/",
+        multiple=True,
+        user=False,
+        tags=["workspace:{slug}"],
     )
     @allow_permission([ROLE.ADMIN], level="WORKSPACE")
     def destroy(self, request, *args, **kwargs):
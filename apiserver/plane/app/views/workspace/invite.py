@@ -31,6 +31,7 @@ from plane.db.models import (
     WorkspaceMemberInvite,
 )
 from plane.utils.cache import invalidate_cache, invalidate_cache_directly
+from plane.utils.membership import invalidate_member_roles
 
 from .. import BaseViewSet
 
@@ -307,6 +308,7 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_member_roles([request.user.id])
 
         # Delete joined workspace invites
         workspace_invitations.delete()
@@ -210,7 +210,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
     )
     @invalidate_cache(path="/api/users/me/settings/")
     @invalidate_cache(
-        path="api/users/me/workspaces/", user=False, multiple=True
+        path="/api/users/me/workspaces/", user=False, multiple=True
     )
     @allow_permission(
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE"
@@ -1,50 +1,220 @@
+# Python imports
+import logging
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
 from django.db import models
-from django.core.exceptions import ObjectDoesNotExist
 
 # Third party imports
 from celery import shared_task
 
 
-@shared_task
+# Models whose bulk updates must clear the cached member roles
+MEMBER_MODELS = ("db.ProjectMember", "db.WorkspaceMember")
+
+# Models whose bulk updates must recount the issue counters
+ISSUE_COUNTER_MODELS = ("db.CycleIssue", "db.IssueLink", "db.FileAsset")
+
+
+@lru_cache(maxsize=None)
+def get_cascade_relations(model):
+    """
+    Return the (related model, foreign key name) of every reverse relation
+    of the model which is deleted along with it and can be soft deleted
+    """
+    return tuple(
+        (field.related_model, field.field.name)
+        for field in model._meta.get_fields()
+        if (field.one_to_many or field.one_to_one)
+        and field.auto_created
+        and not field.concrete
+        and field.on_delete == models.CASCADE
+        and hasattr(field.related_model, "deleted_at")
+    )
+
+
+def invalidate_cascaded_members(model, pks):
+    # Module imports
+    from plane.utils.membership import invalidate_member_roles
+
+    # Bulk updates do not send the signals clearing the cached roles
+    if model._meta.label in MEMBER_MODELS:
+        invalidate_member_roles(
+            model.all_objects.filter(pk__in=pks).values_list(
+                "member_id", flat=True
+            )
+        )
+
+
+def refresh_cascaded_issue_counters(model, pks):
+    # Module imports
+    from plane.db.models import IssueCounter
+
+    # Bulk updates do not send the signals recounting the issues
+    if model._meta.label in ISSUE_COUNTER_MODELS:
+        IssueCounter.refresh(
+            model.all_objects.filter(pk__in=pks).values_list(
+                "issue_id", flat=True
+            )
+        )
+
+
+def deleted_at_values(model, value):
+    """The deleted_at update, moving updated_at as a save of the row does"""
+    values = {"deleted_at": value}
+    if any(field.name == "updated_at" for field in model._meta.fields):
+        values["updated_at"] = timezone.now()
+    return values
+
+
+def record_cascaded_issue_changes(model, pks, using=None):
+    # Module imports
+    from plane.db.models import Issue, IssueChange
+    from plane.db.models.recent_visit import EntityNameEnum
+    from plane.db.models.search import schedule_search_documents_update
+
+    # Bulk updates do not send the signals logging the issue changes and
+    # refreshing their search documents
+    if model is Issue:
+        IssueChange.record(
+            Issue.all_objects.using(using)
+            .filter(pk__in=pks)
+            .values_list("project_id", "workspace_id", "id")
+        )
+        schedule_search_documents_update(EntityNameEnum.ISSUE, pks)
+
+
+def cascade_deleted_at(
+    model, pks, current, value, counts, progress=None, using=None
+):
+    """
+    Set deleted_at to value on every row related to the given rows of the
+    model whose deleted_at is current, one UPDATE per relation and chunk,
+    and recurse into the updated rows. The updated row counts per model
+    are accumulated in counts and passed to progress after every UPDATE
+    """
+    chunk_size = settings.SOFT_DELETE_CHUNK_SIZE
+    for related_model, field_name in get_cascade_relations(model):
+        queryset = related_model.all_objects.using(using).filter(
+            **{f"{field_name}__in": pks}
+        )
+        queryset = (
+            queryset.filter(deleted_at__isnull=True)
+            if current is None
+            else queryset.filter(deleted_at=current)
+        )
+
+        label = related_model._meta.label
+
+        # Leaves of the graph are updated in a single statement
+        if (
+            not get_cascade_relations(related_model)
+            and label not in MEMBER_MODELS
+            and label not in ISSUE_COUNTER_MODELS
+        ):
+            counts[label] = counts.get(label, 0) + queryset.update(
+                **deleted_at_values(related_model, value)
+            )
+            if progress:
+                progress(counts)
+            continue
+
+        while True:
+            # Updated rows leave the filter, every pass takes the next chunk
+            chunk = list(
+                queryset.order_by().values_list("pk", flat=True)[:chunk_size]
+            )
+            if not chunk:
+                break
+
+            updated = (
+                related_model.all_objects.using(using)
+                .filter(pk__in=chunk)
+                .update(**deleted_at_values(related_model, value))
+            )
+            counts[label] = counts.get(label, 0) + updated
+            if progress:
+                progress(counts)
+
+            invalidate_cascaded_members(related_model, chunk)
+            refresh_cascaded_issue_counters(related_model, chunk)
+            record_cascaded_issue_changes(related_model, chunk, using=using)
+            cascade_deleted_at(
+                related_model,
+                chunk,
+                current,
+                value,
+                counts,
+                progress=progress,
+                using=using,
+            )
+
+
+def task_progress(task):
+    def progress(counts):
+        if task.request.id:
+            task.update_state(state="PROGRESS", meta={"updated": counts})
+
+    return progress
+
+
+def report_cascade(action, instance, counts):
+    logging.getLogger("plane").info(
+        f"{action} {sum(counts.values())} objects related to "
+        f"{instance._meta.label} {instance.pk}: {counts}"
+    )
+
+
+@shared_task(bind=True)
 def soft_delete_related_objects(
-    app_label, model_name, instance_pk, using=None
+    self, app_label, model_name, instance_pk, using=None
+):
+    model_class = apps.get_model(app_label, model_name)
+    instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    if instance.deleted_at is None:
+        return
+
+    # The related objects share the deletion time of the instance so that
+    # the restore only brings back what was deleted along with it
+    counts = {}
+    cascade_deleted_at(
+        model_class,
+        [instance.pk],
+        None,
+        instance.deleted_at,
+        counts,
+        progress=task_progress(self),
+        using=using,
+    )
+    report_cascade("Soft deleted", instance, counts)
+
+
+@shared_task(bind=True)
+def restore_related_objects(
+    self, app_label, model_name, instance_pk, using=None
 ):
     model_class = apps.get_model(app_label, model_name)
-    instance = model_class.all_objects.get(pk=instance_pk)
-    related_fields = instance._meta.get_fields()
-    for field in related_fields:
-        if field.one_to_many or field.one_to_one:
-            try:
-                # Check if the field has CASCADE on delete
-                if (
-                    not hasattr(field.remote_field, "on_delete")
-                    or field.remote_field.on_delete == models.CASCADE
-                ):
-                    if field.one_to_many:
-                        related_objects = getattr(instance, field.name).all()
-                    elif field.one_to_one:
-                        related_object = getattr(instance, field.name)
-                        related_objects = (
-                            [related_object]
-                            if related_object is not None
-                            else []
-                        )
-
-                    for obj in related_objects:
-                        if obj:
-                            obj.deleted_at = timezone.now()
-                            obj.save(using=using)
-            except ObjectDoesNotExist:
-                pass
-
-
-# @shared_task
-def restore_related_objects(app_label, model_name, instance_pk, using=None):
-    pass
+    instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    if instance.deleted_at is None:
+        return
+
+    counts = {}
+    cascade_deleted_at(
+        model_class,
+        [instance.pk],
+        instance.deleted_at,
+        None,
+        counts,
+        progress=task_progress(self),
+        using=using,
+    )
+
+    instance.deleted_at = None
+    instance.save(using=using)
+    report_cascade("Restored", instance, counts)
 
 
 @shared_task
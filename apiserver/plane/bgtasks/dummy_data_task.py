@@ -21,7 +21,9 @@ from plane.db.models import (
     Cycle,
     Module,
     Issue,
+    IssueCounter,
     IssueSequence,
+    IssueSequenceCounter,
     IssueAssignee,
     IssueLabel,
     IssueActivity,
@@ -317,14 +319,8 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(
-        project=project,
-    ).aggregate(
-        largest=Max("sequence")
-    )["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
+    # Reserve the sequence ids of all the issues at once
+    sequences = iter(IssueSequenceCounter.allocate(project.id, issue_count))
 
     # Get the maximum sort order
     largest_sort_order = Issue.objects.filter(
@@ -356,7 +352,7 @@ def create_issues(workspace, project, user_id, issue_count):
                 name=text[:254],
                 description_html=f"<p>{text}</p>",
                 description_stripped=text,
-                sequence_id=last_id,
+                sequence_id=next(sequences),
                 sort_order=largest_sort_order,
                 start_date=start_date,
                 target_date=end_date,
@@ -368,7 +364,6 @@ def create_issues(workspace, project, user_id, issue_count):
         )
 
         largest_sort_order = largest_sort_order + random.randint(0, 1000)
-        last_id = last_id + 1
 
     issues = Issue.objects.bulk_create(
         issues, ignore_conflicts=True, batch_size=1000
@@ -708,4 +703,9 @@ def create_dummy_data(
         issue_count=issue_count,
     )
 
+    # count the bulk created parents and cycles of the issues
+    IssueCounter.refresh(
+        Issue.all_objects.filter(project=project).values_list("id", flat=True)
+    )
+
     return
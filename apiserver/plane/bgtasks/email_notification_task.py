@@ -1,6 +1,8 @@
 import logging
 import re
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
 from bs4 import BeautifulSoup
 
@@ -19,6 +21,10 @@ from plane.license.utils.instance_value import get_email_configuration
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
 
+# Logs read per round trip of the server side cursor, and marked processed
+# per update
+EMAIL_DIGEST_CHUNK_SIZE = 1000
+
 
 def remove_unwanted_characters(input_text):
     # Keep only alphanumeric characters, spaces, and dashes.
@@ -41,306 +47,361 @@ def release_lock(lock_id):
 
 @shared_task
 def stack_email_notification():
-    # get all email notifications
+    """
+    Group the unprocessed email logs by receiver and issue in a single pass
+    over a server side cursor, and queue one digest per receiver
+    """
     email_notifications = (
         EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
+        .order_by("receiver_id")
+        .values(
+            "id",
+            "receiver_id",
+            "entity_identifier",
+            "triggered_by_id",
+            "data",
+        )
+        .iterator(chunk_size=EMAIL_DIGEST_CHUNK_SIZE)
     )
 
-    # Create the below format for each of the issues
+    # Create the below format for each of the issues of a receiver
     # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
-
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
-        )
-    )
     processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(
-                str(receiver_notification.get("triggered_by_id")), []
-            ).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
+    for receiver_id, receiver_notifications in groupby(
+        email_notifications, key=itemgetter("receiver_id")
+    ):
+        emails = {}
+        for notification in receiver_notifications:
+            issue_id = str(notification["entity_identifier"])
+            email = emails.setdefault(
+                issue_id,
+                {
+                    "issue_id": issue_id,
+                    "notification_data": {},
+                    "email_notification_ids": [],
+                },
             )
+            email["notification_data"].setdefault(
+                str(notification["triggered_by_id"]), []
+            ).append(notification["data"])
+            email["email_notification_ids"].append(str(notification["id"]))
+            processed_notifications.append(notification["id"])
+
+        send_email_digest.delay(
+            receiver_id=str(receiver_id), emails=list(emails.values())
+        )
 
     # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+    chunk_size = EMAIL_DIGEST_CHUNK_SIZE
+    for index in range(0, len(processed_notifications), chunk_size):
+        EmailNotificationLog.objects.filter(
+            pk__in=processed_notifications[index : index + chunk_size]
+        ).update(processed_at=timezone.now())
 
 
 def create_payload(notification_data):
     # return format {"actor_id":  { "key": { "old_value": [], "new_value": [] } }}
     data = {}
     for actor_id, changes in notification_data.items():
+        # Values already listed for every field, for constant time checks
+        seen = {}
         for change in changes:
             issue_activity = change.get("issue_activity")
             if issue_activity:  # Ensure issue_activity is not None
                 field = issue_activity.get("field")
-                old_value = str(issue_activity.get("old_value"))
-                new_value = str(issue_activity.get("new_value"))
-
-                # Append old_value if it's not empty and not already in the list
-                if old_value:
-                    (
-                        data.setdefault(actor_id, {})
-                        .setdefault(field, {})
-                        .setdefault("old_value", [])
-                        .append(old_value)
-                        if old_value
-                        not in data.setdefault(actor_id, {})
-                        .setdefault(field, {})
-                        .get("old_value", [])
-                        else None
-                    )
-
-                # Append new_value if it's not empty and not already in the list
-                if new_value:
-                    (
-                        data.setdefault(actor_id, {})
-                        .setdefault(field, {})
-                        .setdefault("new_value", [])
-                        .append(new_value)
-                        if new_value
-                        not in data.setdefault(actor_id, {})
-                        .setdefault(field, {})
-                        .get("new_value", [])
-                        else None
-                    )
-
-                if not data.get("actor_id", {}).get("activity_time", False):
-                    data[actor_id]["activity_time"] = str(
-                        datetime.fromisoformat(
-                            issue_activity.get("activity_time").rstrip("Z")
-                        ).strftime("%Y-%m-%d %H:%M:%S")
-                    )
+                actor_data = data.setdefault(actor_id, {})
+
+                # Append the values which are not empty and not listed yet
+                for key in ["old_value", "new_value"]:
+                    value = str(issue_activity.get(key))
+                    values = seen.setdefault((field, key), set())
+                    if value and value not in values:
+                        values.add(value)
+                        actor_data.setdefault(field, {}).setdefault(
+                            key, []
+                        ).append(value)
+
+                actor_data["activity_time"] = str(
+                    datetime.fromisoformat(
+                        issue_activity.get("activity_time").rstrip("Z")
+                    ).strftime("%Y-%m-%d %H:%M:%S")
+                )
 
     return data
 
 
-def process_mention(mention_component):
-    soup = BeautifulSoup(mention_component, "html.parser")
-    mentions = soup.find_all("mention-component")
-    for mention in mentions:
-        user_id = mention["entity_identifier"]
-        user = User.objects.get(pk=user_id)
-        user_name = user.display_name
-        highlighted_name = f"@{user_name}"
-        mention.replace_with(highlighted_name)
-    return str(soup)
-
+def process_mentions(payloads):
+    """
+    Replace the mention components of the mention changes by the display
+    name of the mentioned users, resolved with a single query
+    """
+    documents = []
+    for data in payloads:
+        for changes in data.values():
+            mention = changes.get("mention")
+            if not mention:
+                continue
+            for key in ["old_value", "new_value"]:
+                if mention.get(key) is None:
+                    continue
+                soups = [
+                    BeautifulSoup(content, "html.parser")
+                    for content in mention[key]
+                ]
+                components = [
+                    component
+                    for soup in soups
+                    for component in soup.find_all("mention-component")
+                ]
+                documents.append((mention, key, soups, components))
+
+    user_ids = {
+        component["entity_identifier"]
+        for _, _, _, components in documents
+        for component in components
+    }
+    display_names = {
+        str(user_id): display_name
+        for user_id, display_name in User.objects.filter(
+            pk__in=user_ids
+        ).values_list("id", "display_name")
+    }
+
+    for mention, key, soups, components in documents:
+        for component in components:
+            display_name = display_names.get(component["entity_identifier"])
+            component.replace_with(
+                f"@{display_name}" if display_name else component.get_text()
+            )
+        mention[key] = [str(soup) for soup in soups]
+
+
+def get_email_connection():
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+
+    connection = get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
+    return connection, EMAIL_FROM
+
+
+def render_issue_email(receiver, issue, data, actors, base_api):
+    """Return the subject and html content of the updates of an issue"""
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = actors.get(actor_id)
+        if actor is None:
+            continue
+        actor_detail = {
+            "avatar_url": f"{base_api}{actor.avatar_url}",
+            "first_name": actor.first_name,
+            "last_name": actor.last_name,
+        }
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": actor_detail,
+                }
+            )
+        if mention:
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": actor_detail,
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(
+            activity_time, "%Y-%m-%d %H:%M:%S"
+        ).strftime("%H:%M %p")
+
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": actor_detail,
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
+            )
 
-def process_html_content(content):
-    if content is None:
-        return None
-    processed_content_list = []
-    for html_content in content:
-        processed_content = process_mention(html_content)
-        processed_content_list.append(processed_content)
-    return processed_content_list
+    summary = "Updates were made to the issue by"
+
+    subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
+            "name": issue.name,
+            "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        },
+        "receiver": {
+            "email": receiver.email,
+        },
+        "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = render_to_string(
+        "emails/notifications/issue-updates.html", context
+    )
+    return subject, html_content
 
 
-@shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
-):
+def email_lock_id(issue_id, receiver_id, email_notification_ids):
     # Convert UUIDs to a sorted, concatenated string
     sorted_ids = sorted(email_notification_ids)
     ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
-
-    # acquire the lock for sending emails
-    try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = (
-                ri.get(str(issue_id)).decode()
-                if ri.get(str(issue_id))
-                else None
+    return f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+
+
+def send_receiver_emails(receiver_id, emails, connection=None):
+    """
+    Send the issue emails of a receiver over a single SMTP connection, the
+    receiver, the issues, the actors and the mentioned users are loaded
+    once for all of them. Returns the number of emails sent
+    """
+    receiver = User.objects.filter(pk=receiver_id).first()
+    if receiver is None or not emails:
+        return 0
+
+    # The base api of every issue is set along with its activities
+    base_apis = redis_instance().mget(
+        [str(email["issue_id"]) for email in emails]
+    )
+    issues = {
+        str(issue.id): issue
+        for issue in Issue.objects.filter(
+            pk__in=[email["issue_id"] for email in emails]
+        ).select_related("project", "project__workspace")
+    }
+
+    pending = []
+    for email, base_api in zip(emails, base_apis):
+        issue = issues.get(str(email["issue_id"]))
+        # Skip if the issue or the base api is not present
+        if issue is None or not base_api:
+            continue
+        pending.append(
+            (
+                email,
+                issue,
+                base_api.decode(),
+                create_payload(notification_data=email["notification_data"]),
             )
+        )
+    if not pending:
+        return 0
 
-            # Skip if base api is not present
-            if not base_api:
-                return
+    actors = {
+        str(actor.id): actor
+        for actor in User.objects.filter(
+            pk__in={actor_id for _, _, _, data in pending for actor_id in data}
+        )
+    }
+    process_mentions([data for _, _, _, data in pending])
 
-            data = create_payload(notification_data=notification_data)
+    email_connection, from_email = get_email_connection()
+    connection = connection or email_connection
 
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
-
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {
-                    "email": receiver.email,
-                },
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
+    sent = 0
+    try:
+        for email, issue, base_api, data in pending:
+            lock_id = email_lock_id(
+                issue.id, receiver_id, email["email_notification_ids"]
             )
-            text_content = strip_tags(html_content)
+            # acquire the lock for sending emails
+            if not acquire_lock(lock_id=lock_id):
+                logging.getLogger("plane").info(
+                    "Duplicate email received skipping"
+                )
+                continue
 
             try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
+                subject, html_content = render_issue_email(
+                    receiver, issue, data, actors, base_api
                 )
-
                 msg = EmailMultiAlternatives(
                     subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
+                    body=strip_tags(html_content),
+                    from_email=from_email,
                     to=[receiver.email],
                     connection=connection,
                 )
                 msg.attach_alternative(html_content, "text/html")
+                # Opened once, the following emails reuse the connection
+                connection.open()
                 msg.send()
+                sent += 1
                 logging.getLogger("plane").info("Email Sent Successfully")
 
                 # Update the logs
                 EmailNotificationLog.objects.filter(
-                    pk__in=email_notification_ids
+                    pk__in=email["email_notification_ids"]
                 ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
             except Exception as e:
                 log_exception(e)
+                # Start over with a new connection for the next email
+                connection.close()
+            finally:
                 # release the lock
                 release_lock(lock_id=lock_id)
-                return
-        else:
-            logging.getLogger("plane").info(
-                "Duplicate email received skipping"
-            )
-            return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
+    finally:
+        connection.close()
+    return sent
+
+
+@shared_task
+def send_email_digest(receiver_id, emails):
+    try:
+        send_receiver_emails(receiver_id, emails)
     except Exception as e:
         log_exception(e)
-        release_lock(lock_id=lock_id)
         return
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    # Emails queued one issue at a time before the digests per receiver
+    send_email_digest(
+        receiver_id,
+        [
+            {
+                "issue_id": issue_id,
+                "notification_data": notification_data,
+                "email_notification_ids": email_notification_ids,
+            }
+        ],
+    )
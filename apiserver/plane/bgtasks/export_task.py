@@ -2,9 +2,14 @@
 import csv
 import io
 import json
+import shutil
+import tempfile
 import zipfile
+from itertools import chain, groupby
+from operator import itemgetter
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 
 # Third party imports
@@ -30,42 +35,51 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
+# Issues fetched per round trip of the server side cursor
+ISSUE_CHUNK_SIZE = 2000
 
-    for row in data:
-        csv_writer.writerow(row)
+# The zip is kept in memory up to this size and spilled to disk after
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
 
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+# Large exports are uploaded in parts of this size
+UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+)
 
 
-def create_json_file(data):
-    return json.dumps(data)
+def write_csv_file(rows, stream):
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    csv_writer = csv.writer(text_stream, delimiter=",", quoting=csv.QUOTE_ALL)
+    csv_writer.writerows(rows)
+    text_stream.flush()
+    text_stream.detach()
 
 
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
+def write_json_file(rows, stream):
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+    text_stream.write("[")
+    for index, row in enumerate(rows):
+        if index:
+            text_stream.write(", ")
+        text_stream.write(json.dumps(row))
+    text_stream.write("]")
+    text_stream.flush()
+    text_stream.detach()
 
-    for row in data:
-        sheet.append(row)
-
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
 
+def write_xlsx_file(rows, stream):
+    # Write only workbooks keep the rows out of memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
 
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
+    for row in rows:
+        sheet.append(row)
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    with tempfile.TemporaryFile() as xlsx_file:
+        workbook.save(xlsx_file)
+        xlsx_file.seek(0)
+        shutil.copyfileobj(xlsx_file, stream)
 
 
 def upload_to_s3(zip_file, workspace_id, token_id, slug):
@@ -85,6 +99,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=UPLOAD_CONFIG,
         )
 
         # Generate presigned url for the uploaded file with different base
@@ -129,6 +144,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ContentType": "application/zip"},
+            Config=UPLOAD_CONFIG,
         )
 
         # Generate presigned url for the uploaded file
@@ -154,6 +170,39 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
+def full_name(first_name, last_name):
+    return f"{first_name} {last_name}" if first_name and last_name else ""
+
+
+def merge_issue_rows(issues):
+    """
+    Yield one issue per group of consecutive rows of the same issue, the
+    query repeats an issue for every assignee and label it has
+    """
+    for _, rows in groupby(issues, key=itemgetter("id")):
+        rows = list(rows)
+        assignees = dict.fromkeys(
+            filter(
+                None,
+                (
+                    full_name(
+                        row["assignees__first_name"],
+                        row["assignees__last_name"],
+                    )
+                    for row in rows
+                ),
+            )
+        )
+        labels = dict.fromkeys(
+            filter(None, (row["labels__name"] for row in rows))
+        )
+        yield {
+            **rows[0],
+            "assignees": ", ".join(assignees),
+            "labels": ", ".join(labels),
+        }
+
+
 def generate_table_row(issue):
     return [
         f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
@@ -162,18 +211,11 @@ def generate_table_row(issue):
         issue["description_stripped"],
         issue["state__name"],
         issue["priority"],
-        (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"]
-            and issue["created_by__last_name"]
-            else ""
+        full_name(
+            issue["created_by__first_name"], issue["created_by__last_name"]
         ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"] if issue["labels__name"] else "",
+        issue["assignees"],
+        issue["labels"],
         issue["issue_cycle__cycle__name"],
         dateConverter(issue["issue_cycle__cycle__start_date"]),
         dateConverter(issue["issue_cycle__cycle__end_date"]),
@@ -195,18 +237,11 @@ def generate_json_row(issue):
         "Description": issue["description_stripped"],
         "State": issue["state__name"],
         "Priority": issue["priority"],
-        "Created By": (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"]
-            and issue["created_by__last_name"]
-            else ""
-        ),
-        "Assignee": (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
+        "Created By": full_name(
+            issue["created_by__first_name"], issue["created_by__last_name"]
         ),
-        "Labels": issue["labels__name"] if issue["labels__name"] else "",
+        "Assignee": issue["assignees"],
+        "Labels": issue["labels"],
         "Cycle Name": issue["issue_cycle__cycle__name"],
         "Cycle Start Date": dateConverter(
             issue["issue_cycle__cycle__start_date"]
@@ -226,91 +261,30 @@ def generate_json_row(issue):
     }
 
 
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
-        )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def update_table_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row[0] == row[0]
-        ),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index][8] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
+def iterate_issues(issues):
+    # Stream the issues through a server side cursor
+    return merge_issue_rows(issues.iterator(chunk_size=ISSUE_CHUNK_SIZE))
 
 
-def generate_csv(header, project_id, issues, files):
+def generate_csv(header, project_id, issues, zip_file):
     """
-    Generate CSV export for all the passed issues.
+    Stream the CSV export of all the passed issues into the zip file.
     """
-    rows = [
-        header,
-    ]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
+    rows = (generate_table_row(issue) for issue in iterate_issues(issues))
+    with zip_file.open(f"{project_id}.csv", "w") as stream:
+        write_csv_file(chain([header], rows), stream)
 
 
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
+def generate_json(header, project_id, issues, zip_file):
+    rows = (generate_json_row(issue) for issue in iterate_issues(issues))
+    with zip_file.open(f"{project_id}.json", "w") as stream:
+        write_json_file(rows, stream)
 
 
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+def generate_xlsx(header, project_id, issues, zip_file):
+    rows = (generate_table_row(issue) for issue in iterate_issues(issues))
+    with zip_file.open(f"{project_id}.xlsx", "w") as stream:
+        write_xlsx_file(chain([header], rows), stream)
 
 
 @shared_task
@@ -399,31 +373,32 @@ def issue_export_task(
             "xlsx": generate_xlsx,
         }
 
-        files = []
-        if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
+        # The zip spills to disk once it outgrows the memory budget
+        with tempfile.SpooledTemporaryFile(
+            max_size=SPOOL_MAX_SIZE
+        ) as zip_buffer:
+            with zipfile.ZipFile(
+                zip_buffer, "w", zipfile.ZIP_DEFLATED
+            ) as zip_file:
                 exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
+                if exporter is not None and multiple:
+                    for project_id in project_ids:
+                        exporter(
+                            header,
+                            project_id,
+                            workspace_issues.filter(project__id=project_id),
+                            zip_file,
+                        )
+                elif exporter is not None:
                     exporter(
                         header,
-                        project_id,
-                        issues,
-                        files,
+                        workspace_id,
+                        workspace_issues,
+                        zip_file,
                     )
 
-        else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(
-                    header,
-                    workspace_id,
-                    workspace_issues,
-                    files,
-                )
-
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+            zip_buffer.seek(0)
+            upload_to_s3(zip_buffer, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
@@ -29,9 +29,18 @@ from plane.db.models import (
     EstimatePoint,
 )
 from plane.settings.redis import redis_instance
+from plane.utils.dashboard_stats import (
+    DASHBOARD_ACTIVITY_FIELDS,
+    invalidate_dashboard_stats,
+)
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.webhook_task import webhook_activity
+from plane.bgtasks.webhook_task import queue_webhook_activity
+from plane.bgtasks.progress_snapshot_task import (
+    PROGRESS_ACTIVITY_FIELDS,
+    schedule_progress_refresh,
+)
 from plane.utils.issue_relation_mapper import get_inverse_relation
+from plane.space.utils.cache import invalidate_public_board
 
 
 # Track Changes in name
@@ -1607,6 +1616,40 @@ def create_intake_activity(
         )
 
 
+def queue_activity_webhooks(issue_activities, slug, origin, intake=None):
+    """Activities are coalesced per entity before fanning out to webhooks"""
+    for activity in issue_activities:
+        queue_webhook_activity(
+            event=(
+                "issue_comment"
+                if activity.field == "comment"
+                else "intake_issue" if intake else "issue"
+            ),
+            event_id=(
+                activity.issue_comment_id
+                if activity.field == "comment"
+                else intake if intake else activity.issue_id
+            ),
+            verb=activity.verb,
+            field=(
+                "description"
+                if activity.field == "comment"
+                else activity.field
+            ),
+            old_value=(
+                activity.old_value if activity.old_value != "" else None
+            ),
+            new_value=(
+                activity.new_value if activity.new_value != "" else None
+            ),
+            actor_id=activity.actor_id,
+            current_site=origin,
+            slug=slug,
+            old_identifier=activity.old_identifier,
+            new_identifier=activity.new_identifier,
+        )
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1689,41 +1732,32 @@ def issue_activity(
             issue_activities
         )
         # Post the updates to segway for integrations and webhooks
-        if len(issue_activities_created):
-            for activity in issue_activities_created:
-                webhook_activity.delay(
-                    event=(
-                        "issue_comment"
-                        if activity.field == "comment"
-                        else "intake_issue" if intake else "issue"
-                    ),
-                    event_id=(
-                        activity.issue_comment_id
-                        if activity.field == "comment"
-                        else intake if intake else activity.issue_id
-                    ),
-                    verb=activity.verb,
-                    field=(
-                        "description"
-                        if activity.field == "comment"
-                        else activity.field
-                    ),
-                    old_value=(
-                        activity.old_value
-                        if activity.old_value != ""
-                        else None
-                    ),
-                    new_value=(
-                        activity.new_value
-                        if activity.new_value != ""
-                        else None
-                    ),
-                    actor_id=activity.actor_id,
-                    current_site=origin,
-                    slug=activity.workspace.slug,
-                    old_identifier=activity.old_identifier,
-                    new_identifier=activity.new_identifier,
-                )
+        queue_activity_webhooks(
+            issue_activities_created,
+            slug=project.workspace.slug,
+            origin=origin,
+            intake=intake,
+        )
+
+        # Refresh the progress of the cycles and modules of the issues
+        progress_issue_ids = {
+            activity.issue_id
+            for activity in issue_activities_created
+            if activity.field in PROGRESS_ACTIVITY_FIELDS
+        }
+        if type == "issue.activity.created":
+            progress_issue_ids.add(issue_id)
+        schedule_progress_refresh(progress_issue_ids)
+
+        # Drop the dashboard stats of the users the changes count for
+        if type == "issue.activity.created" or any(
+            activity.field in DASHBOARD_ACTIVITY_FIELDS
+            for activity in issue_activities_created
+        ):
+            invalidate_dashboard_stats([issue_id])
+
+        # Issues, comments, reactions and votes are all logged here
+        invalidate_public_board(project_id)
 
         if notification:
             notifications.delay(
@@ -1746,3 +1780,125 @@ def issue_activity(
     except Exception as e:
         log_exception(e)
         return
+
+
+def create_bulk_issue_activities(
+    activities, project, actor_id, issue_activities, epoch
+):
+    """
+    The created activity of every issue of a batch, inserted together and
+    dated and attributed like the issue as by create_issue_activity
+    """
+    issues = {
+        str(issue_id): (created_at, created_by_id)
+        for issue_id, created_at, created_by_id in Issue.objects.filter(
+            pk__in=[item["issue_id"] for item in activities]
+        ).values_list("id", "created_at", "created_by_id")
+    }
+    created = IssueActivity.objects.bulk_create(
+        [
+            IssueActivity(
+                issue_id=item["issue_id"],
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                comment="created the issue",
+                verb="created",
+                actor_id=issues[item["issue_id"]][1] or actor_id,
+                epoch=epoch,
+            )
+            for item in activities
+            if item["issue_id"] in issues
+        ]
+    )
+    for activity in created:
+        activity.created_at = issues[str(activity.issue_id)][0]
+    IssueActivity.objects.bulk_update(created, ["created_at"], batch_size=100)
+
+    for item in activities:
+        requested_data = json.loads(item["requested_data"])
+        if requested_data.get("assignee_ids") is not None:
+            track_assignees(
+                requested_data,
+                item["current_instance"],
+                item["issue_id"],
+                project.id,
+                project.workspace_id,
+                actor_id,
+                issue_activities,
+                epoch,
+            )
+
+
+@shared_task
+def bulk_issue_activity(
+    type, activities, actor_id, project_id, epoch, origin=None
+):
+    """
+    Activities of a batch of issues created or updated together, logged
+    with one insert and one round of cache invalidations for the batch.
+    Every activity holds the issue_id, requested_data and current_instance
+    """
+    try:
+        issue_activities = []
+        project = Project.objects.select_related("workspace").get(
+            pk=project_id
+        )
+        issue_ids = [item["issue_id"] for item in activities]
+
+        if origin:
+            # set the request origin of the issues in redis
+            pipeline = redis_instance().pipeline()
+            for issue_id in issue_ids:
+                pipeline.set(issue_id, origin, ex=600)
+            pipeline.execute()
+        Issue.objects.filter(pk__in=issue_ids).update(
+            updated_at=timezone.now()
+        )
+
+        if type == "issue.activity.created":
+            create_bulk_issue_activities(
+                activities, project, actor_id, issue_activities, epoch
+            )
+        elif type == "issue.activity.updated":
+            for item in activities:
+                update_issue_activity(
+                    requested_data=item["requested_data"],
+                    current_instance=item["current_instance"],
+                    issue_id=item["issue_id"],
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    actor_id=actor_id,
+                    issue_activities=issue_activities,
+                    epoch=epoch,
+                )
+
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=100
+        )
+        queue_activity_webhooks(
+            issue_activities_created,
+            slug=project.workspace.slug,
+            origin=origin,
+        )
+
+        # Refresh and invalidate once for all the issues of the batch
+        progress_issue_ids = {
+            activity.issue_id
+            for activity in issue_activities_created
+            if activity.field in PROGRESS_ACTIVITY_FIELDS
+        }
+        dashboard_issue_ids = {
+            activity.issue_id
+            for activity in issue_activities_created
+            if activity.field in DASHBOARD_ACTIVITY_FIELDS
+        }
+        if type == "issue.activity.created":
+            progress_issue_ids.update(issue_ids)
+            dashboard_issue_ids.update(issue_ids)
+        schedule_progress_refresh(progress_issue_ids)
+        invalidate_dashboard_stats(list(dashboard_issue_ids))
+        invalidate_public_board(project_id)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
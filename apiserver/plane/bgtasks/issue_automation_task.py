@@ -11,7 +11,15 @@ from django.utils import timezone
 
 # Module imports
 from plane.bgtasks.issue_activities_task import issue_activity
-from plane.db.models import Issue, Project, State
+from plane.db.models import (
+    Issue,
+    IssueChange,
+    IssueCounter,
+    Project,
+    State,
+)
+from plane.db.models.recent_visit import EntityNameEnum
+from plane.db.models.search import schedule_search_documents_update
 from plane.utils.exception_logger import log_exception
 
 
@@ -65,12 +73,24 @@ def archive_old_issues():
                 issues_to_update = []
                 for issue in issues:
                     issue.archived_at = archive_at
+                    issue.updated_at = timezone.now()
                     issues_to_update.append(issue)
 
                 # Bulk Update the issues and log the activity
                 if issues_to_update:
                     Issue.objects.bulk_update(
-                        issues_to_update, ["archived_at"], batch_size=100
+                        issues_to_update,
+                        ["archived_at", "updated_at"],
+                        batch_size=100,
+                    )
+                    # Archived sub issues leave the counts of their parents
+                    IssueCounter.refresh(
+                        [issue.parent_id for issue in issues_to_update]
+                    )
+                    IssueChange.record_issues(issues_to_update)
+                    schedule_search_documents_update(
+                        EntityNameEnum.ISSUE,
+                        [issue.id for issue in issues_to_update],
                     )
                     _ = [
                         issue_activity.delay(
@@ -147,12 +167,20 @@ def close_old_issues():
                 issues_to_update = []
                 for issue in issues:
                     issue.state = close_state
+                    issue.updated_at = timezone.now()
                     issues_to_update.append(issue)
 
                 # Bulk Update the issues and log the activity
                 if issues_to_update:
                     Issue.objects.bulk_update(
-                        issues_to_update, ["state"], batch_size=100
+                        issues_to_update,
+                        ["state", "updated_at"],
+                        batch_size=100,
+                    )
+                    IssueChange.record_issues(issues_to_update)
+                    schedule_search_documents_update(
+                        EntityNameEnum.ISSUE,
+                        [issue.id for issue in issues_to_update],
                     )
                     [
                         issue_activity.delay(
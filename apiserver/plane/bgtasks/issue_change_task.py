@@ -0,0 +1,24 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import IssueChange
+
+
+@shared_task
+def delete_old_issue_changes():
+    # Clients with a cursor older than the retention resync
+    changes_to_delete = IssueChange.all_objects.filter(
+        created_at__lte=timezone.now()
+        - timedelta(days=settings.ISSUE_CHANGES_RETENTION_DAYS)
+    )
+
+    # Delete the changes
+    changes_to_delete._raw_delete(changes_to_delete.db)
@@ -0,0 +1,21 @@
+# Python imports
+import logging
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+from plane.utils.notification_counter import reconcile_unread_counts
+
+
+@shared_task
+def reconcile_notification_counters():
+    # Recount the cached unread counters and repair the ones which drifted
+    try:
+        drifted = reconcile_unread_counts()
+        logging.getLogger("plane").info(
+            f"Repaired {drifted} unread notification counters"
+        )
+    except Exception as e:
+        log_exception(e)
@@ -13,10 +13,12 @@ from plane.db.models import (
     State,
     EmailNotificationLog,
     Notification,
+    NotificationCategory,
     IssueComment,
     IssueActivity,
     UserNotificationPreference,
 )
+from plane.utils.notification_counter import update_unread_counts
 
 # Third Party imports
 from celery import shared_task
@@ -178,6 +180,7 @@ def create_mention_notification(
     return Notification(
         workspace=project.workspace,
         sender="in_app:issue_activities:mentioned",
+        category=NotificationCategory.MENTIONED,
         triggered_by_id=actor_id,
         receiver_id=mention_id,
         entity_identifier=issue_id,
@@ -349,13 +352,16 @@ def notifications(
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
                     sender = "in_app:issue_activities:created"
+                    category = NotificationCategory.CREATED
                 elif (
                     subscriber in issue_assignees
                     and issue.created_by_id not in issue_assignees
                 ):
                     sender = "in_app:issue_activities:assigned"
+                    category = NotificationCategory.ASSIGNED
                 else:
                     sender = "in_app:issue_activities:subscribed"
+                    category = NotificationCategory.SUBSCRIBED
 
                 preference = UserNotificationPreference.objects.get(
                     user_id=subscriber
@@ -417,6 +423,7 @@ def notifications(
                         Notification(
                             workspace=project.workspace,
                             sender=sender,
+                            category=category,
                             triggered_by_id=actor_id,
                             receiver_id=subscriber,
                             entity_identifier=issue_id,
@@ -669,6 +676,7 @@ def notifications(
                             Notification(
                                 workspace=project.workspace,
                                 sender="in_app:issue_activities:mentioned",
+                                category=NotificationCategory.MENTIONED,
                                 triggered_by_id=actor_id,
                                 receiver_id=mention_id,
                                 entity_identifier=issue_id,
@@ -881,6 +889,9 @@ def notifications(
             Notification.objects.bulk_create(
                 bulk_notifications, batch_size=100
             )
+            update_unread_counts(
+                project.workspace.slug, bulk_notifications, 1
+            )
             EmailNotificationLog.objects.bulk_create(
                 bulk_email_logs, batch_size=100, ignore_conflicts=True
             )
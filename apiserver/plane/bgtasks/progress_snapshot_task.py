@@ -0,0 +1,83 @@
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import CycleIssue, ModuleIssue
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+from plane.utils.progress_snapshot import refresh_progress_snapshot
+
+# Activity fields which change the progress of a cycle or module
+PROGRESS_ACTIVITY_FIELDS = {
+    "state",
+    "estimate_point",
+    "assignees",
+    "labels",
+    "cycles",
+    "modules",
+    "archived_at",
+    "issue",
+    "draft",
+    "intake",
+}
+
+
+def schedule_progress_refresh(issue_ids):
+    """
+    Schedule one refresh of the progress snapshots of every cycle and
+    module the issues belong or belonged to, refreshes requested within
+    the delay are coalesced
+    """
+    issue_ids = [issue_id for issue_id in issue_ids if issue_id]
+    if not issue_ids:
+        return
+
+    delay = settings.PROGRESS_SNAPSHOT_DELAY
+    ri = redis_instance()
+
+    # Removed relations are included so that the old cycle is refreshed
+    entities = [
+        ("cycle_id", cycle_id)
+        for cycle_id in CycleIssue.all_objects.filter(
+            issue_id__in=issue_ids, cycle__deleted_at__isnull=True
+        )
+        .values_list("cycle_id", flat=True)
+        .order_by()
+        .distinct()
+    ] + [
+        ("module_id", module_id)
+        for module_id in ModuleIssue.all_objects.filter(
+            issue_id__in=issue_ids, module__deleted_at__isnull=True
+        )
+        .values_list("module_id", flat=True)
+        .order_by()
+        .distinct()
+    ]
+
+    for key, entity_id in entities:
+        if ri.set(
+            f"progress_snapshot:{key}:{entity_id}", 1, nx=True, ex=delay * 10
+        ):
+            progress_snapshot_refresh.apply_async(
+                kwargs={key: str(entity_id)}, countdown=delay
+            )
+
+
+@shared_task
+def progress_snapshot_refresh(cycle_id=None, module_id=None):
+    try:
+        ri = redis_instance()
+        # Release the schedule first so later activities refresh again
+        if cycle_id:
+            ri.delete(f"progress_snapshot:cycle_id:{cycle_id}")
+        else:
+            ri.delete(f"progress_snapshot:module_id:{module_id}")
+
+        refresh_progress_snapshot(cycle_id=cycle_id, module_id=module_id)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
@@ -0,0 +1,158 @@
+# Django imports
+from django.contrib.postgres.search import SearchVector
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueComment,
+    IssueView,
+    Module,
+    Page,
+    ProjectPage,
+    SearchDocument,
+)
+from plane.db.models.recent_visit import EntityNameEnum
+from plane.utils.exception_logger import log_exception
+
+
+def issue_document(entity_identifier):
+    issue = (
+        Issue.issue_objects.filter(pk=entity_identifier)
+        .select_related("project")
+        .first()
+    )
+    if issue is None:
+        return None
+
+    comments = IssueComment.objects.filter(
+        issue_id=entity_identifier
+    ).values_list("comment_stripped", flat=True)
+    return {
+        "workspace_id": issue.workspace_id,
+        "project_id": issue.project_id,
+        "name": issue.name,
+        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+        "content": "\n".join(
+            [issue.description_stripped or "", *filter(None, comments)]
+        ),
+        "project_ids": [issue.project_id],
+        "metadata": {
+            "sequence_id": issue.sequence_id,
+            "project_id": str(issue.project_id),
+            "project__identifier": issue.project.identifier,
+        },
+    }
+
+
+def page_document(entity_identifier):
+    page = Page.objects.filter(pk=entity_identifier).first()
+    if page is None:
+        return None
+
+    projects = list(
+        ProjectPage.objects.filter(page_id=entity_identifier).values_list(
+            "project_id", "project__identifier"
+        )
+    )
+    if not projects:
+        return None
+
+    return {
+        "workspace_id": page.workspace_id,
+        "project_id": None,
+        "name": page.name,
+        "identifier": "",
+        "content": page.description_stripped or "",
+        "project_ids": [project_id for project_id, _ in projects],
+        "metadata": {
+            "project_ids": [str(project_id) for project_id, _ in projects],
+            "project_identifiers": [
+                identifier for _, identifier in projects
+            ],
+        },
+    }
+
+
+def project_entity_document(model):
+    def document(entity_identifier):
+        entity = (
+            model.objects.filter(pk=entity_identifier, project__isnull=False)
+            .select_related("project")
+            .first()
+        )
+        if entity is None:
+            return None
+
+        return {
+            "workspace_id": entity.workspace_id,
+            "project_id": entity.project_id,
+            "name": entity.name,
+            "identifier": entity.project.identifier,
+            "content": entity.description or "",
+            "project_ids": [entity.project_id],
+            "metadata": {
+                "project_id": str(entity.project_id),
+                "project__identifier": entity.project.identifier,
+            },
+        }
+
+    return document
+
+
+DOCUMENT_MAPPER = {
+    EntityNameEnum.ISSUE: issue_document,
+    EntityNameEnum.PAGE: page_document,
+    EntityNameEnum.CYCLE: project_entity_document(Cycle),
+    EntityNameEnum.MODULE: project_entity_document(Module),
+    EntityNameEnum.VIEW: project_entity_document(IssueView),
+}
+
+
+def index_search_document(entity_name, entity_identifier):
+    """Create, refresh or drop the search document of an entity"""
+    document = DOCUMENT_MAPPER[entity_name](entity_identifier)
+
+    # The entity was deleted, archived or is no longer searchable
+    if document is None:
+        SearchDocument.all_objects.filter(
+            entity_name=entity_name, entity_identifier=entity_identifier
+        ).delete()
+        return
+
+    search_document, _ = SearchDocument.all_objects.update_or_create(
+        entity_name=entity_name,
+        entity_identifier=entity_identifier,
+        defaults={**document, "deleted_at": None},
+    )
+
+    # Build the weighted vector in the database
+    SearchDocument.all_objects.filter(pk=search_document.pk).update(
+        search_vector=(
+            SearchVector("name", weight="A", config="simple")
+            + SearchVector("identifier", weight="A", config="simple")
+            + SearchVector("content", weight="B", config="simple")
+        )
+    )
+
+
+@shared_task
+def update_search_document(entity_name, entity_identifier):
+    try:
+        index_search_document(entity_name, entity_identifier)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def update_search_documents(entity_name, entity_identifiers):
+    for entity_identifier in entity_identifiers:
+        try:
+            index_search_document(entity_name, entity_identifier)
+        except Exception as e:
+            log_exception(e)
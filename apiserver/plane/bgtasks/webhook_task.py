@@ -5,6 +5,7 @@ import logging
 import uuid
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Third party imports
 from celery import shared_task
@@ -43,6 +44,7 @@ from plane.db.models import (
     IntakeIssue,
 )
 from plane.license.utils.instance_value import get_email_configuration
+from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
 
 SERIALIZER_MAPPER = {
@@ -70,6 +72,21 @@ MODEL_MAPPER = {
 }
 
 
+# Pooled session reused by every webhook delivery of the worker process
+_webhook_session = None
+
+
+def get_webhook_session():
+    global _webhook_session
+    if _webhook_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _webhook_session = session
+    return _webhook_session
+
+
 def get_model_data(event, event_id, many=False):
     model = MODEL_MAPPER.get(event)
     if many:
@@ -80,6 +97,27 @@ def get_model_data(event, event_id, many=False):
     return serializer(queryset, many=many).data
 
 
+def get_event_webhooks(slug, event):
+    webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
+
+    if event == "project":
+        webhooks = webhooks.filter(project=True)
+
+    if event == "issue":
+        webhooks = webhooks.filter(issue=True)
+
+    if event == "module" or event == "module_issue":
+        webhooks = webhooks.filter(module=True)
+
+    if event == "cycle" or event == "cycle_issue":
+        webhooks = webhooks.filter(cycle=True)
+
+    if event == "issue_comment":
+        webhooks = webhooks.filter(issue_comment=True)
+
+    return webhooks
+
+
 @shared_task(
     bind=True,
     autoretry_for=(requests.RequestException,),
@@ -131,7 +169,7 @@ def webhook_task(self, webhook, slug, event, event_data, action, current_site):
             headers["X-Plane-Signature"] = signature
 
         # Send the webhook event
-        response = requests.post(
+        response = get_webhook_session().post(
             webhook.url,
             headers=headers,
             json=payload,
@@ -264,6 +302,7 @@ def webhook_send_task(
     action,
     current_site,
     activity,
+    activities=None,
 ):
     try:
         webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
@@ -288,6 +327,12 @@ def webhook_send_task(
             else None
         )
 
+        activities = (
+            json.loads(json.dumps(activities, cls=DjangoJSONEncoder))
+            if activities is not None
+            else None
+        )
+
         action = {
             "POST": "create",
             "PATCH": "update",
@@ -304,6 +349,10 @@ def webhook_send_task(
             "activity": activity,
         }
 
+        # Batched deliveries carry every coalesced activity of the entity
+        if activities is not None:
+            payload["activities"] = activities
+
         # Use HMAC for generating signature
         if webhook.secret_key:
             hmac_signature = hmac.new(
@@ -315,7 +364,7 @@ def webhook_send_task(
             headers["X-Plane-Signature"] = signature
 
         # Send the webhook event
-        response = requests.post(
+        response = get_webhook_session().post(
             webhook.url,
             headers=headers,
             json=payload,
@@ -371,8 +420,7 @@ def webhook_send_task(
         return
 
 
-@shared_task
-def webhook_activity(
+def queue_webhook_activity(
     event,
     verb,
     field,
@@ -385,44 +433,118 @@ def webhook_activity(
     old_identifier,
     new_identifier,
 ):
-    try:
-        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
+    """
+    Buffer the activity of an entity and schedule a single flush for all
+    the activities of the same (workspace, event, entity) received within
+    the batch window
+    """
+    ri = redis_instance()
+    window = settings.WEBHOOK_BATCH_WINDOW
+    key = f"webhook_batch:{slug}:{event}:{event_id}"
+
+    ri.rpush(
+        key,
+        json.dumps(
+            {
+                "verb": verb,
+                "field": field,
+                "old_value": old_value,
+                "new_value": new_value,
+                "actor_id": actor_id,
+                "old_identifier": old_identifier,
+                "new_identifier": new_identifier,
+            },
+            cls=DjangoJSONEncoder,
+        ),
+    )
+    ri.expire(key, window * 10)
+
+    # Only the first activity of the window schedules the flush
+    if ri.set(f"{key}:scheduled", 1, nx=True, ex=window * 10):
+        webhook_batch_activity.apply_async(
+            kwargs={
+                "slug": slug,
+                "event": event,
+                "event_id": str(event_id),
+                "current_site": current_site,
+            },
+            countdown=window,
+        )
 
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
 
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
+@shared_task
+def webhook_batch_activity(slug, event, event_id, current_site):
+    try:
+        ri = redis_instance()
+        key = f"webhook_batch:{slug}:{event}:{event_id}"
+
+        # Release the schedule before draining so that activities pushed
+        # from now on schedule a new flush instead of being stranded
+        ri.delete(f"{key}:scheduled")
+        pipe = ri.pipeline()
+        pipe.lrange(key, 0, -1)
+        pipe.delete(key)
+        activities = [json.loads(item) for item in pipe.execute()[0]]
+
+        if not activities:
+            return
 
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
+        webhooks = list(get_event_webhooks(slug=slug, event=event))
+        if not webhooks:
+            return
 
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
+        # Serialize the entity and every actor only once for the batch
+        event_data = get_model_data(event=event, event_id=event_id)
+        actors = {
+            str(actor["id"]): actor
+            for actor in get_model_data(
+                event="user",
+                event_id={activity["actor_id"] for activity in activities},
+                many=True,
+            )
+        }
 
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
+        activities = [
+            {
+                "action": activity["verb"],
+                "field": activity["field"],
+                "new_value": activity["new_value"],
+                "old_value": activity["old_value"],
+                "actor": actors.get(str(activity["actor_id"])),
+                "old_identifier": activity["old_identifier"],
+                "new_identifier": activity["new_identifier"],
+            }
+            for activity in activities
+        ]
 
         for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=get_model_data(
+            if webhook.is_batched:
+                webhook_send_task.delay(
+                    webhook=webhook.id,
+                    slug=slug,
                     event=event,
-                    event_id=event_id,
-                ),
-                action=verb,
-                current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
-                },
-            )
+                    event_data=event_data,
+                    action="batch",
+                    current_site=current_site,
+                    activity=None,
+                    activities=activities,
+                )
+                continue
+
+            for activity in activities:
+                webhook_send_task.delay(
+                    webhook=webhook.id,
+                    slug=slug,
+                    event=event,
+                    event_data=event_data,
+                    action=activity["action"],
+                    current_site=current_site,
+                    activity={
+                        key: value
+                        for key, value in activity.items()
+                        if key != "action"
+                    },
+                )
         return
     except Exception as e:
         # Return if a does not exist error occurs
@@ -434,6 +556,42 @@ def webhook_activity(
         return
 
 
+@shared_task
+def webhook_activity(
+    event,
+    verb,
+    field,
+    old_value,
+    new_value,
+    actor_id,
+    slug,
+    current_site,
+    event_id,
+    old_identifier,
+    new_identifier,
+):
+    try:
+        queue_webhook_activity(
+            event=event,
+            verb=verb,
+            field=field,
+            old_value=old_value,
+            new_value=new_value,
+            actor_id=actor_id,
+            slug=slug,
+            current_site=current_site,
+            event_id=event_id,
+            old_identifier=old_identifier,
+            new_identifier=new_identifier,
+        )
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        log_exception(e)
+        return
+
+
 @shared_task
 def model_activity(
     model_name,
@@ -446,7 +604,7 @@ def model_activity(
 ):
     """Function takes in two json and computes differences between keys of both the json"""
     if current_instance is None:
-        webhook_activity.delay(
+        queue_webhook_activity(
             event=model_name,
             verb="created",
             field=None,
@@ -473,7 +631,7 @@ def model_activity(
             current_value = current_instance.get(key, None)
             requested_value = requested_data.get(key, None)
             if current_value != requested_value:
-                webhook_activity.delay(
+                queue_webhook_activity(
                     event=model_name,
                     verb="updated",
                     field=key,
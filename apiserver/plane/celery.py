@@ -40,6 +40,14 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.api_logs_task.delete_api_logs",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-hour-to-reconcile-notification-counters": {
+        "task": "plane.bgtasks.notification_counter_task.reconcile_notification_counters",
+        "schedule": crontab(minute=0),
+    },
+    "check-every-day-to-delete-issue-changes": {
+        "task": "plane.bgtasks.issue_change_task.delete_old_issue_changes",
+        "schedule": crontab(hour=0, minute=0),
+    },
     "run-every-6-hours-for-instance-trace": {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6"),
@@ -0,0 +1,117 @@
+# Python imports
+import random
+import statistics
+import time
+from datetime import timedelta
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, Module
+from plane.utils.analytics_plot import burndown_plot, cumulative_burndown
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the burndown series, built in memory over a range of days "
+        "with the given number of completions, and when a module id is "
+        "given the burndown of that module in issues and points mode"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("module_id", type=str, nargs="?", help="Module id")
+        parser.add_argument(
+            "--runs", type=int, default=5, help="Number of timed runs"
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Days of the in memory range",
+        )
+        parser.add_argument(
+            "--issues",
+            type=int,
+            default=10000,
+            help="Completed issues spread over the in memory range",
+        )
+
+    def time_series(self, days, issues, runs):
+        start_date = timezone.now().date() - timedelta(days=days - 1)
+        date_range = [start_date + timedelta(days=x) for x in range(days)]
+        per_day = {}
+        for _ in range(issues):
+            date = random.choice(date_range)
+            per_day[date] = per_day.get(date, 0) + 1
+        completions = sorted(per_day.items())
+
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            cumulative_burndown(date_range, completions, issues)
+            times.append((time.perf_counter() - start) * 1000)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"In memory: {days} days, {issues} completed issues, "
+                f"median {statistics.median(times):.2f} ms"
+            )
+        )
+
+    def time_module(self, module_id, runs):
+        module = (
+            Module.objects.filter(pk=module_id)
+            .select_related("workspace")
+            .first()
+        )
+        if module is None:
+            raise CommandError("Module does not exist")
+        if not module.start_date or not module.target_date:
+            raise CommandError("Module needs a start and a target date")
+
+        module.total_issues = Issue.issue_objects.filter(
+            issue_module__module_id=module.id,
+            issue_module__deleted_at__isnull=True,
+        ).count()
+        days = (module.target_date - module.start_date).days + 1
+
+        for plot_type in ("issues", "points"):
+            wall_times, db_times, query_counts = [], [], []
+            for _ in range(runs):
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    burndown_plot(
+                        queryset=module,
+                        slug=module.workspace.slug,
+                        project_id=module.project_id,
+                        plot_type=plot_type,
+                        module_id=module.id,
+                    )
+                    wall_times.append((time.perf_counter() - start) * 1000)
+                db_times.append(
+                    sum(float(query["time"]) for query in queries) * 1000
+                )
+                query_counts.append(len(queries))
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Module {plot_type}: {days} days, "
+                    f"{module.total_issues} issues, "
+                    f"{max(query_counts)} queries, "
+                    f"median {statistics.median(wall_times):.1f} ms total, "
+                    f"median {statistics.median(db_times):.1f} ms in the "
+                    f"database"
+                )
+            )
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1 or options["days"] < 1:
+            raise CommandError("Runs and days must be positive")
+
+        self.time_series(options["days"], options["issues"], options["runs"])
+        if options["module_id"]:
+            self.time_module(options["module_id"], options["runs"])
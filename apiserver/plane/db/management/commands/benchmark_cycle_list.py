@@ -0,0 +1,73 @@
+# Python imports
+import statistics
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Third party imports
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Module imports
+from plane.db.models import Project, ProjectMember
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the cycle list of a project, seed one with create_dummy_data "
+        "to compare changes to the cycle queries"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=str, help="Project id")
+        parser.add_argument(
+            "--runs", type=int, default=5, help="Number of timed requests"
+        )
+
+    def handle(self, *args, **options):
+        from plane.app.views import CycleViewSet
+
+        project = Project.objects.filter(pk=options["project_id"]).first()
+        member = (
+            ProjectMember.objects.filter(
+                project=project, is_active=True, role=20
+            )
+            .select_related("member")
+            .first()
+        )
+        if project is None or member is None:
+            raise CommandError("Project with an active admin is required")
+
+        view = CycleViewSet.as_view({"get": "list"})
+        path = (
+            f"/api/workspaces/{project.workspace.slug}/projects/"
+            f"{project.id}/cycles/"
+        )
+
+        wall_times, db_times, query_counts = [], [], []
+        for _ in range(options["runs"]):
+            request = APIRequestFactory().get(path)
+            force_authenticate(request, user=member.member)
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = view(
+                    request,
+                    slug=project.workspace.slug,
+                    project_id=project.id,
+                )
+                wall_times.append((time.perf_counter() - start) * 1000)
+            db_times.append(
+                sum(float(query["time"]) for query in queries) * 1000
+            )
+            query_counts.append(len(queries))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(response.data)} cycles, "
+                f"{max(query_counts)} queries, "
+                f"median {statistics.median(wall_times):.1f} ms total, "
+                f"median {statistics.median(db_times):.1f} ms in the database"
+            )
+        )
@@ -0,0 +1,150 @@
+# Python imports
+import socketserver
+import threading
+import time
+
+# Django imports
+from django.core.mail import get_connection
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.email_notification_task import send_receiver_emails
+from plane.db.models import Issue, ProjectMember
+from plane.settings.redis import redis_instance
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Accept every message, counting the connections and messages"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.server.count("connections")
+        self.reply("220 localhost")
+        for line in self.rfile:
+            command = line.strip().split(b" ", 1)[0].upper()
+            if command in (b"EHLO", b"HELO"):
+                self.reply("250 localhost")
+            elif command == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                self.server.count("messages")
+                self.reply("250 OK")
+            elif command == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPSinkHandler)
+        self.lock = threading.Lock()
+        self.counts = {"connections": 0, "messages": 0}
+
+    def count(self, key):
+        with self.lock:
+            self.counts[key] += 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the email digests of the members of a project against a "
+        "local SMTP stand-in, nothing is written to the notification logs"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=str, help="Project id")
+        parser.add_argument(
+            "--issues",
+            type=int,
+            default=20,
+            help="Issues in the digest of every receiver",
+        )
+        parser.add_argument(
+            "--receivers", type=int, default=10, help="Number of receivers"
+        )
+
+    def handle(self, *args, **options):
+        members = list(
+            ProjectMember.objects.filter(
+                project_id=options["project_id"], is_active=True
+            ).values_list("member_id", flat=True)[: options["receivers"]]
+        )
+        issues = list(
+            Issue.issue_objects.filter(
+                project_id=options["project_id"]
+            ).values_list("id", flat=True)[: options["issues"]]
+        )
+        if not members or not issues:
+            raise CommandError("Project with members and issues is required")
+
+        # The digests skip the issues without a base api
+        ri = redis_instance()
+        for issue_id in issues:
+            ri.set(str(issue_id), "http://localhost", ex=60 * 10, nx=True)
+
+        activity_time = timezone.now().isoformat()
+        emails = [
+            {
+                "issue_id": str(issue_id),
+                "notification_data": {
+                    str(members[0]): [
+                        {
+                            "issue_activity": {
+                                "field": "priority",
+                                "old_value": "none",
+                                "new_value": "high",
+                                "activity_time": activity_time,
+                            }
+                        }
+                    ]
+                },
+                "email_notification_ids": [],
+            }
+            for issue_id in issues
+        ]
+
+        sink = SMTPSink()
+        threading.Thread(target=sink.serve_forever, daemon=True).start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                sent = sum(
+                    send_receiver_emails(
+                        member_id,
+                        emails,
+                        connection=get_connection(
+                            "django.core.mail.backends.smtp.EmailBackend",
+                            host="127.0.0.1",
+                            port=sink.server_address[1],
+                            username="",
+                            password="",
+                            use_tls=False,
+                            use_ssl=False,
+                        ),
+                    )
+                    for member_id in members
+                )
+                elapsed = time.perf_counter() - start
+        finally:
+            sink.shutdown()
+            sink.server_close()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{sent} emails to {len(members)} receivers in "
+                f"{elapsed:.2f} s ({sent / elapsed:.0f} emails/s), "
+                f"{sink.counts['connections']} SMTP connections, "
+                f"{len(queries)} queries"
+            )
+        )
@@ -0,0 +1,105 @@
+# Python imports
+import statistics
+import threading
+import time
+import uuid
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+
+# Module imports
+from plane.db.models import Issue, Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Time parallel issue creates in one project, which all allocate "
+        "their sequence id from the counter row of the project. Use a "
+        "scratch project, the ids used by the run are not given back"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=str, help="Project id")
+        parser.add_argument(
+            "--threads",
+            type=int,
+            nargs="+",
+            default=[1, 8],
+            help="Numbers of concurrent creators to compare",
+        )
+        parser.add_argument(
+            "--issues",
+            type=int,
+            default=50,
+            help="Issues created by every creator",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the created issues instead of deleting them",
+        )
+
+    def create_issues(self, project, run, count, latencies, issue_ids):
+        try:
+            for index in range(count):
+                start = time.perf_counter()
+                issue = Issue.objects.create(
+                    name=f"Benchmark {run} {index}", project=project
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+                issue_ids.append(issue.id)
+        finally:
+            # Every thread holds its own connection
+            connection.close()
+
+    def handle(self, *args, **options):
+        project = Project.objects.filter(pk=options["project_id"]).first()
+        if project is None:
+            raise CommandError("Project does not exist")
+
+        for threads in options["threads"]:
+            latencies, issue_ids = [], []
+            run = uuid.uuid4().hex[:8]
+            creators = [
+                threading.Thread(
+                    target=self.create_issues,
+                    args=(
+                        project,
+                        run,
+                        options["issues"],
+                        latencies,
+                        issue_ids,
+                    ),
+                )
+                for _ in range(threads)
+            ]
+
+            start = time.perf_counter()
+            for creator in creators:
+                creator.start()
+            for creator in creators:
+                creator.join()
+            elapsed = time.perf_counter() - start
+
+            sequences = list(
+                Issue.all_objects.filter(pk__in=issue_ids).values_list(
+                    "sequence_id", flat=True
+                )
+            )
+            duplicates = len(sequences) - len(set(sequences))
+            if not options["keep"]:
+                Issue.all_objects.filter(pk__in=issue_ids).delete()
+
+            if not latencies:
+                raise CommandError("No issue was created")
+            p95 = sorted(latencies)[max(int(len(latencies) * 0.95) - 1, 0)]
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{threads} creators: {len(issue_ids)} issues in "
+                    f"{elapsed:.2f} s ({len(issue_ids) / elapsed:.0f} "
+                    f"issues/s), median "
+                    f"{statistics.median(latencies):.1f} ms, "
+                    f"p95 {p95:.1f} ms, {duplicates} duplicate sequence ids"
+                )
+            )
@@ -0,0 +1,28 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.cache import get_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Print the response cache hit, miss and eviction counters"
+
+    def handle(self, *args, **options):
+        try:
+            stats = get_cache_stats()
+        except Exception:
+            self.stdout.write(self.style.ERROR("Failed to fetch cache stats"))
+            return
+
+        hits = stats.get("hits", 0)
+        misses = stats.get("misses", 0)
+        total = hits + misses
+        for stat in ["hits", "misses", "invalidations", "evictions"]:
+            self.stdout.write(f"{stat}: {stats.get(stat, 0)}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"hit ratio: {hits / total if total else 0:.2%}"
+            )
+        )
+        return
@@ -0,0 +1,46 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.bgtasks.search_index_task import index_search_document
+from plane.db.models import Cycle, Issue, IssueView, Module, Page
+from plane.db.models.recent_visit import EntityNameEnum
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the full text search index of the workspace entities. The "
+        "index of existing data is built by the 0093 migration, run this "
+        "when documents drifted, e.g. after a restore or a raw SQL import"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workspace", type=str, nargs="?", help="Workspace slug"
+        )
+
+    def handle(self, *args, **options):
+        workspace = options["workspace"]
+        entities = [
+            (EntityNameEnum.ISSUE, Issue.issue_objects),
+            (EntityNameEnum.PAGE, Page.objects),
+            (EntityNameEnum.CYCLE, Cycle.objects),
+            (EntityNameEnum.MODULE, Module.objects),
+            (EntityNameEnum.VIEW, IssueView.objects),
+        ]
+
+        for entity_name, manager in entities:
+            queryset = manager.all()
+            if workspace:
+                queryset = queryset.filter(workspace__slug=workspace)
+
+            count = 0
+            for entity_identifier in queryset.values_list(
+                "id", flat=True
+            ).iterator(chunk_size=2000):
+                index_search_document(entity_name, entity_identifier)
+                count += 1
+
+            self.stdout.write(
+                self.style.SUCCESS(f"Indexed {count} {entity_name.label}s")
+            )
@@ -0,0 +1,58 @@
+# Django imports
+from django.core.management import BaseCommand
+from django.db import transaction
+
+# Module imports
+from plane.db.models import Issue, IssueCounter
+from plane.db.models.issue_counter import ISSUE_COUNT_FIELDS
+
+
+class Command(BaseCommand):
+    help = "Recount the issue counters and fix the ones which drifted"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workspace", type=str, nargs="?", help="Workspace slug"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of issues recounted per transaction",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Issue.all_objects.all()
+        if options["workspace"]:
+            queryset = queryset.filter(workspace__slug=options["workspace"])
+
+        issue_ids = list(queryset.order_by().values_list("id", flat=True))
+        chunk_size = options["chunk_size"]
+
+        drifted = 0
+        for index in range(0, len(issue_ids), chunk_size):
+            chunk = issue_ids[index : index + chunk_size]
+            with transaction.atomic():
+                stored = {
+                    row[0]: row[1:]
+                    for row in IssueCounter.all_objects.filter(
+                        issue_id__in=chunk
+                    ).values_list("issue_id", "cycle_id", *ISSUE_COUNT_FIELDS)
+                }
+                rows = [
+                    row
+                    for row in IssueCounter.compute(chunk)
+                    if stored.get(row["id"])
+                    != (
+                        row["cycle_id"],
+                        *(row[field] or 0 for field in ISSUE_COUNT_FIELDS),
+                    )
+                ]
+                IssueCounter.store(rows)
+            drifted += len(rows)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recounted {len(issue_ids)} issues, fixed {drifted} counters"
+            )
+        )
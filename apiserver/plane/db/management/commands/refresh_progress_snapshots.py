@@ -0,0 +1,36 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.db.models import Cycle, Module
+from plane.utils.progress_snapshot import refresh_progress_snapshot
+
+
+class Command(BaseCommand):
+    help = "Refresh the progress snapshots of the cycles and modules"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workspace", type=str, nargs="?", help="Workspace slug"
+        )
+
+    def handle(self, *args, **options):
+        workspace = options["workspace"]
+
+        for key, model in (("cycle_id", Cycle), ("module_id", Module)):
+            queryset = model.objects.filter(archived_at__isnull=True)
+            if workspace:
+                queryset = queryset.filter(workspace__slug=workspace)
+
+            count = 0
+            for entity_id in queryset.values_list("id", flat=True).iterator(
+                chunk_size=2000
+            ):
+                refresh_progress_snapshot(**{key: entity_id})
+                count += 1
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Refreshed {count} {model._meta.verbose_name_plural}"
+                )
+            )
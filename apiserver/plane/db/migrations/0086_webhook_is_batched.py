@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0085_intake_intakeissue_remove_inboxissue_created_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhook',
+            name='is_batched',
+            field=models.BooleanField(default=False),
+        ),
+    ]
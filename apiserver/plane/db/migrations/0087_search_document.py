@@ -0,0 +1,50 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:39
+
+from django.conf import settings
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0086_webhook_is_batched'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('entity_name', models.CharField(choices=[('VIEW', 'View'), ('PAGE', 'Page'), ('ISSUE', 'Issue'), ('CYCLE', 'Cycle'), ('MODULE', 'Module'), ('PROJECT', 'Project')], max_length=30)),
+                ('entity_identifier', models.UUIDField()),
+                ('name', models.TextField()),
+                ('identifier', models.CharField(blank=True, default='', max_length=255)),
+                ('content', models.TextField(blank=True, default='')),
+                ('project_ids', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, size=None)),
+                ('metadata', models.JSONField(default=dict)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'db_table': 'search_documents',
+                'ordering': ('-created_at',),
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='search_doc_vector_idx'), django.contrib.postgres.indexes.GinIndex(fields=['name'], name='search_doc_name_trgm_idx', opclasses=['gin_trgm_ops']), django.contrib.postgres.indexes.GinIndex(fields=['project_ids'], name='search_doc_project_ids_idx')],
+                'unique_together': {('entity_name', 'entity_identifier')},
+            },
+        ),
+    ]
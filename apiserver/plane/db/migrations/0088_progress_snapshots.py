@@ -0,0 +1,80 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:44
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0087_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressDailySnapshot',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('total_issues', models.IntegerField(default=0)),
+                ('completed_issues', models.IntegerField(default=0)),
+                ('total_estimate_points', models.FloatField(default=0)),
+                ('completed_estimate_points', models.FloatField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_daily_snapshots', to='db.cycle')),
+                ('module', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_daily_snapshots', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Progress Daily Snapshot',
+                'verbose_name_plural': 'Progress Daily Snapshots',
+                'db_table': 'progress_daily_snapshots',
+                'ordering': ('-date',),
+            },
+        ),
+        migrations.CreateModel(
+            name='ProgressSnapshot',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('dimension', models.CharField(choices=[('state_group', 'State Group'), ('assignee', 'Assignee'), ('label', 'Label')], max_length=20)),
+                ('state_group', models.CharField(max_length=20, null=True)),
+                ('total_issues', models.IntegerField(default=0)),
+                ('completed_issues', models.IntegerField(default=0)),
+                ('total_estimate_points', models.FloatField(default=0)),
+                ('completed_estimate_points', models.FloatField(default=0)),
+                ('assignee', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to=settings.AUTH_USER_MODEL)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='db.cycle')),
+                ('label', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='db.label')),
+                ('module', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Progress Snapshot',
+                'verbose_name_plural': 'Progress Snapshots',
+                'db_table': 'progress_snapshots',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['cycle', 'dimension'], name='progress_snap_cycle_idx'), models.Index(fields=['module', 'dimension'], name='progress_snap_module_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='progressdailysnapshot',
+            constraint=models.UniqueConstraint(condition=models.Q(('cycle__isnull', False), ('deleted_at__isnull', True)), fields=('cycle', 'date'), name='progress_daily_snapshot_unique_cycle_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='progressdailysnapshot',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True), ('module__isnull', False)), fields=('module', 'date'), name='progress_daily_snapshot_unique_module_date'),
+        ),
+    ]
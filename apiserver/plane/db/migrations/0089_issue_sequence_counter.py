@@ -0,0 +1,71 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def seed_issue_sequence_counters(apps, schema_editor):
+    Project = apps.get_model("db", "Project")
+    IssueSequence = apps.get_model("db", "IssueSequence")
+    IssueSequenceCounter = apps.get_model("db", "IssueSequenceCounter")
+
+    last_sequences = dict(
+        IssueSequence.objects.values("project_id")
+        .annotate(largest=models.Max("sequence"))
+        .values_list("project_id", "largest")
+        .order_by()
+    )
+
+    IssueSequenceCounter.objects.bulk_create(
+        [
+            IssueSequenceCounter(
+                project_id=project_id,
+                workspace_id=workspace_id,
+                last_sequence=last_sequences.get(project_id) or 0,
+            )
+            for project_id, workspace_id in Project.objects.values_list(
+                "id", "workspace_id"
+            )
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0088_progress_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueSequenceCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Sequence Counter',
+                'verbose_name_plural': 'Issue Sequence Counters',
+                'db_table': 'issue_sequence_counters',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='issuesequencecounter',
+            constraint=models.UniqueConstraint(fields=('project',), name='issue_sequence_counter_unique_project'),
+        ),
+        migrations.RunPython(
+            seed_issue_sequence_counters,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
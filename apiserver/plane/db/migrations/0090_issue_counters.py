@@ -0,0 +1,122 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:57
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def seed_issue_counters(apps, schema_editor):
+    Issue = apps.get_model("db", "Issue")
+    IssueLink = apps.get_model("db", "IssueLink")
+    FileAsset = apps.get_model("db", "FileAsset")
+    CycleIssue = apps.get_model("db", "CycleIssue")
+    IssueCounter = apps.get_model("db", "IssueCounter")
+
+    def count(queryset):
+        return (
+            queryset.order_by()
+            .annotate(count=models.Func(models.F("id"), function="Count"))
+            .values("count")
+        )
+
+    sub_issues = Issue._default_manager.filter(
+        models.Q(issue_intake__status__in=[1, -1, 2])
+        | models.Q(issue_intake__isnull=True),
+        parent=models.OuterRef("id"),
+        deleted_at__isnull=True,
+        state__is_triage=False,
+        archived_at__isnull=True,
+        project__archived_at__isnull=True,
+        is_draft=False,
+    )
+
+    issues = (
+        Issue._default_manager.annotate(
+            cycle=models.Subquery(
+                CycleIssue.objects.filter(
+                    issue=models.OuterRef("id"), deleted_at__isnull=True
+                )
+                .order_by("-created_at")
+                .values("cycle_id")[:1]
+            ),
+            links=count(
+                IssueLink.objects.filter(
+                    issue=models.OuterRef("id"), deleted_at__isnull=True
+                )
+            ),
+            attachments=count(
+                FileAsset.objects.filter(
+                    issue_id=models.OuterRef("id"),
+                    entity_type="ISSUE_ATTACHMENT",
+                    deleted_at__isnull=True,
+                )
+            ),
+            sub_issues=count(sub_issues),
+        )
+        .order_by()
+        .values_list(
+            "id",
+            "project_id",
+            "workspace_id",
+            "cycle",
+            "links",
+            "attachments",
+            "sub_issues",
+        )
+    )
+
+    counters = []
+    for row in issues.iterator(chunk_size=2000):
+        counters.append(
+            IssueCounter(
+                issue_id=row[0],
+                project_id=row[1],
+                workspace_id=row[2],
+                cycle_id=row[3],
+                link_count=row[4] or 0,
+                attachment_count=row[5] or 0,
+                sub_issues_count=row[6] or 0,
+            )
+        )
+        if len(counters) == 2000:
+            IssueCounter.objects.bulk_create(counters)
+            counters = []
+    IssueCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0089_issue_sequence_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('link_count', models.PositiveIntegerField(default=0)),
+                ('attachment_count', models.PositiveIntegerField(default=0)),
+                ('sub_issues_count', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='issue_counters', to='db.cycle')),
+                ('issue', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='counter', to='db.issue')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Counter',
+                'verbose_name_plural': 'Issue Counters',
+                'db_table': 'issue_counters',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.RunPython(
+            seed_issue_counters, reverse_code=migrations.RunPython.noop
+        ),
+    ]
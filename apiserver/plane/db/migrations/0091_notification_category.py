@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:00
+
+from django.db import migrations, models
+
+
+def backfill_notification_category(apps, schema_editor):
+    Notification = apps.get_model("db", "Notification")
+    for category in ["created", "assigned", "subscribed", "mentioned"]:
+        Notification.objects.filter(
+            sender__endswith=f":{category}"
+        ).update(category=category)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0090_issue_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='category',
+            field=models.CharField(blank=True, choices=[('created', 'Created'), ('assigned', 'Assigned'), ('subscribed', 'Subscribed'), ('mentioned', 'Mentioned')], max_length=20, null=True),
+        ),
+        migrations.RunPython(
+            backfill_notification_category,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True), ('deleted_at__isnull', True), ('read_at__isnull', True), ('snoozed_till__isnull', True)), fields=['receiver', 'workspace', 'category'], name='notification_unread_idx'),
+        ),
+    ]
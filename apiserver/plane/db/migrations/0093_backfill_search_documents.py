@@ -0,0 +1,201 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:30
+
+from itertools import groupby
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+# Search documents are kept in sync by the signals of the entities, the
+# documents of the rows created before them are built here. The
+# rebuild_search_index command rebuilds them the same way later on
+
+
+def seed_search_documents(apps, schema_editor):
+    Issue = apps.get_model("db", "Issue")
+    IssueComment = apps.get_model("db", "IssueComment")
+    ProjectPage = apps.get_model("db", "ProjectPage")
+    SearchDocument = apps.get_model("db", "SearchDocument")
+
+    def store(documents):
+        documents = iter(documents)
+        while True:
+            batch = [
+                SearchDocument(**document)
+                for _, document in zip(range(2000), documents)
+            ]
+            if not batch:
+                return
+            # Rows indexed by the signals since the deploy are kept
+            SearchDocument.objects.bulk_create(batch, ignore_conflicts=True)
+
+    comments = (
+        IssueComment.objects.filter(
+            issue=models.OuterRef("id"), deleted_at__isnull=True
+        )
+        .exclude(comment_stripped__isnull=True)
+        .exclude(comment_stripped="")
+        .order_by()
+        .values("issue")
+        .annotate(
+            text=StringAgg(
+                "comment_stripped", delimiter="\n", ordering="-created_at"
+            )
+        )
+        .values("text")
+    )
+    issues = (
+        Issue._default_manager.filter(
+            models.Q(issue_intake__status__in=[1, -1, 2])
+            | models.Q(issue_intake__isnull=True),
+            deleted_at__isnull=True,
+            state__is_triage=False,
+            archived_at__isnull=True,
+            project__archived_at__isnull=True,
+            is_draft=False,
+        )
+        .annotate(comments=models.Subquery(comments))
+        .order_by()
+        .values_list(
+            "id",
+            "workspace_id",
+            "project_id",
+            "project__identifier",
+            "name",
+            "sequence_id",
+            "description_stripped",
+            "comments",
+        )
+    )
+    store(
+        {
+            "entity_name": "ISSUE",
+            "entity_identifier": issue_id,
+            "workspace_id": workspace_id,
+            "project_id": project_id,
+            "name": name,
+            "identifier": f"{project_identifier}-{sequence_id}",
+            "content": "\n".join(
+                [description or "", *filter(None, [comments])]
+            ),
+            "project_ids": [project_id],
+            "metadata": {
+                "sequence_id": sequence_id,
+                "project_id": str(project_id),
+                "project__identifier": project_identifier,
+            },
+        }
+        for (
+            issue_id,
+            workspace_id,
+            project_id,
+            project_identifier,
+            name,
+            sequence_id,
+            description,
+            comments,
+        ) in issues.iterator(chunk_size=2000)
+    )
+
+    # Pages are indexed once with all of their projects
+    project_pages = (
+        ProjectPage.objects.filter(
+            deleted_at__isnull=True, page__deleted_at__isnull=True
+        )
+        .order_by("page_id")
+        .values_list(
+            "page_id",
+            "page__workspace_id",
+            "page__name",
+            "page__description_stripped",
+            "project_id",
+            "project__identifier",
+        )
+    )
+
+    def page_documents():
+        for page_id, rows in groupby(
+            project_pages.iterator(chunk_size=2000), key=lambda row: row[0]
+        ):
+            rows = list(rows)
+            yield {
+                "entity_name": "PAGE",
+                "entity_identifier": page_id,
+                "workspace_id": rows[0][1],
+                "project_id": None,
+                "name": rows[0][2] or "",
+                "identifier": "",
+                "content": rows[0][3] or "",
+                "project_ids": [row[4] for row in rows],
+                "metadata": {
+                    "project_ids": [str(row[4]) for row in rows],
+                    "project_identifiers": [row[5] for row in rows],
+                },
+            }
+
+    store(page_documents())
+
+    for entity_name, model_name in (
+        ("CYCLE", "Cycle"),
+        ("MODULE", "Module"),
+        ("VIEW", "IssueView"),
+    ):
+        entities = (
+            apps.get_model("db", model_name)
+            .objects.filter(deleted_at__isnull=True, project__isnull=False)
+            .order_by()
+            .values_list(
+                "id",
+                "workspace_id",
+                "project_id",
+                "project__identifier",
+                "name",
+                "description",
+            )
+        )
+        store(
+            {
+                "entity_name": entity_name,
+                "entity_identifier": entity_id,
+                "workspace_id": workspace_id,
+                "project_id": project_id,
+                "name": name,
+                "identifier": project_identifier,
+                "content": description or "",
+                "project_ids": [project_id],
+                "metadata": {
+                    "project_id": str(project_id),
+                    "project__identifier": project_identifier,
+                },
+            }
+            for (
+                entity_id,
+                workspace_id,
+                project_id,
+                project_identifier,
+                name,
+                description,
+            ) in entities.iterator(chunk_size=2000)
+        )
+
+    # Build the weighted vectors of the new documents in one statement
+    SearchDocument.objects.filter(search_vector__isnull=True).update(
+        search_vector=(
+            SearchVector("name", weight="A", config="simple")
+            + SearchVector("identifier", weight="A", config="simple")
+            + SearchVector("content", weight="B", config="simple")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0092_issue_changes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            seed_search_documents, reverse_code=migrations.RunPython.noop
+        ),
+    ]
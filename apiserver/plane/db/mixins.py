@@ -3,7 +3,10 @@ from django.db import models
 from django.utils import timezone
 
 # Module imports
-from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.bgtasks.deletion_task import (
+    deleted_at_values,
+    soft_delete_related_objects,
+)
 
 
 class TimeAuditModel(models.Model):
@@ -46,7 +49,8 @@ class UserAuditModel(models.Model):
 class SoftDeletionQuerySet(models.QuerySet):
     def delete(self, soft=True):
         if soft:
-            return self.update(deleted_at=timezone.now())
+            # Move updated_at as the soft delete of an instance does
+            return self.update(**deleted_at_values(self.model, timezone.now()))
         else:
             return super().delete()
 
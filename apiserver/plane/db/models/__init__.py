@@ -39,6 +39,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
 )
@@ -99,6 +100,7 @@ from .analytic import AnalyticView
 
 from .notification import (
     Notification,
+    NotificationCategory,
     UserNotificationPreference,
     EmailNotificationLog,
 )
@@ -115,6 +117,18 @@ from .issue_type import IssueType
 
 from .recent_visit import UserRecentVisit
 
+from .search import SearchDocument
+
+from .issue_counter import IssueCounter
+
+from .issue_change import IssueChange
+
+from .progress import (
+    ProgressDailySnapshot,
+    ProgressDimension,
+    ProgressSnapshot,
+)
+
 from .label import Label
 
 from .device import Device, DeviceSession
@@ -6,7 +6,7 @@ from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.utils import timezone
 from django.db.models import Q
 
@@ -181,6 +181,15 @@ class Issue(ProjectBaseModel):
         db_table = "issues"
         ordering = ("-created_at",)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kept to recount the sub issues of the parent it is moved from
+        instance._loaded_parent_id = instance.__dict__.get("parent_id")
+        # Kept to leave a tombstone in the project it is moved from
+        instance._loaded_project_id = instance.__dict__.get("project_id")
+        return instance
+
     def save(self, *args, **kwargs):
         if self.state is None:
             try:
@@ -213,12 +222,10 @@ class Issue(ProjectBaseModel):
 
         if self._state.adding:
             with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
+                # Only the counter row of the project is locked
+                self.sequence_id = IssueSequenceCounter.allocate(
+                    self.project_id
+                )[0]
                 # Strip the html tags using html parser
                 self.description_stripped = (
                     None
@@ -584,6 +591,61 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounter(ProjectBaseModel):
+    """Last issue sequence id allocated in a project"""
+
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project"],
+                name="issue_sequence_counter_unique_project",
+            )
+        ]
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+        ordering = ("-created_at",)
+
+    @classmethod
+    def allocate(cls, project_id, count=1):
+        """
+        Reserve count consecutive sequence ids in the project with a single
+        statement and return them as a range. The counter row stays locked
+        until the surrounding transaction ends so a rolled back allocation
+        leaves no gap
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} "
+                "SET last_sequence = last_sequence + %s, updated_at = %s "
+                "WHERE project_id = %s RETURNING last_sequence",
+                [count, timezone.now(), project_id],
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            # First allocation of the project, continue after its issues
+            last_sequence = max(
+                IssueSequence.all_objects.filter(
+                    project_id=project_id
+                ).aggregate(largest=models.Max("sequence"))["largest"]
+                or 0,
+                Issue.all_objects.filter(project_id=project_id).aggregate(
+                    largest=models.Max("sequence_id")
+                )["largest"]
+                or 0,
+            )
+            cls.objects.get_or_create(
+                project_id=project_id,
+                defaults={"last_sequence": last_sequence},
+            )
+            return cls.allocate(project_id, count)
+
+        return range(row[0] - count + 1, row[0] + 1)
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
@@ -0,0 +1,86 @@
+# Django imports
+from django.db import models
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+# Module imports
+from .issue import Issue
+from .project import ProjectBaseModel
+
+# Postgres sequence numbering the changes across every project
+ISSUE_CHANGE_SEQUENCE = "issue_change_sequence"
+
+
+class IssueChange(ProjectBaseModel):
+    """
+    Log of the issues which changed in a project, read by the changes feed
+    from a client cursor. Whether a change is an update or a tombstone is
+    decided when it is read, so deletes, archives, moves and permission
+    changes all surface the same way
+    """
+
+    sequence = models.BigIntegerField(unique=True)
+    # Tombstones outlive the issue, so no constraint and no cascade
+    issue = models.ForeignKey(
+        "db.Issue",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="changes",
+    )
+
+    class Meta:
+        verbose_name = "Issue Change"
+        verbose_name_plural = "Issue Changes"
+        db_table = "issue_changes"
+        ordering = ("sequence",)
+        indexes = [
+            models.Index(
+                fields=["project", "sequence"],
+                name="issue_change_project_seq_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.sequence} {self.issue_id}"
+
+    @classmethod
+    def record(cls, changes):
+        """Log the (project_id, workspace_id, issue_id) changes"""
+        return cls.objects.bulk_create(
+            [
+                cls(
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    issue_id=issue_id,
+                    sequence=RawSQL(
+                        f"nextval('{ISSUE_CHANGE_SEQUENCE}')", []
+                    ),
+                )
+                for project_id, workspace_id, issue_id in changes
+            ]
+        )
+
+    @classmethod
+    def record_issues(cls, issues):
+        """Log the issues written by bulk updates, which skip post_save"""
+        issues = {issue.id: issue for issue in issues}.values()
+        return cls.record(
+            [
+                (issue.project_id, issue.workspace_id, issue.id)
+                for issue in issues
+            ]
+        )
+
+
+@receiver(post_save, sender=Issue)
+def record_issue_change(sender, instance, **kwargs):
+    changes = [(instance.project_id, instance.workspace_id, instance.id)]
+
+    # The project the issue is moved from gets a tombstone
+    loaded_project_id = getattr(instance, "_loaded_project_id", None)
+    if loaded_project_id and loaded_project_id != instance.project_id:
+        changes.append(
+            (loaded_project_id, instance.workspace_id, instance.id)
+        )
+    IssueChange.record(changes)
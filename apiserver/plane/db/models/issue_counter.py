@@ -0,0 +1,147 @@
+# Django imports
+from django.db import models
+from django.db.models import F, Func, OuterRef, Subquery
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+# Module imports
+from .asset import FileAsset
+from .cycle import CycleIssue
+from .issue import Issue, IssueLink
+from .project import ProjectBaseModel
+
+# Counts denormalized on the counter
+ISSUE_COUNT_FIELDS = ("link_count", "attachment_count", "sub_issues_count")
+
+# Issue fields which change the sub issue count of the parent
+SUB_ISSUE_FIELDS = {"parent", "state", "archived_at", "is_draft", "deleted_at"}
+
+
+class IssueCounter(ProjectBaseModel):
+    """
+    Current cycle and link, attachment and sub issue counts of an issue,
+    kept in the transaction which changes them so that the issue lists
+    read them with a join instead of a subquery per row
+    """
+
+    issue = models.OneToOneField(
+        "db.Issue", on_delete=models.CASCADE, related_name="counter"
+    )
+    cycle = models.ForeignKey(
+        "db.Cycle",
+        on_delete=models.SET_NULL,
+        related_name="issue_counters",
+        null=True,
+    )
+    link_count = models.PositiveIntegerField(default=0)
+    attachment_count = models.PositiveIntegerField(default=0)
+    sub_issues_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Counter"
+        verbose_name_plural = "Issue Counters"
+        db_table = "issue_counters"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return str(self.issue_id)
+
+    @classmethod
+    def compute(cls, issue_ids):
+        """Count the cycle, links, attachments and sub issues of the issues"""
+        return (
+            Issue.all_objects.filter(pk__in=issue_ids)
+            .annotate(
+                cycle_id=Subquery(
+                    CycleIssue.objects.filter(issue=OuterRef("id")).values(
+                        "cycle_id"
+                    )[:1]
+                )
+            )
+            .annotate(
+                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
+                .order_by()
+                .annotate(count=Func(F("id"), function="Count"))
+                .values("count")
+            )
+            .annotate(
+                attachment_count=FileAsset.objects.filter(
+                    issue_id=OuterRef("id"),
+                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+                )
+                .order_by()
+                .annotate(count=Func(F("id"), function="Count"))
+                .values("count")
+            )
+            .annotate(
+                sub_issues_count=Issue.issue_objects.filter(
+                    parent=OuterRef("id")
+                )
+                .order_by()
+                .annotate(count=Func(F("id"), function="Count"))
+                .values("count")
+            )
+            .order_by()
+            .values(
+                "id",
+                "project_id",
+                "workspace_id",
+                "cycle_id",
+                *ISSUE_COUNT_FIELDS,
+            )
+        )
+
+    @classmethod
+    def store(cls, rows):
+        """Insert or overwrite the counters of the computed rows"""
+        return cls.all_objects.bulk_create(
+            [
+                cls(
+                    issue_id=row["id"],
+                    project_id=row["project_id"],
+                    workspace_id=row["workspace_id"],
+                    cycle_id=row["cycle_id"],
+                    **{field: row[field] or 0 for field in ISSUE_COUNT_FIELDS},
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["issue"],
+            update_fields=["cycle", *ISSUE_COUNT_FIELDS, "updated_at"],
+        )
+
+    @classmethod
+    def refresh(cls, issue_ids):
+        """Recount the issues in the current transaction"""
+        issue_ids = {issue_id for issue_id in issue_ids if issue_id}
+        if issue_ids:
+            cls.store(cls.compute(issue_ids))
+
+
+# Soft deletes are saves, the rows are only hard deleted after their issue
+@receiver(post_save, sender=IssueLink)
+@receiver(post_save, sender=CycleIssue)
+def refresh_related_issue_counter(sender, instance, **kwargs):
+    IssueCounter.refresh([instance.issue_id])
+
+
+@receiver(post_save, sender=FileAsset)
+def refresh_attachment_issue_counter(sender, instance, **kwargs):
+    if instance.entity_type == FileAsset.EntityTypeContext.ISSUE_ATTACHMENT:
+        IssueCounter.refresh([instance.issue_id])
+
+
+@receiver(post_save, sender=Issue)
+def refresh_issue_counters(sender, instance, created, update_fields, **kwargs):
+    if update_fields and not SUB_ISSUE_FIELDS.intersection(update_fields):
+        return
+
+    # The previous parent loses the sub issue when the parent changes
+    IssueCounter.refresh(
+        [
+            instance.id if created else None,
+            instance.parent_id,
+            getattr(instance, "_loaded_parent_id", None),
+        ]
+    )
@@ -6,6 +6,18 @@ from django.db import models
 from .base import BaseModel
 
 
+class NotificationCategory(models.TextChoices):
+    CREATED = "created", "Created"
+    ASSIGNED = "assigned", "Assigned"
+    SUBSCRIBED = "subscribed", "Subscribed"
+    MENTIONED = "mentioned", "Mentioned"
+
+
+def get_sender_category(sender):
+    """Category of a sender like in_app:issue_activities:mentioned"""
+    category = sender.rsplit(":", 1)[-1] if sender else None
+    return category if category in NotificationCategory.values else None
+
 
 class Notification(BaseModel):
     workspace = models.ForeignKey(
@@ -25,6 +37,12 @@ class Notification(BaseModel):
     message_html = models.TextField(blank=True, default="<p></p>")
     message_stripped = models.TextField(blank=True, null=True)
     sender = models.CharField(max_length=255)
+    category = models.CharField(
+        max_length=20,
+        choices=NotificationCategory.choices,
+        null=True,
+        blank=True,
+    )
     triggered_by = models.ForeignKey(
         "db.User",
         related_name="triggered_notifications",
@@ -45,11 +63,28 @@ class Notification(BaseModel):
         verbose_name_plural = "Notifications"
         db_table = "notifications"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["receiver", "workspace", "category"],
+                condition=models.Q(
+                    read_at__isnull=True,
+                    archived_at__isnull=True,
+                    snoozed_till__isnull=True,
+                    deleted_at__isnull=True,
+                ),
+                name="notification_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         """Return name of the notifications"""
         return f"{self.receiver.email} <{self.workspace.name}>"
 
+    def save(self, *args, **kwargs):
+        if self.category is None:
+            self.category = get_sender_category(self.sender)
+        super(Notification, self).save(*args, **kwargs)
+
 
 def get_default_preference():
     return {
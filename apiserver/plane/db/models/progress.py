@@ -0,0 +1,121 @@
+# Django imports
+from django.conf import settings
+from django.db import models
+
+# Module imports
+from .project import ProjectBaseModel
+
+
+class ProgressDimension(models.TextChoices):
+    STATE_GROUP = "state_group", "State Group"
+    ASSIGNEE = "assignee", "Assignee"
+    LABEL = "label", "Label"
+
+
+class ProgressSnapshot(ProjectBaseModel):
+    """
+    Current issue counts and estimate points of a cycle or module grouped
+    by state group, assignee or label
+    """
+
+    cycle = models.ForeignKey(
+        "db.Cycle",
+        on_delete=models.CASCADE,
+        related_name="progress_snapshots",
+        null=True,
+    )
+    module = models.ForeignKey(
+        "db.Module",
+        on_delete=models.CASCADE,
+        related_name="progress_snapshots",
+        null=True,
+    )
+    dimension = models.CharField(
+        max_length=20, choices=ProgressDimension.choices
+    )
+    state_group = models.CharField(max_length=20, null=True)
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="progress_snapshots",
+        null=True,
+    )
+    label = models.ForeignKey(
+        "db.Label",
+        on_delete=models.CASCADE,
+        related_name="progress_snapshots",
+        null=True,
+    )
+    total_issues = models.IntegerField(default=0)
+    completed_issues = models.IntegerField(default=0)
+    total_estimate_points = models.FloatField(default=0)
+    completed_estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        verbose_name = "Progress Snapshot"
+        verbose_name_plural = "Progress Snapshots"
+        db_table = "progress_snapshots"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["cycle", "dimension"],
+                name="progress_snap_cycle_idx",
+            ),
+            models.Index(
+                fields=["module", "dimension"],
+                name="progress_snap_module_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.cycle_id or self.module_id} {self.dimension}"
+
+
+class ProgressDailySnapshot(ProjectBaseModel):
+    """
+    Append only daily totals of a cycle or module, one row per day with
+    activity, read by the burndown charts
+    """
+
+    cycle = models.ForeignKey(
+        "db.Cycle",
+        on_delete=models.CASCADE,
+        related_name="progress_daily_snapshots",
+        null=True,
+    )
+    module = models.ForeignKey(
+        "db.Module",
+        on_delete=models.CASCADE,
+        related_name="progress_daily_snapshots",
+        null=True,
+    )
+    date = models.DateField()
+    total_issues = models.IntegerField(default=0)
+    completed_issues = models.IntegerField(default=0)
+    total_estimate_points = models.FloatField(default=0)
+    completed_estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cycle", "date"],
+                condition=models.Q(
+                    cycle__isnull=False, deleted_at__isnull=True
+                ),
+                name="progress_daily_snapshot_unique_cycle_date",
+            ),
+            models.UniqueConstraint(
+                fields=["module", "date"],
+                condition=models.Q(
+                    module__isnull=False, deleted_at__isnull=True
+                ),
+                name="progress_daily_snapshot_unique_module_date",
+            ),
+        ]
+        verbose_name = "Progress Daily Snapshot"
+        verbose_name_plural = "Progress Daily Snapshots"
+        db_table = "progress_daily_snapshots"
+        ordering = ("-date",)
+
+    def __str__(self):
+        return f"{self.cycle_id or self.module_id} {self.date}"
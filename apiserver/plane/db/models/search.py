@@ -0,0 +1,137 @@
+# Django imports
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+# Module imports
+from .cycle import Cycle
+from .issue import Issue, IssueComment
+from .module import Module
+from .page import Page, ProjectPage
+from .recent_visit import EntityNameEnum
+from .view import IssueView
+from .workspace import WorkspaceBaseModel
+
+
+class SearchDocument(WorkspaceBaseModel):
+    """
+    Denormalized full text search entry of an issue, page, cycle, module
+    or view, kept up to date by the search index task
+    """
+
+    entity_name = models.CharField(
+        max_length=30,
+        choices=EntityNameEnum.choices,
+    )
+    entity_identifier = models.UUIDField()
+    name = models.TextField()
+    identifier = models.CharField(max_length=255, blank=True, default="")
+    content = models.TextField(blank=True, default="")
+    project_ids = ArrayField(models.UUIDField(), default=list)
+    metadata = models.JSONField(default=dict)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        unique_together = ["entity_name", "entity_identifier"]
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        db_table = "search_documents"
+        ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                fields=["search_vector"],
+                name="search_doc_vector_idx",
+            ),
+            GinIndex(
+                fields=["name"],
+                name="search_doc_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["project_ids"],
+                name="search_doc_project_ids_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.entity_name} {self.name}"
+
+
+# Fields of each indexed model which change the search document
+SEARCH_INDEXED_MODELS = {
+    Issue: (
+        EntityNameEnum.ISSUE,
+        {
+            "name",
+            "description_html",
+            "description_stripped",
+            "state",
+            "archived_at",
+            "is_draft",
+            "deleted_at",
+        },
+    ),
+    Page: (
+        EntityNameEnum.PAGE,
+        {"name", "description_html", "description_stripped", "deleted_at"},
+    ),
+    Cycle: (EntityNameEnum.CYCLE, {"name", "description", "deleted_at"}),
+    Module: (EntityNameEnum.MODULE, {"name", "description", "deleted_at"}),
+    IssueView: (EntityNameEnum.VIEW, {"name", "description", "deleted_at"}),
+}
+
+
+def schedule_search_document_update(entity_name, entity_identifier):
+    # Module imports
+    from plane.bgtasks.search_index_task import update_search_document
+
+    transaction.on_commit(
+        lambda: update_search_document.delay(
+            entity_name=entity_name,
+            entity_identifier=str(entity_identifier),
+        )
+    )
+
+
+def schedule_search_documents_update(entity_name, entity_identifiers):
+    """One indexing task for the entities written by a bulk update"""
+    # Module imports
+    from plane.bgtasks.search_index_task import update_search_documents
+
+    entity_identifiers = [
+        str(entity_identifier) for entity_identifier in entity_identifiers
+    ]
+    if entity_identifiers:
+        transaction.on_commit(
+            lambda: update_search_documents.delay(
+                entity_name=entity_name,
+                entity_identifiers=entity_identifiers,
+            )
+        )
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=Page)
+@receiver(post_save, sender=Cycle)
+@receiver(post_save, sender=Module)
+@receiver(post_save, sender=IssueView)
+def update_entity_search_document(sender, instance, update_fields, **kwargs):
+    entity_name, indexed_fields = SEARCH_INDEXED_MODELS[sender]
+    # Skip saves which do not touch any of the indexed fields
+    if update_fields and not indexed_fields.intersection(update_fields):
+        return
+
+    schedule_search_document_update(entity_name, instance.id)
+
+
+@receiver(post_save, sender=IssueComment)
+def update_comment_search_document(sender, instance, **kwargs):
+    schedule_search_document_update(EntityNameEnum.ISSUE, instance.issue_id)
+
+
+@receiver(post_save, sender=ProjectPage)
+def update_project_page_search_document(sender, instance, **kwargs):
+    schedule_search_document_update(EntityNameEnum.PAGE, instance.page_id)
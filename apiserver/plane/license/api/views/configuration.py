@@ -26,6 +26,7 @@ from plane.license.api.serializers import InstanceConfigurationSerializer
 from plane.license.utils.encryption import encrypt_data
 from plane.utils.cache import cache_response, invalidate_cache
 from plane.license.utils.instance_value import (
+    bump_configuration_version,
     get_email_configuration,
 )
 
@@ -62,6 +63,7 @@ class InstanceConfigurationEndpoint(BaseAPIView):
         InstanceConfiguration.objects.bulk_update(
             bulk_configurations, ["value"], batch_size=100
         )
+        bump_configuration_version()
 
         serializer = InstanceConfigurationSerializer(configurations, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -13,7 +13,10 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         from plane.license.utils.encryption import encrypt_data
-        from plane.license.utils.instance_value import get_configuration_value
+        from plane.license.utils.instance_value import (
+            bump_configuration_version,
+            get_configuration_value,
+        )
 
         mandatory_keys = ["SECRET_KEY"]
 
@@ -182,6 +185,9 @@ class Command(BaseCommand):
                     )
                 )
 
+        # Read back the configurations created above
+        bump_configuration_version()
+
         keys = ["IS_GOOGLE_ENABLED", "IS_GITHUB_ENABLED", "IS_GITLAB_ENABLED"]
         if not InstanceConfiguration.objects.filter(key__in=keys).exists():
             for key in keys:
@@ -302,3 +308,5 @@ class Command(BaseCommand):
                 self.stdout.write(
                     self.style.WARNING(f"{key} configuration already exists")
                 )
+
+        bump_configuration_version()
@@ -1,11 +1,13 @@
 import base64
 import hashlib
+from functools import lru_cache
 from django.conf import settings
 from cryptography.fernet import Fernet
 
 from plane.utils.exception_logger import log_exception
 
 
+@lru_cache(maxsize=4)
 def derive_key(secret_key):
     # Use a key derivation function to get a suitable encryption key
     dk = hashlib.pbkdf2_hmac("sha256", secret_key.encode(), b"salt", 100000)
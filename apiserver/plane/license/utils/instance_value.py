@@ -1,5 +1,7 @@
 # Python imports
 import os
+import threading
+import time
 
 # Django imports
 from django.conf import settings
@@ -7,38 +9,87 @@ from django.conf import settings
 # Module imports
 from plane.license.models import InstanceConfiguration
 from plane.license.utils.encryption import decrypt_data
+from plane.settings.redis import redis_instance
+
+# Redis counter bumped on every write of the instance configuration
+CONFIGURATION_VERSION_KEY = "instance_configuration:version"
+
+# Seconds between two checks of the version, and the maximum age of the
+# process local values when the version does not move
+CONFIGURATION_VERSION_CHECK_INTERVAL = 1
+CONFIGURATION_CACHE_TIMEOUT = 60 * 5
+
+_configuration_lock = threading.Lock()
+_configuration_cache = {
+    "values": None,
+    "version": None,
+    "loaded_at": 0,
+    "checked_at": 0,
+}
+
+
+def load_configuration():
+    """Load every configuration, decrypting the encrypted ones once"""
+    return {
+        item["key"]: (
+            decrypt_data(item["value"])
+            if item["is_encrypted"]
+            else item["value"]
+        )
+        for item in InstanceConfiguration.objects.values(
+            "key", "value", "is_encrypted"
+        )
+    }
+
+
+def bump_configuration_version():
+    """Make every process reload the configuration on its next read"""
+    redis_instance().incr(CONFIGURATION_VERSION_KEY)
+    with _configuration_lock:
+        _configuration_cache["values"] = None
+
+
+def get_instance_configuration():
+    """
+    Return the decrypted configuration held by the process, reloaded when
+    the version in redis moved or the values are too old
+    """
+    now = time.monotonic()
+    cached = _configuration_cache
+    if (
+        cached["values"] is not None
+        and now - cached["checked_at"] < CONFIGURATION_VERSION_CHECK_INTERVAL
+    ):
+        return cached["values"]
+
+    with _configuration_lock:
+        version = redis_instance().get(CONFIGURATION_VERSION_KEY)
+        if (
+            cached["values"] is None
+            or version != cached["version"]
+            or now - cached["loaded_at"] >= CONFIGURATION_CACHE_TIMEOUT
+        ):
+            cached["values"] = load_configuration()
+            cached["version"] = version
+            cached["loaded_at"] = now
+        cached["checked_at"] = now
+        return cached["values"]
 
 
 # Helper function to return value from the passed key
 def get_configuration_value(keys):
-    environment_list = []
     if settings.SKIP_ENV_VAR:
         # Get the configurations
-        instance_configuration = InstanceConfiguration.objects.values(
-            "key", "value", "is_encrypted"
+        instance_configuration = get_instance_configuration()
+        return tuple(
+            instance_configuration.get(key.get("key"), key.get("default"))
+            for key in keys
         )
 
-        for key in keys:
-            for item in instance_configuration:
-                if key.get("key") == item.get("key"):
-                    if item.get("is_encrypted", False):
-                        environment_list.append(
-                            decrypt_data(item.get("value"))
-                        )
-                    else:
-                        environment_list.append(item.get("value"))
-
-                    break
-            else:
-                environment_list.append(key.get("default"))
-    else:
-        # Get the configuration from os
-        for key in keys:
-            environment_list.append(
-                os.environ.get(key.get("key"), key.get("default"))
-            )
-
-    return tuple(environment_list)
+    # Get the configuration from os
+    return tuple(
+        os.environ.get(key.get("key"), key.get("default")) for key in keys
+    )
 
 
 def get_email_configuration():
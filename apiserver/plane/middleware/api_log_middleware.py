@@ -1,4 +1,110 @@
+# Python imports
+import atexit
+import logging
+import queue
+import random
+import threading
+
+# Django imports
+from django.conf import settings
+from django.db import close_old_connections
+
+# Module imports
 from plane.db.models import APIActivityLog
+from plane.utils.exception_logger import log_exception
+
+
+class APILogBuffer:
+    """
+    Bounded in-process buffer of API activity logs flushed in bulk by a
+    background thread. When the buffer is full new records are dropped and
+    counted instead of blocking the request.
+    """
+
+    def __init__(self, max_size, batch_size, flush_interval):
+        self.queue = queue.Queue(maxsize=max_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def push(self, record):
+        self._ensure_flusher()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+        # Flush early once a full batch is waiting
+        if self.queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+
+    def _ensure_flusher(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="api-log-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def _drain(self):
+        records = []
+        while len(records) < self.batch_size:
+            try:
+                records.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return records
+
+    def flush(self):
+        """Write every buffered record, one bulk insert per batch"""
+        while True:
+            records = self._drain()
+            if not records:
+                break
+            try:
+                APIActivityLog.objects.bulk_create(
+                    [APIActivityLog(**record) for record in records],
+                    batch_size=self.batch_size,
+                )
+            except Exception as e:
+                log_exception(e)
+
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            logging.getLogger("plane").warning(
+                f"Dropped {dropped} API activity logs, the buffer was full"
+            )
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self.queue.empty():
+                continue
+            close_old_connections()
+            self.flush()
+            close_old_connections()
+
+
+api_log_buffer = APILogBuffer(
+    max_size=settings.API_LOG_QUEUE_SIZE,
+    batch_size=settings.API_LOG_BATCH_SIZE,
+    flush_interval=settings.API_LOG_FLUSH_INTERVAL,
+)
+atexit.register(api_log_buffer.flush)
+
+
+def truncate(value, max_length):
+    if value is None or max_length is None:
+        return value
+    return value[:max_length]
 
 
 class APITokenLogMiddleware:
@@ -16,24 +122,50 @@ class APITokenLogMiddleware:
         api_key = request.headers.get(api_key_header)
         # If the API key is present, log the request
         if api_key:
+            # Errors are always logged, the rest is sampled
+            if (
+                response.status_code < 400
+                and random.random() >= settings.API_LOG_SAMPLE_RATE
+            ):
+                return None
+
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(
-                        request_body.decode("utf-8") if request_body else None
-                    ),
-                    response_body=(
-                        response.content.decode("utf-8")
-                        if response.content
-                        else None
-                    ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
+                max_length = settings.API_LOG_BODY_MAX_LENGTH
+                api_log_buffer.push(
+                    {
+                        "token_identifier": api_key,
+                        "path": request.path[:255],
+                        "method": request.method,
+                        "query_params": request.META.get("QUERY_STRING", ""),
+                        "headers": str(request.headers),
+                        "body": truncate(
+                            (
+                                request_body.decode("utf-8")
+                                if request_body
+                                else None
+                            ),
+                            max_length,
+                        ),
+                        "response_body": truncate(
+                            (
+                                response.content.decode("utf-8")
+                                if not response.streaming and response.content
+                                else None
+                            ),
+                            max_length,
+                        ),
+                        "response_code": response.status_code,
+                        "ip_address": request.META.get("REMOTE_ADDR", None),
+                        "user_agent": truncate(
+                            request.META.get("HTTP_USER_AGENT", None), 512
+                        ),
+                        "created_by_id": (
+                            request.user.id
+                            if getattr(request, "user", None)
+                            and request.user.is_authenticated
+                            else None
+                        ),
+                    }
                 )
 
             except Exception as e:
@@ -56,6 +56,7 @@ INSTALLED_APPS = [
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
+    "django.contrib.postgres",
     # Inhouse apps
     "plane.analytics",
     "plane.app",
@@ -302,6 +303,8 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.api_logs_task",
+    "plane.bgtasks.notification_counter_task",
+    "plane.bgtasks.issue_change_task",
     "plane.license.bgtasks.tracer",
     # management tasks
     "plane.bgtasks.dummy_data_task",
@@ -384,6 +387,32 @@ APP_BASE_URL = os.environ.get("APP_BASE_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
 
+# Rows updated per statement while cascading soft deletes and restores
+SOFT_DELETE_CHUNK_SIZE = int(os.environ.get("SOFT_DELETE_CHUNK_SIZE", 2000))
+
+# API activity logs
+API_LOG_QUEUE_SIZE = int(os.environ.get("API_LOG_QUEUE_SIZE", 10000))
+API_LOG_BATCH_SIZE = int(os.environ.get("API_LOG_BATCH_SIZE", 500))
+API_LOG_FLUSH_INTERVAL = float(os.environ.get("API_LOG_FLUSH_INTERVAL", 5))
+API_LOG_SAMPLE_RATE = float(os.environ.get("API_LOG_SAMPLE_RATE", 1))
+API_LOG_BODY_MAX_LENGTH = int(os.environ.get("API_LOG_BODY_MAX_LENGTH", 10000))
+
+# Seconds during which webhook activities of an entity are coalesced
+WEBHOOK_BATCH_WINDOW = int(os.environ.get("WEBHOOK_BATCH_WINDOW", 5))
+
+# Seconds during which progress snapshot refreshes of a cycle or module
+# are coalesced
+PROGRESS_SNAPSHOT_DELAY = int(os.environ.get("PROGRESS_SNAPSHOT_DELAY", 5))
+
+# Days the issue changes feed is kept, older cursors have to resync
+ISSUE_CHANGES_RETENTION_DAYS = int(
+    os.environ.get("ISSUE_CHANGES_RETENTION_DAYS", 30)
+)
+# Seconds before a change is served, see plane/utils/issue_changes.py
+ISSUE_CHANGES_SETTLE_SECONDS = int(
+    os.environ.get("ISSUE_CHANGES_SETTLE_SECONDS", 5)
+)
+
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
 
@@ -0,0 +1,122 @@
+# Python imports
+import hashlib
+import json
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+# Third party imports
+from rest_framework.response import Response
+
+# Module imports
+from plane.db.models import DeployBoard
+from plane.utils.cache import (
+    get_tag_generations,
+    invalidate_cache_tags,
+    record_cache_stat,
+)
+
+PUBLIC_BOARD_CACHE_TIMEOUT = 60 * 10
+
+# Seconds shared caches in front of the api may serve a board without
+# revalidating it
+PUBLIC_BOARD_EDGE_MAX_AGE = 30
+
+
+def public_board_tag(project_id):
+    return f"public_board:{project_id}"
+
+
+def invalidate_public_board(project_id):
+    """Drop the cached public board responses of the project"""
+    if project_id:
+        invalidate_cache_tags(public_board_tag(project_id))
+
+
+def normalize_query_params(query_params):
+    """Query string with sorted keys and values, without empty params"""
+    return urlencode(
+        [
+            (key, value)
+            for key in sorted(query_params)
+            for value in sorted(query_params.getlist(key))
+            if value != ""
+        ]
+    )
+
+
+def cache_public_board(timeout=PUBLIC_BOARD_CACHE_TIMEOUT):
+    """
+    Cache the responses of a published project board for every viewer,
+    keyed by anchor, path and normalized filters, and answer conditional
+    requests with a 304 through the ETag and Last-Modified headers
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(instance, request, anchor, *args, **kwargs):
+            project_id = (
+                DeployBoard.objects.filter(
+                    anchor=anchor, entity_name="project"
+                )
+                .values_list("entity_identifier", flat=True)
+                .first()
+            )
+            # Unpublished boards are left to the view
+            if project_id is None:
+                return view_func(instance, request, anchor, *args, **kwargs)
+
+            (generation,) = get_tag_generations([public_board_tag(project_id)])
+            key = (
+                f"public_board:{anchor}:{request.path}:"
+                f"{normalize_query_params(request.query_params)}:{generation}"
+            )
+            cached = cache.get(key)
+
+            if cached is None:
+                record_cache_stat("misses")
+                response = view_func(
+                    instance, request, anchor, *args, **kwargs
+                )
+                if response.status_code != 200:
+                    return response
+
+                content = json.dumps(
+                    response.data, cls=DjangoJSONEncoder, sort_keys=True
+                )
+                cached = {
+                    "data": response.data,
+                    "etag": hashlib.md5(content.encode()).hexdigest(),
+                    "last_modified": int(time.time()),
+                }
+                if not settings.DEBUG:
+                    cache.set(key, cached, timeout)
+            else:
+                record_cache_stat("hits")
+
+            etag = f'"{cached["etag"]}"'
+            response = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=cached["last_modified"],
+            ) or Response(cached["data"], status=200)
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(cached["last_modified"])
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=0,
+                s_maxage=PUBLIC_BOARD_EDGE_MAX_AGE,
+            )
+            return response
+
+        return _wrapped_view
+
+    return decorator
@@ -3,7 +3,8 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, OuterRef, Func, F, Prefetch
+from django.db.models import Q, F, Prefetch
+from django.db.models.functions import Coalesce
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Third party imports
@@ -16,8 +17,6 @@ from plane.db.models import (
     IntakeIssue,
     Issue,
     State,
-    IssueLink,
-    FileAsset,
     DeployBoard,
 )
 from plane.app.serializers import (
@@ -81,27 +80,11 @@ class IntakeIssuePublicViewSet(BaseViewSet):
             .prefetch_related("assignees", "labels")
             .order_by("issue_intake__snoozed_till", "issue_intake__status")
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .prefetch_related(
                 Prefetch(
@@ -17,10 +17,7 @@ from django.db.models import (
     When,
     JSONField,
     Value,
-    OuterRef,
-    Func,
     CharField,
-    Subquery,
 )
 from django.db.models.functions import Concat
 
@@ -34,6 +31,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from .base import BaseAPIView, BaseViewSet
 
 # fetch the space app grouper function separately
+from plane.space.utils.cache import cache_public_board
 from plane.space.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -55,15 +53,12 @@ from plane.app.serializers import (
 from plane.db.models import (
     Issue,
     IssueComment,
-    IssueLink,
     IssueReaction,
     ProjectMember,
     CommentReaction,
     DeployBoard,
     IssueVote,
     ProjectPublicMember,
-    FileAsset,
-    CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.issue_filters import issue_filters
@@ -74,6 +69,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
         AllowAny,
     ]
 
+    @cache_public_board()
     def get(self, request, anchor):
         filters = issue_filters(request.query_params, "GET")
         order_by_param = request.GET.get("order_by", "-created_at")
@@ -108,35 +104,13 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                     queryset=IssueVote.objects.select_related("actor"),
                 )
             )
+            .annotate(cycle_id=F("counter__cycle_id"))
+            .annotate(link_count=Coalesce("counter__link_count", 0))
             .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                attachment_count=Coalesce("counter__attachment_count", 0)
             )
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("id")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                sub_issues_count=Coalesce("counter__sub_issues_count", 0)
             )
         ).distinct()
 
@@ -692,6 +666,7 @@ class IssueRetrievePublicEndpoint(BaseAPIView):
         AllowAny,
     ]
 
+    @cache_public_board()
     def get(self, request, anchor, issue_id):
         deploy_board = DeployBoard.objects.get(anchor=anchor)
 
@@ -703,13 +678,7 @@ class IssueRetrievePublicEndpoint(BaseAPIView):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
+            .annotate(cycle_id=F("counter__cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
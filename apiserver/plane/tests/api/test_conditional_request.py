@@ -0,0 +1,100 @@
+# Django imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Third party imports
+from rest_framework.test import APIClient, APITestCase
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueLink,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class ConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, member=self.user, role=20
+        )
+        state = State.objects.create(
+            name="Todo", group="unstarted", project=self.project
+        )
+        for index in range(20):
+            Issue.objects.create(
+                name=f"Issue {index}", project=self.project, state=state
+            )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = (
+            f"/api/workspaces/{self.workspace.slug}/projects/"
+            f"{self.project.id}/issues/"
+        )
+
+    def fetch(self, **headers):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, **headers)
+        return response, len(queries)
+
+    def test_not_modified_saves_bytes_and_queries(self):
+        response, full_queries = self.fetch()
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        not_modified, conditional_queries = self.fetch(
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], etag)
+        self.assertEqual(len(not_modified.content), 0)
+        self.assertLess(len(not_modified.content), len(response.content))
+        self.assertLess(conditional_queries, full_queries)
+
+    def test_changes_move_the_etag(self):
+        response, _ = self.fetch()
+        etag = response["ETag"]
+
+        Issue.objects.filter(project=self.project).first().save()
+
+        modified, _ = self.fetch(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(modified.status_code, 200)
+        self.assertNotEqual(modified["ETag"], etag)
+
+    def test_counters_and_bulk_deletes_move_the_etag(self):
+        response, _ = self.fetch()
+        etag = response["ETag"]
+
+        # Links only move the counters of their issue
+        IssueLink.objects.create(
+            issue=Issue.objects.filter(project=self.project).first(),
+            url="https://plane.so",
+            project=self.project,
+        )
+        modified, _ = self.fetch(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(modified.status_code, 200)
+        etag = modified["ETag"]
+
+        issue_ids = Issue.objects.filter(project=self.project).values_list(
+            "id", flat=True
+        )[:2]
+        Issue.objects.filter(pk__in=list(issue_ids)).delete()
+        modified, _ = self.fetch(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(modified.status_code, 200)
+        self.assertNotEqual(modified["ETag"], etag)
@@ -0,0 +1,65 @@
+# Django imports
+from django.db.models import Q
+from django.test import TestCase
+
+# Module imports
+from plane.db.models import Issue, Project, State, User, Workspace
+from plane.utils.paginator import Cursor, GroupedOffsetPaginator
+
+
+class GroupedOffsetPaginatorTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+
+    def create_states(self, count):
+        states = []
+        for index in range(count):
+            state = State.objects.create(
+                name=f"State {index}",
+                group="backlog",
+                project=self.project,
+            )
+            for issue_index in range(3):
+                Issue.objects.create(
+                    name=f"Issue {index} {issue_index}",
+                    project=self.project,
+                    state=state,
+                )
+            states.append(state.id)
+        return states
+
+    def paginate(self, states):
+        paginator = GroupedOffsetPaginator(
+            queryset=Issue.issue_objects.filter(project=self.project),
+            order_by="-created_at",
+            group_by_field_name="state_id",
+            group_by_fields=states,
+            count_filter=Q(archived_at__isnull=True, is_draft=False),
+        )
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, 0, 0))
+        results = list(cursor_result.results.values("id", "state_id"))
+        grouped = paginator.process_results(results=results)
+        return cursor_result, grouped
+
+    def test_grouped_page_queries(self):
+        # Rows, totals and the page count, whatever the number of groups
+        for count in (1, 4):
+            states = self.create_states(count)
+            with self.assertNumQueries(3):
+                cursor_result, grouped = self.paginate(states)
+                self.assertEqual(len(cursor_result), 2 * count)
+
+            self.assertTrue(cursor_result.next.has_results)
+            self.assertEqual(cursor_result.hits, 3 * count)
+            self.assertEqual(cursor_result.max_hits, 2)
+            for state in states:
+                self.assertEqual(grouped[str(state)]["total_results"], 3)
+                self.assertEqual(len(grouped[str(state)]["results"]), 2)
+            Issue.all_objects.all().delete()
+            State.all_objects.all().delete()
@@ -0,0 +1,113 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    ProgressSnapshot,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils.progress_snapshot import (
+    progress_distribution,
+    progress_stats,
+    refresh_progress_snapshot,
+    snapshot_issues,
+)
+
+
+class ProgressStatsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so", first_name="Jane", display_name="jane"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        self.cycle = Cycle.objects.create(
+            name="Cycle",
+            project=self.project,
+            owned_by=self.user,
+            start_date=timezone.now() - timedelta(days=3),
+            end_date=timezone.now() + timedelta(days=3),
+        )
+        label = Label.objects.create(
+            name="Bug", color="#ff0000", project=self.project
+        )
+
+        for group, count in [("backlog", 3), ("started", 2), ("completed", 1)]:
+            state = State.objects.create(
+                name=group, group=group, project=self.project
+            )
+            for index in range(count):
+                issue = Issue.objects.create(
+                    name=f"{group} {index}",
+                    project=self.project,
+                    state=state,
+                )
+                CycleIssue.objects.create(
+                    cycle=self.cycle, issue=issue, project=self.project
+                )
+                if index == 0:
+                    IssueAssignee.objects.create(
+                        issue=issue, assignee=self.user, project=self.project
+                    )
+                    IssueLabel.objects.create(
+                        issue=issue, label=label, project=self.project
+                    )
+
+    def test_distribution_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            rows = list(
+                progress_distribution(snapshot_issues(cycle_id=self.cycle.id))
+            )
+        self.assertEqual(
+            {row["dimension"] for row in rows},
+            {"state_group", "assignee", "label"},
+        )
+
+    def test_stats_are_a_single_query(self):
+        refresh_progress_snapshot(cycle_id=self.cycle.id)
+
+        with self.assertNumQueries(1):
+            stats = progress_stats(
+                ProgressSnapshot.objects.filter(cycle_id=self.cycle.id),
+                estimates=True,
+            )
+
+        self.assertEqual(stats["total_issues"], 6)
+        self.assertEqual(stats["backlog_issues"], 3)
+        self.assertEqual(stats["started_issues"], 2)
+        self.assertEqual(stats["completed_issues"], 1)
+        self.assertEqual(stats["unstarted_issues"], 0)
+
+        assignees = stats["distribution"]["assignees"]
+        self.assertEqual(assignees[0]["assignee_id"], str(self.user.id))
+        self.assertEqual(assignees[0]["total_issues"], 3)
+        self.assertEqual(assignees[0]["completed_issues"], 1)
+        self.assertEqual(assignees[0]["pending_issues"], 2)
+        # The issues without an assignee come last
+        self.assertIsNone(assignees[-1]["assignee_id"])
+        self.assertEqual(assignees[-1]["total_issues"], 3)
+
+        labels = stats["distribution"]["labels"]
+        self.assertEqual(labels[0]["label_name"], "Bug")
+        self.assertEqual(labels[0]["total_issues"], 3)
+
+        estimate_labels = stats["estimate_distribution"]["labels"]
+        self.assertEqual(estimate_labels[0]["total_estimates"], 0)
+        self.assertEqual(estimate_labels[0]["pending_estimates"], 0)
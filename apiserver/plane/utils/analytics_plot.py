@@ -120,6 +120,24 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
+def cumulative_burndown(date_range, completions, total):
+    """
+    Return the pending value for every date of the range, where
+    completions is a list of (date, completed) tuples sorted by date.
+    A single pass over both sorted sequences keeps this O(days + rows).
+    """
+    today = timezone.now().date()
+    chart_data = {}
+    index = 0
+    completed = 0
+    for date in date_range:
+        while index < len(completions) and completions[index][0] <= date:
+            completed += completions[index][1]
+            index += 1
+        chart_data[str(date)] = None if date > today else total - completed
+    return chart_data
+
+
 def burndown_plot(
     queryset,
     slug,
@@ -130,38 +148,17 @@ def burndown_plot(
 ):
     # Total Issues in Cycle or Module
     total_issues = queryset.total_issues
-    # check whether the estimate is a point or not
-    estimate_type = Project.objects.filter(
-        workspace__slug=slug,
-        pk=project_id,
-        estimate__isnull=False,
-        estimate__type="points",
-    ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
 
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            issue_module__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
+    issues = Issue.issue_objects.filter(
+        workspace__slug=slug,
+        project_id=project_id,
+    )
 
     if cycle_id:
+        issues = issues.filter(
+            issue_cycle__cycle_id=cycle_id,
+            issue_cycle__deleted_at__isnull=True,
+        )
         if queryset.end_date and queryset.start_date:
             # Get all dates between the two dates
             date_range = [
@@ -173,38 +170,11 @@ def burndown_plot(
         else:
             date_range = []
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
     if module_id:
+        issues = issues.filter(
+            issue_module__module_id=module_id,
+            issue_module__deleted_at__isnull=True,
+        )
         # Get all dates between the two dates
         date_range = [
             (queryset.start_date + timedelta(days=x))
@@ -213,64 +183,53 @@ def burndown_plot(
             )
         ]
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
+    # check whether the estimate is a point or not
+    estimate_type = (
+        plot_type == "points"
+        and Project.objects.filter(
+            workspace__slug=slug,
+            pk=project_id,
+            estimate__isnull=False,
+            estimate__type="points",
+        ).exists()
+    )
+
+    # One grouped query returns the completions of every day, the row of
+    # the pending issues (null date) makes up the estimate totals
+    if plot_type == "points":
+        distribution = (
+            issues.filter(estimate_point__isnull=False)
+            .annotate(date=TruncDate("completed_at"))
+            .values("date")
+            .annotate(
+                completed=(
+                    Sum(Cast("estimate_point__value", FloatField()))
+                    if estimate_type
+                    else Value(0.0, output_field=FloatField())
                 )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
             )
+            .values("date", "completed")
+            .order_by("date")
+        )
+    else:
+        distribution = (
+            issues.annotate(date=TruncDate("completed_at"))
+            .values("date")
+            .annotate(completed=Count("id"))
+            .values("date", "completed")
+            .order_by("date")
+        )
+
+    distribution = list(distribution)
+    completions = [
+        (item["date"], item["completed"] or 0)
+        for item in distribution
+        if item["date"] is not None
+    ]
 
     if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        total = sum(item["completed"] or 0 for item in distribution)
     else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        total = total_issues
 
-    return chart_data
+    return cumulative_burndown(date_range, completions, total)
@@ -6,8 +6,12 @@ from django.conf import settings
 from django.core.cache import cache
 
 # Third party imports
+from django_redis import get_redis_connection
 from rest_framework.response import Response
 
+# Key of the redis hash holding the hit / miss / invalidation counters
+CACHE_STATS_KEY = "cache_stats"
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,7 +22,77 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
-def cache_response(timeout=60 * 60, path=None, user=True):
+def generate_tag_key(tag):
+    """Generate the key holding the generation counter of a tag"""
+    return f"cache_tag:{tag}"
+
+
+def get_tag_generations(tags):
+    """Return the current generation of every tag in a single round trip"""
+    keys = [generate_tag_key(tag) for tag in tags]
+    generations = cache.get_many(keys)
+    return [generations.get(key, 0) for key in keys]
+
+
+def record_cache_stat(stat, amount=1):
+    """Increment the hit / miss / invalidation counter for monitoring"""
+    try:
+        get_redis_connection("default").hincrby(CACHE_STATS_KEY, stat, amount)
+    except Exception:
+        # Monitoring should never break the request
+        pass
+
+
+def get_cache_stats():
+    """Return the cache counters along with the evictions reported by redis"""
+    connection = get_redis_connection("default")
+    stats = {
+        key.decode(): int(value)
+        for key, value in connection.hgetall(CACHE_STATS_KEY).items()
+    }
+    stats["evictions"] = connection.info("stats").get("evicted_keys", 0)
+    return stats
+
+
+def invalidate_cache_tags(*tags):
+    """
+    Invalidate every cached response carrying any of the given tags.
+
+    Cached keys embed the generation of each of their tags, so bumping
+    a generation orphans the old entries (they expire with their timeout)
+    without ever scanning the keyspace.
+    """
+    for tag in tags:
+        key = generate_tag_key(tag)
+        # Make sure the generation exists before incrementing it
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+    if tags:
+        record_cache_stat("invalidations", len(tags))
+
+
+def get_cache_tags(custom_path, base_path, auth_header, tags=None, **kwargs):
+    """Return the tags of a cached response"""
+    cache_tags = [
+        f"key:{generate_cache_key(custom_path, auth_header)}",
+        f"path:{base_path}",
+    ]
+    if auth_header:
+        cache_tags.append(f"path:{base_path}:{auth_header}")
+        cache_tags.append(f"user:{auth_header}")
+    if kwargs.get("slug"):
+        cache_tags.append(f"workspace:{kwargs['slug']}")
+    if kwargs.get("project_id"):
+        cache_tags.append(f"project:{kwargs['project_id']}")
+    for tag in tags or []:
+        cache_tags.append(tag.format(**kwargs))
+    return cache_tags
+
+
+def cache_response(timeout=60 * 60, path=None, user=True, tags=None):
     """decorator to create cache per user"""
 
     def decorator(view_func):
@@ -31,13 +105,25 @@ def cache_response(timeout=60 * 60, path=None, user=True):
                 else str(request.user.id) if user else None
             )
             custom_path = path if path is not None else request.get_full_path()
-            key = generate_cache_key(custom_path, auth_header)
+            base_path = path if path is not None else request.path
+            cache_tags = get_cache_tags(
+                custom_path, base_path, auth_header, tags, **kwargs
+            )
+            generations = ".".join(
+                str(generation)
+                for generation in get_tag_generations(cache_tags)
+            )
+            key = generate_cache_key(
+                f"{custom_path}:{generations}", auth_header
+            )
             cached_result = cache.get(key)
 
             if cached_result is not None:
+                record_cache_stat("hits")
                 return Response(
                     cached_result["data"], status=cached_result["status"]
                 )
+            record_cache_stat("misses")
             response = view_func(instance, request, *args, **kwargs)
             if response.status_code == 200 and not settings.DEBUG:
                 cache.set(
@@ -54,7 +140,12 @@ def cache_response(timeout=60 * 60, path=None, user=True):
 
 
 def invalidate_cache_directly(
-    path=None, url_params=False, user=True, request=None, multiple=False
+    path=None,
+    url_params=False,
+    user=True,
+    request=None,
+    multiple=False,
+    tags=None,
 ):
     if url_params and path:
         path_with_values = path
@@ -69,15 +160,23 @@ def invalidate_cache_directly(
         if request and request.user.is_anonymous
         else str(request.user.id) if user else None
     )
-    key = generate_cache_key(custom_path, auth_header)
 
     if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
+        # Every cached variant of the path, for one user or for all users
+        tag = (
+            f"path:{custom_path}:{auth_header}"
+            if auth_header
+            else f"path:{custom_path}"
+        )
     else:
-        cache.delete(key)
+        tag = f"key:{generate_cache_key(custom_path, auth_header)}"
+
+    invalidate_cache_tags(tag, *(tags or []))
 
 
-def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
+def invalidate_cache(
+    path=None, url_params=False, user=True, multiple=False, tags=None
+):
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(instance, request, *args, **kwargs):
@@ -88,6 +187,7 @@ def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
                 user=user,
                 request=request,
                 multiple=multiple,
+                tags=[tag.format(**kwargs) for tag in tags or []],
             )
             return view_func(instance, request, *args, **kwargs)
 
@@ -0,0 +1,125 @@
+# Python imports
+import hashlib
+from functools import wraps
+
+# Django imports
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueCounter,
+    Module,
+    Page,
+    PageLabel,
+    ProjectMember,
+    ProjectPage,
+    UserFavorite,
+)
+
+
+def queryset_version(queryset):
+    """
+    Version token of the rows of a queryset, the latest update along with
+    the number of rows so that hard deletes move it as well
+    """
+    version = queryset.order_by().aggregate(
+        updated_at=Max("updated_at"), count=Count("id")
+    )
+    updated_at = version["updated_at"]
+    return f"{updated_at.timestamp() if updated_at else 0}:{version['count']}"
+
+
+def project_issues_version(request, project_id, **kwargs):
+    # Activities touch the updated_at of their issue, which covers the
+    # assignees, labels, cycles and modules. Links, attachments and sub
+    # issues only move the counters of the issue
+    return [
+        Issue.all_objects.filter(project_id=project_id),
+        IssueCounter.all_objects.filter(project_id=project_id),
+    ]
+
+
+def project_cycles_version(request, project_id, **kwargs):
+    cycles = Cycle.all_objects.filter(project_id=project_id)
+    return [
+        cycles,
+        # The status of a cycle moves with the time
+        cycles.filter(start_date__lte=timezone.now()),
+        cycles.filter(end_date__lt=timezone.now()),
+        UserFavorite.all_objects.filter(
+            project_id=project_id, user=request.user, entity_type="cycle"
+        ),
+        *project_issues_version(request, project_id),
+    ]
+
+
+def project_modules_version(request, project_id, **kwargs):
+    return [
+        Module.all_objects.filter(project_id=project_id),
+        UserFavorite.all_objects.filter(
+            project_id=project_id, user=request.user, entity_type="module"
+        ),
+        *project_issues_version(request, project_id),
+    ]
+
+
+def project_pages_version(request, project_id, **kwargs):
+    page_ids = ProjectPage.all_objects.filter(project_id=project_id).values(
+        "page_id"
+    )
+    return [
+        ProjectPage.all_objects.filter(project_id=project_id),
+        Page.all_objects.filter(pk__in=page_ids),
+        PageLabel.all_objects.filter(page_id__in=page_ids),
+        UserFavorite.all_objects.filter(
+            project_id=project_id, user=request.user, entity_type="page"
+        ),
+    ]
+
+
+def conditional_get(version_querysets):
+    """
+    Answer GET requests with a 304 when the ETag sent by the client still
+    matches, the ETag hashes the path, the user and the version of the
+    querysets returned by version_querysets(request, **kwargs) so that the
+    full response is only built when something changed
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(instance, request, *args, **kwargs):
+            querysets = version_querysets(request, **kwargs)
+            # The role of the user changes what they can see
+            if kwargs.get("project_id"):
+                querysets.append(
+                    ProjectMember.all_objects.filter(
+                        project_id=kwargs["project_id"], member=request.user
+                    )
+                )
+
+            versions = ":".join(
+                queryset_version(queryset) for queryset in querysets
+            )
+            # Dates are converted to the timezone of the user
+            key = (
+                f"{request.get_full_path()}:{request.user.id}:"
+                f"{request.user.user_timezone}:{versions}"
+            )
+            etag = f'"{hashlib.md5(key.encode()).hexdigest()}"'
+
+            response = get_conditional_response(
+                request, etag=etag
+            ) or view_func(instance, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response["ETag"] = etag
+                # Clients have to revalidate before reusing the response
+                response["Cache-Control"] = "private, no-cache"
+            return response
+
+        return _wrapped_view
+
+    return decorator
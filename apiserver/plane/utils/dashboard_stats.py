@@ -0,0 +1,116 @@
+# Django imports
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, IssueAssignee
+from plane.utils.cache import get_tag_generations, invalidate_cache_tags
+
+# Stats of a user are recounted at least every hour, which bounds the
+# staleness after membership changes that do not go through activities
+DASHBOARD_STATS_TIMEOUT = 60 * 60
+
+# Activity fields which change the overview stats of the assignees and
+# the creator of the issue
+DASHBOARD_ACTIVITY_FIELDS = {
+    "state",
+    "assignees",
+    "target_date",
+    "archived_at",
+    "issue",
+    "draft",
+    "intake",
+}
+
+
+def dashboard_stats_tag(user_id):
+    return f"dashboard_stats:{user_id}"
+
+
+def compute_dashboard_stats(slug, user):
+    """
+    Count the assigned, pending, created and completed issues of the user
+    with one conditional aggregate over the issues visible to them
+    """
+    assigned = Q(is_assigned=True)
+    return (
+        Issue.issue_objects.filter(
+            Q(
+                project__project_projectmember__role=5,
+                project__guest_view_all_features=True,
+            )
+            | Q(
+                project__project_projectmember__role=5,
+                project__guest_view_all_features=False,
+                created_by=user,
+            )
+            |
+            # For other roles (role < 5), show all issues
+            Q(project__project_projectmember__role__gt=5),
+            workspace__slug=slug,
+            project__project_projectmember__is_active=True,
+            project__project_projectmember__member=user,
+        )
+        .annotate(
+            is_assigned=Exists(
+                IssueAssignee.objects.filter(
+                    issue_id=OuterRef("pk"), assignee=user
+                )
+            )
+        )
+        .aggregate(
+            assigned_issues_count=Count("id", filter=assigned),
+            pending_issues_count=Count(
+                "id",
+                filter=assigned
+                & ~Q(state__group__in=["completed", "cancelled"])
+                & Q(target_date__lt=timezone.now().date()),
+            ),
+            completed_issues_count=Count(
+                "id", filter=assigned & Q(state__group="completed")
+            ),
+            created_issues_count=Count("id", filter=Q(created_by=user)),
+        )
+    )
+
+
+def get_dashboard_stats(slug, user):
+    """
+    Return the overview stats of the user from the cache, the key embeds
+    the date as the pending count changes with it
+    """
+    (generation,) = get_tag_generations([dashboard_stats_tag(user.id)])
+    key = (
+        f"dashboard_stats:{slug}:{user.id}:{generation}:"
+        f"{timezone.now().date().isoformat()}"
+    )
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_dashboard_stats(slug, user)
+        cache.set(key, stats, DASHBOARD_STATS_TIMEOUT)
+    return stats
+
+
+def invalidate_dashboard_stats(issue_ids):
+    """
+    Drop the cached stats of the creators and of the current and former
+    assignees of the issues
+    """
+    issue_ids = [issue_id for issue_id in issue_ids if issue_id]
+    if not issue_ids:
+        return
+
+    # Removed assignees are included so that they lose the issue
+    user_ids = set(
+        IssueAssignee.all_objects.filter(issue_id__in=issue_ids)
+        .values_list("assignee_id", flat=True)
+        .order_by()
+    ) | set(
+        Issue.all_objects.filter(pk__in=issue_ids)
+        .values_list("created_by_id", flat=True)
+        .order_by()
+    )
+    invalidate_cache_tags(
+        *[dashboard_stats_tag(user_id) for user_id in user_ids if user_id]
+    )
@@ -0,0 +1,611 @@
+# Python imports
+import json
+import uuid
+from collections import defaultdict
+
+# Django imports
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+# Module imports
+from plane.api.serializers import IssueBulkSerializer, IssueSerializer
+from plane.db.models import (
+    EstimatePoint,
+    Issue,
+    IssueAssignee,
+    IssueChange,
+    IssueCounter,
+    IssueLabel,
+    IssueSequence,
+    IssueSequenceCounter,
+    IssueType,
+    Label,
+    ProjectMember,
+    State,
+    User,
+)
+from plane.db.models.recent_visit import EntityNameEnum
+from plane.db.models.search import (
+    SEARCH_INDEXED_MODELS,
+    schedule_search_document_update,
+)
+
+# Largest batch accepted by the bulk endpoints
+ISSUE_BULK_MAX_ITEMS = 500
+
+# Related fields of the payload and the attribute holding their id
+RELATION_FIELDS = {
+    "parent": "parent_id",
+    "state": "state_id",
+    "estimate_point": "estimate_point_id",
+    "type": "type_id",
+    "created_by": "created_by_id",
+}
+
+# Payload key of the related fields in the errors
+RELATION_ERROR_KEYS = {"type": "type_id"}
+
+CONFLICT_ERROR = (
+    "Issue with the same external id and external source already exists"
+)
+
+
+def invalid_pk(value):
+    return [f'Invalid pk "{value}" - object does not exist.']
+
+
+def description_stripped(description_html):
+    return (
+        None
+        if description_html == "" or description_html is None
+        else strip_tags(description_html)
+    )
+
+
+def validate_issue_batch(items, partial=False):
+    """
+    Validate the issues of the batch on their own, returns the errors and
+    the validated data of every issue by its index
+    """
+    results, batch = [None] * len(items), {}
+    for index, item in enumerate(items):
+        serializer = IssueBulkSerializer(data=item, partial=partial)
+        if serializer.is_valid():
+            batch[index] = dict(serializer.validated_data)
+        else:
+            results[index] = {"status": 400, "errors": serializer.errors}
+    return results, batch
+
+
+def resolve_related_ids(project, batch):
+    """
+    Ids referenced by the batch which exist, with one query per kind of
+    relation instead of the queries of every issue
+    """
+    wanted = defaultdict(set)
+    for data in batch.values():
+        for field in RELATION_FIELDS:
+            if data.get(field):
+                wanted[field].add(data[field])
+        wanted["assignees"].update(data.get("assignees", []))
+        wanted["labels"].update(data.get("labels", []))
+
+    lookups = {
+        "state": State.objects.filter(project_id=project.id),
+        # Parents can be from any project of the workspace
+        "parent": Issue.objects.filter(workspace_id=project.workspace_id),
+        "estimate_point": EstimatePoint.objects.all(),
+        "type": IssueType.objects.all(),
+        "created_by": User.objects.all(),
+        "labels": Label.objects.filter(project_id=project.id),
+    }
+    existing = {
+        field: (
+            set(
+                queryset.filter(pk__in=wanted[field]).values_list(
+                    "id", flat=True
+                )
+            )
+            if wanted[field]
+            else set()
+        )
+        for field, queryset in lookups.items()
+    }
+    existing["assignees"] = (
+        set(
+            ProjectMember.objects.filter(
+                project_id=project.id,
+                is_active=True,
+                member_id__in=wanted["assignees"],
+            ).values_list("member_id", flat=True)
+        )
+        if wanted["assignees"]
+        else set()
+    )
+    return existing
+
+
+def check_relations(data, existing):
+    """
+    Errors of the related ids of an issue, the assignees and labels which
+    are not part of the project are dropped as by the single endpoints
+    """
+    errors = {
+        RELATION_ERROR_KEYS.get(field, field): invalid_pk(data[field])
+        for field in ("estimate_point", "type", "created_by")
+        if data.get(field) and data[field] not in existing[field]
+    }
+    if errors:
+        return errors
+
+    if data.get("state") and data["state"] not in existing["state"]:
+        return {
+            "non_field_errors": [
+                "State is not valid please pass a valid state_id"
+            ]
+        }
+    if data.get("parent") and data["parent"] not in existing["parent"]:
+        return {
+            "non_field_errors": [
+                "Parent is not valid issue_id please pass a valid issue_id"
+            ]
+        }
+
+    for field in ("assignees", "labels"):
+        if field in data:
+            data[field] = [
+                value
+                for value in dict.fromkeys(data[field])
+                if value in existing[field]
+            ]
+    return None
+
+
+def check_external_ids(project, batch, results, issues=None):
+    """
+    Flag the issues whose external id and source are already taken in the
+    project, or repeated in the batch, with one query for the batch
+    """
+    keys = {}
+    for index, data in batch.items():
+        issue = issues.get(index) if issues is not None else None
+        external_id = data.get("external_id")
+        if not external_id or (
+            issue is not None and issue.external_id == str(external_id)
+        ):
+            continue
+        external_source = data.get(
+            "external_source",
+            issue.external_source if issue is not None else None,
+        )
+        if external_source:
+            keys[index] = (external_source, str(external_id))
+
+    if not keys:
+        return
+
+    taken = {
+        (external_source, external_id): issue_id
+        for external_source, external_id, issue_id in Issue.objects.filter(
+            project_id=project.id,
+            external_source__in={key[0] for key in keys.values()},
+            external_id__in={key[1] for key in keys.values()},
+        ).values_list("external_source", "external_id", "id")
+    }
+    seen = set()
+    for index, key in keys.items():
+        if key in taken:
+            results[index] = {
+                "status": 409,
+                "error": CONFLICT_ERROR,
+                "id": str(taken[key] if issues is None else issues[index].id),
+            }
+        elif key in seen:
+            results[index] = {
+                "status": 409,
+                "error": "External id and external source are repeated in "
+                "the batch",
+            }
+        seen.add(key)
+
+    for index in keys:
+        if results[index] is not None:
+            del batch[index]
+
+
+def default_state(project_id):
+    """State of the issues created without one, as in Issue.save"""
+    states = State.objects.filter(~Q(is_triage=True), project_id=project_id)
+    state = states.filter(default=True).first()
+    return state if state is not None else states.first()
+
+
+def issue_result(issue, status):
+    return {
+        "status": status,
+        "id": str(issue.id),
+        "sequence_id": issue.sequence_id,
+        "external_id": issue.external_id,
+        "external_source": issue.external_source,
+    }
+
+
+def issue_relations(project, issues, relation_ids, model, field):
+    """Rows linking every issue to its assignees or labels"""
+    return [
+        model(
+            issue_id=issue.id,
+            project_id=project.id,
+            workspace_id=project.workspace_id,
+            created_by_id=created_by_id,
+            updated_by_id=updated_by_id,
+            **{field: related_id},
+        )
+        for issue, (ids, created_by_id, updated_by_id) in zip(
+            issues, relation_ids
+        )
+        for related_id in ids
+    ]
+
+
+def bulk_create_issues(project, items, user):
+    """
+    Create the valid issues of the batch with one insert per table, returns
+    the result of every item and the activities of the created issues
+    """
+    results, batch = validate_issue_batch(items)
+    existing = resolve_related_ids(project, batch)
+    for index, data in list(batch.items()):
+        errors = check_relations(data, existing)
+        if errors:
+            results[index] = {"status": 400, "errors": errors}
+            del batch[index]
+    check_external_ids(project, batch, results)
+
+    if not batch:
+        return results, []
+
+    state_groups = dict(
+        State.objects.filter(
+            project_id=project.id,
+            pk__in={
+                data["state"] for data in batch.values() if data.get("state")
+            },
+        ).values_list("id", "group")
+    )
+    fallback_state = None
+    if any(not data.get("state") for data in batch.values()):
+        fallback_state = default_state(project.id)
+        if fallback_state is not None:
+            state_groups[fallback_state.id] = fallback_state.group
+    fallback_type_id = None
+    if any(not data.get("type") for data in batch.values()):
+        fallback_type_id = (
+            IssueType.objects.filter(
+                project_issue_types__project_id=project.id, is_default=True
+            )
+            .values_list("id", flat=True)
+            .first()
+        )
+
+    now = timezone.now()
+    issues, relation_ids, created_at = [], defaultdict(list), []
+    for data in batch.values():
+        data = dict(data)
+        assignees = data.pop("assignees", None)
+        labels = data.pop("labels", None)
+        created_at.append(data.pop("created_at", None))
+        fields = {
+            RELATION_FIELDS.get(field, field): value
+            for field, value in data.items()
+        }
+        fields["state_id"] = fields.get("state_id") or (
+            fallback_state.id if fallback_state is not None else None
+        )
+        fields["type_id"] = fields.get("type_id") or fallback_type_id
+        fields["created_by_id"] = fields.get("created_by_id") or user.id
+        issue = Issue(
+            **fields,
+            project_id=project.id,
+            workspace_id=project.workspace_id,
+            updated_by_id=user.id,
+        )
+        issue.completed_at = (
+            now if state_groups.get(issue.state_id) == "completed" else None
+        )
+        issue.description_stripped = description_stripped(
+            issue.description_html
+        )
+        issues.append(issue)
+
+        audit = (issue.created_by_id, issue.updated_by_id)
+        if assignees:
+            relation_ids["assignees"].append((assignees, *audit))
+        elif project.default_assignee_id is not None:
+            relation_ids["assignees"].append(
+                ([project.default_assignee_id], *audit)
+            )
+        else:
+            relation_ids["assignees"].append(([], *audit))
+        relation_ids["labels"].append((labels or [], *audit))
+
+    # Continue after the largest sort order of every state
+    sort_orders = dict(
+        Issue.objects.filter(
+            project_id=project.id,
+            state_id__in={issue.state_id for issue in issues},
+        )
+        .values("state_id")
+        .annotate(largest=Max("sort_order"))
+        .values_list("state_id", "largest")
+    )
+    for issue in issues:
+        if issue.state_id in sort_orders:
+            issue.sort_order = sort_orders[issue.state_id] + 10000
+        sort_orders[issue.state_id] = issue.sort_order
+
+    with transaction.atomic():
+        sequences = IssueSequenceCounter.allocate(project.id, len(issues))
+        for issue, sequence_id in zip(issues, sequences):
+            issue.sequence_id = sequence_id
+
+        issues = Issue.objects.bulk_create(issues, batch_size=100)
+
+        # The inserts set created_at to now, imports keep their own
+        dated = []
+        for issue, value in zip(issues, created_at):
+            if value is not None:
+                issue.created_at = value
+                dated.append(issue)
+        if dated:
+            Issue.objects.bulk_update(dated, ["created_at"], batch_size=100)
+
+        IssueSequence.objects.bulk_create(
+            [
+                IssueSequence(
+                    issue=issue,
+                    sequence=issue.sequence_id,
+                    project_id=project.id,
+                    workspace_id=project.workspace_id,
+                )
+                for issue in issues
+            ],
+            batch_size=100,
+        )
+        IssueAssignee.objects.bulk_create(
+            issue_relations(
+                project,
+                issues,
+                relation_ids["assignees"],
+                IssueAssignee,
+                "assignee_id",
+            ),
+            batch_size=100,
+        )
+        IssueLabel.objects.bulk_create(
+            issue_relations(
+                project,
+                issues,
+                relation_ids["labels"],
+                IssueLabel,
+                "label_id",
+            ),
+            batch_size=100,
+        )
+
+        # The inserts skip the post save receivers of the issues
+        IssueChange.record(
+            [(project.id, project.workspace_id, issue.id) for issue in issues]
+        )
+        IssueCounter.refresh(
+            [issue.id for issue in issues]
+            + [issue.parent_id for issue in issues]
+        )
+        for issue in issues:
+            schedule_search_document_update(EntityNameEnum.ISSUE, issue.id)
+
+    activities = []
+    for index, issue in zip(batch, issues):
+        results[index] = issue_result(issue, 201)
+        activities.append(
+            {
+                "issue_id": str(issue.id),
+                "requested_data": json.dumps(
+                    items[index], cls=DjangoJSONEncoder
+                ),
+                "current_instance": None,
+            }
+        )
+    return results, activities
+
+
+def parse_issue_ids(items, results):
+    """Id of every issue to update by its index"""
+    issue_ids, seen = {}, set()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        try:
+            issue_id = uuid.UUID(str(item.get("id")))
+        except ValueError:
+            results[index] = {
+                "status": 400,
+                "errors": {"id": ["Must be a valid UUID."]},
+            }
+            continue
+        if issue_id in seen:
+            results[index] = {
+                "status": 400,
+                "errors": {"id": ["Issue is repeated in the batch"]},
+            }
+            continue
+        issue_ids[index] = issue_id
+        seen.add(issue_id)
+    return issue_ids
+
+
+def bulk_update_issues(project, items, user):
+    """
+    Update the issues of the batch, identified by the id of every item,
+    with one update statement for the batch. Returns the result of every
+    item and the activities of the updated issues
+    """
+    results, batch = validate_issue_batch(items, partial=True)
+    issue_ids = parse_issue_ids(items, results)
+    for index in list(batch):
+        if results[index] is not None or index not in issue_ids:
+            batch.pop(index)
+
+    loaded = {
+        issue.id: issue
+        for issue in Issue.objects.filter(
+            project_id=project.id, pk__in=issue_ids.values()
+        ).prefetch_related("assignees", "labels")
+    }
+    issues = {}
+    for index in list(batch):
+        issue = loaded.get(issue_ids[index])
+        if issue is None:
+            results[index] = {
+                "status": 404,
+                "error": "The requested resource does not exist.",
+            }
+            del batch[index]
+        else:
+            issues[index] = issue
+
+    existing = resolve_related_ids(project, batch)
+    for index, data in list(batch.items()):
+        errors = check_relations(data, existing)
+        if errors:
+            results[index] = {"status": 400, "errors": errors}
+            del batch[index]
+    check_external_ids(project, batch, results, issues)
+
+    if not batch:
+        return results, []
+
+    current_instances = {
+        index: json.dumps(
+            IssueSerializer(issues[index]).data, cls=DjangoJSONEncoder
+        )
+        for index in batch
+    }
+
+    state_groups = dict(
+        State.objects.filter(
+            project_id=project.id,
+            pk__in={
+                data["state"] for data in batch.values() if data.get("state")
+            },
+        ).values_list("id", "group")
+    )
+    fallback_state = None
+    if any("state" in data and not data["state"] for data in batch.values()):
+        fallback_state = default_state(project.id)
+        if fallback_state is not None:
+            state_groups[fallback_state.id] = fallback_state.group
+
+    now = timezone.now()
+    updated_fields = {"updated_at", "updated_by"}
+    parent_ids, search_ids, relations = set(), [], defaultdict(list)
+    for index, data in batch.items():
+        issue = issues[index]
+        data = dict(data)
+        # Creation dates are only taken on create, as by the single update
+        data.pop("created_at", None)
+        for field in ("assignees", "labels"):
+            if field in data:
+                relations[field].append((issue, data.pop(field)))
+
+        loaded_parent_id = issue.parent_id
+        for field, value in data.items():
+            setattr(issue, RELATION_FIELDS.get(field, field), value)
+            updated_fields.add(field)
+
+        if "state" in data:
+            if not issue.state_id and fallback_state is not None:
+                issue.state_id = fallback_state.id
+            issue.completed_at = (
+                now
+                if state_groups.get(issue.state_id) == "completed"
+                else None
+            )
+            updated_fields.add("completed_at")
+        if "description_html" in data:
+            issue.description_stripped = description_stripped(
+                issue.description_html
+            )
+            updated_fields.add("description_stripped")
+        if issue.parent_id != loaded_parent_id:
+            parent_ids.update([issue.parent_id, loaded_parent_id])
+
+        issue.updated_at = now
+        issue.updated_by_id = user.id
+        if SEARCH_INDEXED_MODELS[Issue][1].intersection(data):
+            search_ids.append(issue.id)
+
+    with transaction.atomic():
+        Issue.objects.bulk_update(
+            [issues[index] for index in batch],
+            sorted(updated_fields),
+            batch_size=100,
+        )
+
+        for field, model, related_field in (
+            ("assignees", IssueAssignee, "assignee_id"),
+            ("labels", IssueLabel, "label_id"),
+        ):
+            if not relations[field]:
+                continue
+            model.objects.filter(
+                issue_id__in=[issue.id for issue, _ in relations[field]]
+            ).delete()
+            model.objects.bulk_create(
+                [
+                    model(
+                        issue_id=issue.id,
+                        project_id=project.id,
+                        workspace_id=project.workspace_id,
+                        created_by_id=issue.created_by_id,
+                        updated_by_id=issue.updated_by_id,
+                        **{related_field: related_id},
+                    )
+                    for issue, related_ids in relations[field]
+                    for related_id in related_ids
+                ],
+                batch_size=100,
+            )
+
+        # The update skips the post save receivers of the issues
+        IssueChange.record(
+            [
+                (project.id, project.workspace_id, issues[index].id)
+                for index in batch
+            ]
+        )
+        IssueCounter.refresh(parent_ids)
+        for issue_id in search_ids:
+            schedule_search_document_update(EntityNameEnum.ISSUE, issue_id)
+
+    activities = []
+    for index in batch:
+        results[index] = issue_result(issues[index], 200)
+        activities.append(
+            {
+                "issue_id": str(issues[index].id),
+                "requested_data": json.dumps(
+                    {
+                        key: value
+                        for key, value in items[index].items()
+                        if key != "id"
+                    },
+                    cls=DjangoJSONEncoder,
+                ),
+                "current_instance": current_instances[index],
+            }
+        )
+    return results, activities
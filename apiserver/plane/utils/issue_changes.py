@@ -0,0 +1,91 @@
+# Python imports
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+# Django imports
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import IssueChange
+
+# Changes are served in pages of this size by default
+ISSUE_CHANGES_PAGE_SIZE = 500
+ISSUE_CHANGES_MAX_PAGE_SIZE = 1000
+
+ChangesCursor = namedtuple("ChangesCursor", ["sequence", "synced_at", "scope"])
+
+
+def encode_changes_cursor(sequence, synced_at, scope):
+    return f"{sequence}:{int(synced_at.timestamp())}:{scope}"
+
+
+def decode_changes_cursor(value):
+    """Parse a cursor, returns None when it is missing or malformed"""
+    try:
+        sequence, synced_at, scope = value.split(":")
+        return ChangesCursor(
+            int(sequence),
+            datetime.fromtimestamp(int(synced_at), tz=dt_timezone.utc),
+            scope,
+        )
+    except (AttributeError, ValueError):
+        return None
+
+
+def changes_settled_at():
+    """
+    Changes are only served once they are ISSUE_CHANGES_SETTLE_SECONDS old,
+    so that a change whose transaction commits after a later one is not
+    skipped. This is a heuristic, not a guarantee: a change whose
+    transaction commits more than the window after its sequence was drawn,
+    or one dated by an app server whose clock is off by more than the
+    window, is skipped for good once a later sequence was served. Clients
+    recover from it with a resync
+    """
+    return timezone.now() - timedelta(
+        seconds=settings.ISSUE_CHANGES_SETTLE_SECONDS
+    )
+
+
+def changes_page_size(value):
+    """per_page of the feed, malformed values fall back to the default"""
+    try:
+        per_page = int(value)
+    except (TypeError, ValueError):
+        return ISSUE_CHANGES_PAGE_SIZE
+    return min(max(per_page, 1), ISSUE_CHANGES_MAX_PAGE_SIZE)
+
+
+def is_changes_cursor_expired(cursor):
+    """Changes older than the retention are pruned, the client resyncs"""
+    return cursor.synced_at < timezone.now() - timedelta(
+        days=settings.ISSUE_CHANGES_RETENTION_DAYS
+    )
+
+
+def latest_change_sequence(project_id, settled_at):
+    return (
+        IssueChange.objects.filter(
+            project_id=project_id, created_at__lte=settled_at
+        ).aggregate(sequence=Max("sequence"))["sequence"]
+        or 0
+    )
+
+
+def get_issue_changes(project_id, sequence, settled_at, limit):
+    """
+    Issues of the project which changed after the sequence, once per issue
+    at their latest change, in the order of that change
+    """
+    return list(
+        IssueChange.objects.filter(
+            project_id=project_id,
+            sequence__gt=sequence,
+            created_at__lte=settled_at,
+        )
+        .values("issue_id")
+        .annotate(last_sequence=Max("sequence"))
+        .order_by("last_sequence")[:limit]
+    )
@@ -0,0 +1,227 @@
+# Python imports
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+
+# Module imports
+from plane.db.models import IssueRelation
+from plane.utils.cache import get_tag_generations, invalidate_cache_tags
+
+# Name of a relation seen from its issue and from its related issue
+RELATION_SIDES = {
+    "blocked_by": ("blocked_by", "blocking"),
+    "duplicate": ("duplicate", "duplicate"),
+    "relates_to": ("relates_to", "relates_to"),
+    "start_before": ("start_before", "start_after"),
+    "finish_before": ("finish_before", "finish_after"),
+}
+
+RELATION_NAMES = [
+    "blocking",
+    "blocked_by",
+    "duplicate",
+    "relates_to",
+    "start_after",
+    "start_before",
+    "finish_after",
+    "finish_before",
+]
+
+# Relations ordering the work on their two issues, True when the issue
+# waits on the related issue and False when the related issue waits
+DEPENDENCY_RELATIONS = {
+    "blocked_by": True,
+    "start_before": False,
+    "finish_before": False,
+}
+
+# Graphs held by every process, a graph is reloaded once the generation of
+# its project moved or it is older than the timeout, which bounds the
+# staleness after deletes of issues that do not go through the relations
+ISSUE_RELATION_GRAPH_TIMEOUT = 60 * 10
+ISSUE_RELATION_GRAPH_CACHE_SIZE = 64
+
+_graph_lock = threading.Lock()
+_graph_cache = OrderedDict()
+
+
+class RelationCycleError(Exception):
+    """The dependencies of an issue loop back on themselves"""
+
+    def __init__(self, cycle):
+        super().__init__("Issue dependencies contain a cycle")
+        self.cycle = cycle
+
+
+class IssueRelationGraph:
+    """
+    Adjacency index of issue relations, answering the direct relations of
+    an issue as well as the transitive dependency queries in memory
+    """
+
+    def __init__(self, edges):
+        self.relations = defaultdict(list)
+        # Issue to the issues it waits on, and the reverse
+        self.prerequisites = defaultdict(set)
+        self.dependents = defaultdict(set)
+
+        for issue_id, related_issue_id, relation_type in edges:
+            issue_id, related_issue_id = str(issue_id), str(related_issue_id)
+            issue_side, related_side = RELATION_SIDES[relation_type]
+            self.relations[issue_id].append((related_issue_id, issue_side))
+            self.relations[related_issue_id].append((issue_id, related_side))
+
+            if relation_type in DEPENDENCY_RELATIONS:
+                waiting, prerequisite = (
+                    (issue_id, related_issue_id)
+                    if DEPENDENCY_RELATIONS[relation_type]
+                    else (related_issue_id, issue_id)
+                )
+                self.prerequisites[waiting].add(prerequisite)
+                self.dependents[prerequisite].add(waiting)
+
+    def related(self, issue_id):
+        """Issues directly related to the issue, by relation name"""
+        related = {name: [] for name in RELATION_NAMES}
+        for other_id, name in self.relations.get(str(issue_id), []):
+            related[name].append(other_id)
+        return related
+
+    def transitive(self, issue_id, adjacency):
+        """Issues reachable from the issue by their distance to it"""
+        issue_id = str(issue_id)
+        depths = {issue_id: 0}
+        queue = deque([issue_id])
+        while queue:
+            current = queue.popleft()
+            for other_id in adjacency.get(current, ()):
+                if other_id not in depths:
+                    depths[other_id] = depths[current] + 1
+                    queue.append(other_id)
+        del depths[issue_id]
+        return depths
+
+    def transitive_blockers(self, issue_id):
+        return self.transitive(issue_id, self.prerequisites)
+
+    def transitive_dependents(self, issue_id):
+        return self.transitive(issue_id, self.dependents)
+
+    def find_cycle(self, issue_id):
+        """
+        Return the issues of a dependency cycle reachable from the issue,
+        None when its dependencies form a DAG
+        """
+        issue_id = str(issue_id)
+        # Iterative DFS so that long chains do not hit the recursion limit
+        path, on_path, visited = [], set(), set()
+        stack = [(issue_id, iter(self.prerequisites.get(issue_id, ())))]
+        path.append(issue_id)
+        on_path.add(issue_id)
+        while stack:
+            current, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                path.pop()
+                on_path.discard(current)
+                visited.add(current)
+            elif child in on_path:
+                return path[path.index(child) :]
+            elif child not in visited:
+                stack.append((child, iter(self.prerequisites.get(child, ()))))
+                path.append(child)
+                on_path.add(child)
+        return None
+
+    def critical_path(self, issue_id):
+        """
+        Longest chain of dependencies ending at the issue, from the first
+        issue to start down to the issue itself
+        """
+        issue_id = str(issue_id)
+        cycle = self.find_cycle(issue_id)
+        if cycle:
+            raise RelationCycleError(cycle)
+
+        # Length of the longest chain below every issue and its next step,
+        # filled in post order
+        longest, following = {}, {}
+        stack = [(issue_id, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in longest:
+                continue
+            prerequisites = self.prerequisites.get(current, ())
+            if not expanded:
+                stack.append((current, True))
+                stack.extend(
+                    (other_id, False)
+                    for other_id in prerequisites
+                    if other_id not in longest
+                )
+                continue
+            longest[current], following[current] = 1, None
+            for other_id in prerequisites:
+                if longest[other_id] + 1 > longest[current]:
+                    longest[current] = longest[other_id] + 1
+                    following[current] = other_id
+
+        path = [issue_id]
+        while following[path[-1]] is not None:
+            path.append(following[path[-1]])
+        return path[::-1]
+
+
+def issue_relation_graph_tag(project_id):
+    return f"issue_relation_graph:{project_id}"
+
+
+def load_issue_relation_graph(project_id):
+    return IssueRelationGraph(
+        IssueRelation.objects.filter(
+            project_id=project_id,
+            issue__deleted_at__isnull=True,
+            related_issue__deleted_at__isnull=True,
+        )
+        .order_by()
+        .values_list("issue_id", "related_issue_id", "relation_type")
+        .iterator(chunk_size=5000)
+    )
+
+
+def get_issue_relation_graph(project_id):
+    """
+    Return the relation graph of the project held by the process, only
+    the generation of the project is read from the cache on a hit
+    """
+    key = str(project_id)
+    (generation,) = get_tag_generations([issue_relation_graph_tag(key)])
+    now = time.monotonic()
+
+    with _graph_lock:
+        cached = _graph_cache.get(key)
+        if (
+            cached is not None
+            and cached["generation"] == generation
+            and now - cached["loaded_at"] < ISSUE_RELATION_GRAPH_TIMEOUT
+        ):
+            _graph_cache.move_to_end(key)
+            return cached["graph"]
+
+    graph = load_issue_relation_graph(key)
+    with _graph_lock:
+        _graph_cache[key] = {
+            "graph": graph,
+            "generation": generation,
+            "loaded_at": now,
+        }
+        _graph_cache.move_to_end(key)
+        while len(_graph_cache) > ISSUE_RELATION_GRAPH_CACHE_SIZE:
+            _graph_cache.popitem(last=False)
+    return graph
+
+
+def invalidate_issue_relation_graph(project_id):
+    """Make every process reload the graph of the project on its next read"""
+    invalidate_cache_tags(issue_relation_graph_tag(project_id))
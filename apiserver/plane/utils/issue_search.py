@@ -2,21 +2,58 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, Q
 
 # Module imports
+from plane.db.models import SearchDocument
+from plane.db.models.recent_visit import EntityNameEnum
+
+
+def build_search_query(query):
+    """Return a prefix matching tsquery for every word of the query"""
+    tokens = re.findall(r"\w+", query)
+    if not tokens:
+        return None
+    return SearchQuery(
+        " & ".join(f"{token}:*" for token in tokens),
+        search_type="raw",
+        config="simple",
+    )
+
+
+def search_documents(query, queryset, condition=None):
+    """
+    Filter the search documents matching the query either through the
+    full text vector or through trigram similarity of the name, ranked by
+    both
+    """
+    condition = Q(name__trigram_word_similar=query) | (condition or Q())
+    rank = TrigramWordSimilarity(query, "name")
+
+    search_query = build_search_query(query)
+    if search_query is not None:
+        condition |= Q(search_vector=search_query)
+        rank = SearchRank(F("search_vector"), search_query) + rank
+
+    return queryset.filter(condition).annotate(rank=rank)
 
 
 def search_issues(query, queryset):
-    fields = ["name", "sequence_id", "project__identifier"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
+    q = Q(
+        id__in=search_documents(
+            query,
+            SearchDocument.objects.filter(entity_name=EntityNameEnum.ISSUE),
+        ).values("entity_identifier")
+    )
+    if len(query) <= 20:
+        sequences = re.findall(r"\b\d+\b", query)
+        for sequence_id in sequences:
+            q |= Q(**{"sequence_id": sequence_id})
     return queryset.filter(
         q,
     ).distinct()
@@ -0,0 +1,113 @@
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+
+# Cache timeout for the resolved member roles
+MEMBER_ROLES_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(user_id):
+    return f"member_roles:version:{user_id}"
+
+
+def _roles_key(user_id, version):
+    return f"member_roles:{user_id}:{version}"
+
+
+class MemberRoles:
+    """
+    Resolved workspace and project roles of a user.
+
+    The roles are loaded with two queries, cached against the user's
+    membership version and looked up as dictionaries afterwards.
+    """
+
+    def __init__(self, workspaces, projects):
+        # {workspace_slug: role}
+        self.workspaces = workspaces
+        # {project_id: (workspace_slug, role)}
+        self.projects = projects
+
+    @classmethod
+    def load(cls, user_id):
+        workspaces = {
+            slug: role
+            for slug, role in WorkspaceMember.objects.filter(
+                member_id=user_id, is_active=True
+            ).values_list("workspace__slug", "role")
+        }
+        projects = {
+            str(project_id): (slug, role)
+            for project_id, slug, role in ProjectMember.objects.filter(
+                member_id=user_id, is_active=True
+            ).values_list("project_id", "workspace__slug", "role")
+        }
+        return cls(workspaces=workspaces, projects=projects)
+
+    def workspace_role(self, slug):
+        return self.workspaces.get(slug)
+
+    def project_role(self, slug, project_id):
+        workspace_slug, role = self.projects.get(
+            str(project_id), (None, None)
+        )
+        if workspace_slug != slug:
+            return None
+        return role
+
+    def project_ids(self, slug, roles=None):
+        return [
+            project_id
+            for project_id, (workspace_slug, role) in self.projects.items()
+            if workspace_slug == slug and (roles is None or role in roles)
+        ]
+
+    def is_project_guest(self, slug, project_id):
+        return self.project_role(slug, project_id) == 5
+
+
+def get_member_roles(request):
+    """Return the member roles of the request user, loading them once"""
+    member_roles = getattr(request, "_member_roles", None)
+    if member_roles is not None:
+        return member_roles
+
+    user_id = str(request.user.id)
+    version = cache.get(_version_key(user_id), 0)
+    key = _roles_key(user_id, version)
+    cached = cache.get(key)
+    if cached is not None:
+        member_roles = MemberRoles(
+            workspaces=cached["workspaces"],
+            projects={
+                project_id: tuple(value)
+                for project_id, value in cached["projects"].items()
+            },
+        )
+    else:
+        member_roles = MemberRoles.load(user_id)
+        cache.set(
+            key,
+            {
+                "workspaces": member_roles.workspaces,
+                "projects": member_roles.projects,
+            },
+            MEMBER_ROLES_TIMEOUT,
+        )
+
+    request._member_roles = member_roles
+    return member_roles
+
+
+def invalidate_member_roles(user_ids):
+    """Bump the membership version of the given users"""
+    for user_id in {str(user_id) for user_id in user_ids if user_id}:
+        key = _version_key(user_id)
+        # Make sure the version key exists before incrementing it
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
@@ -0,0 +1,210 @@
+# Django imports
+from django.db.models import Count, Q
+
+# Module imports
+from plane.db.models import Notification, NotificationCategory
+from plane.settings.redis import redis_instance
+
+# Counters not read for a day are dropped and recounted on the next read
+NOTIFICATION_COUNTER_TIMEOUT = 60 * 60 * 24
+
+# Set of the "workspace_slug:receiver_id" pairs with a cached counter
+NOTIFICATION_COUNTER_MEMBERS = "notification_unread:members"
+
+# Notifications counted by the unread counters
+UNREAD_NOTIFICATION_FILTERS = {
+    "read_at__isnull": True,
+    "archived_at__isnull": True,
+    "snoozed_till__isnull": True,
+}
+
+# Increment a counter only while it is cached, a missing counter is
+# recounted from the database on its next read
+INCREMENT_IF_EXISTS = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return redis.call("HINCRBY", KEYS[1], ARGV[1], ARGV[2])
+end
+return nil
+"""
+
+# Overwrite a counter only while it is cached, keeping its expiry
+REPLACE_IF_EXISTS = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return redis.call("HSET", KEYS[1], "unread", ARGV[1], "mention", ARGV[2])
+end
+return nil
+"""
+
+
+def _counter_key(slug, receiver_id):
+    return f"notification_unread:{slug}:{receiver_id}"
+
+
+def _counter_field(category):
+    if category == NotificationCategory.MENTIONED:
+        return "mention"
+    return "unread"
+
+
+def count_unread_notifications(slugs, receiver_ids):
+    """
+    Count the unread and unread mention notifications of every (workspace,
+    receiver) pair in a single grouped query
+    """
+    mentioned = Q(category=NotificationCategory.MENTIONED)
+    return {
+        (row["workspace__slug"], str(row["receiver_id"])): {
+            "unread": row["unread"],
+            "mention": row["mention"],
+        }
+        for row in Notification.objects.filter(
+            workspace__slug__in=slugs,
+            receiver_id__in=receiver_ids,
+            **UNREAD_NOTIFICATION_FILTERS,
+        )
+        .values("workspace__slug", "receiver_id")
+        .annotate(
+            unread=Count("id", filter=~mentioned),
+            mention=Count("id", filter=mentioned),
+        )
+        .order_by()
+    }
+
+
+def store_unread_counts(ri, slug, receiver_id, counts):
+    key = _counter_key(slug, receiver_id)
+    pipe = ri.pipeline()
+    pipe.hset(key, mapping=counts)
+    pipe.expire(key, NOTIFICATION_COUNTER_TIMEOUT)
+    pipe.sadd(NOTIFICATION_COUNTER_MEMBERS, f"{slug}:{receiver_id}")
+    pipe.execute()
+
+
+def get_unread_counts(slug, receiver_id):
+    """Return the unread counters of the receiver, counting them on a miss"""
+    receiver_id = str(receiver_id)
+    ri = redis_instance()
+    cached = ri.hgetall(_counter_key(slug, receiver_id))
+    if cached:
+        return {
+            "unread": max(int(cached.get(b"unread", 0)), 0),
+            "mention": max(int(cached.get(b"mention", 0)), 0),
+        }
+
+    counts = count_unread_notifications([slug], [receiver_id]).get(
+        (slug, receiver_id), {"unread": 0, "mention": 0}
+    )
+    store_unread_counts(ri, slug, receiver_id, counts)
+    return counts
+
+
+def is_unread_notification(notification):
+    return (
+        notification.read_at is None
+        and notification.archived_at is None
+        and notification.snoozed_till is None
+    )
+
+
+def apply_unread_changes(increments):
+    """Apply the increments of count_unread_changes to the counters"""
+    increments = {key: value for key, value in increments.items() if value}
+    if not increments:
+        return
+
+    ri = redis_instance()
+    increment = ri.register_script(INCREMENT_IF_EXISTS)
+    pipe = ri.pipeline()
+    for (key, field), value in increments.items():
+        increment(keys=[key], args=[field, value], client=pipe)
+    pipe.execute()
+
+
+def count_unread_changes(slug, queryset, delta):
+    """
+    Increments of the counters for the notifications of the queryset which
+    enter (+1) or leave (-1) the unread state, counted with one grouped
+    query instead of loading them
+    """
+    increments = {}
+    for row in (
+        queryset.values("receiver_id", "category")
+        .annotate(count=Count("id"))
+        .order_by()
+    ):
+        key = (
+            _counter_key(slug, row["receiver_id"]),
+            _counter_field(row["category"]),
+        )
+        increments[key] = increments.get(key, 0) + row["count"] * delta
+    return increments
+
+
+def update_unread_counts(slug, notifications, delta):
+    """
+    Add delta to the counters of the notifications of the workspace which
+    entered (+1) or left (-1) the unread state
+    """
+    increments = {}
+    for notification in notifications:
+        key = (
+            _counter_key(slug, notification.receiver_id),
+            _counter_field(notification.category),
+        )
+        increments[key] = increments.get(key, 0) + delta
+    apply_unread_changes(increments)
+
+
+def sync_unread_counts(slug, notification, was_unread):
+    """Update the counters after a notification changed its state"""
+    unread = is_unread_notification(notification)
+    if unread != was_unread:
+        update_unread_counts(slug, [notification], 1 if unread else -1)
+
+
+def reconcile_unread_counts(batch_size=500):
+    """
+    Recount every cached counter from the database and drop the members
+    whose counter expired, returns the number of counters which drifted
+    """
+    ri = redis_instance()
+    replace = ri.register_script(REPLACE_IF_EXISTS)
+    members = [
+        member.decode().rsplit(":", 1)
+        for member in ri.smembers(NOTIFICATION_COUNTER_MEMBERS)
+    ]
+
+    drifted = 0
+    for index in range(0, len(members), batch_size):
+        batch = members[index : index + batch_size]
+        counts = count_unread_notifications(
+            {slug for slug, _ in batch},
+            {receiver_id for _, receiver_id in batch},
+        )
+
+        pipe = ri.pipeline()
+        for slug, receiver_id in batch:
+            pipe.hgetall(_counter_key(slug, receiver_id))
+        cached_counts = pipe.execute()
+
+        for (slug, receiver_id), cached in zip(batch, cached_counts):
+            if not cached:
+                ri.srem(
+                    NOTIFICATION_COUNTER_MEMBERS,
+                    f"{slug}:{receiver_id}",
+                )
+                continue
+
+            expected = counts.get(
+                (slug, receiver_id), {"unread": 0, "mention": 0}
+            )
+            if {
+                field.decode(): int(value) for field, value in cached.items()
+            } != expected:
+                drifted += 1
+                replace(
+                    keys=[_counter_key(slug, receiver_id)],
+                    args=[expected["unread"], expected["mention"]],
+                )
+
+    return drifted
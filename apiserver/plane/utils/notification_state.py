@@ -0,0 +1,140 @@
+# Django imports
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueSubscriber,
+    Notification,
+    WorkspaceMember,
+)
+from plane.utils.notification_counter import (
+    UNREAD_NOTIFICATION_FILTERS,
+    apply_unread_changes,
+    count_unread_changes,
+)
+
+# Field set by each transition, a None value clears it
+NOTIFICATION_TRANSITIONS = {
+    "read": "read_at",
+    "unread": "read_at",
+    "archive": "archived_at",
+    "unarchive": "archived_at",
+    "snooze": "snoozed_till",
+    "unsnooze": "snoozed_till",
+}
+
+NOTIFICATION_TYPES = ("all", "watching", "assigned", "created")
+
+
+def filter_notifications(
+    slug, user, snoozed=False, archived=False, type="all", ids=None
+):
+    """
+    Notifications of the user in the workspace matching the inbox filters,
+    the issue filters are applied as subqueries
+    """
+    notifications = Notification.objects.filter(
+        workspace__slug=slug, receiver_id=user.id
+    )
+
+    if ids is not None:
+        notifications = notifications.filter(pk__in=ids)
+
+    # Filter for snoozed notifications
+    if snoozed:
+        notifications = notifications.filter(
+            Q(snoozed_till__lt=timezone.now()) | Q(snoozed_till__isnull=False)
+        )
+    else:
+        notifications = notifications.filter(
+            Q(snoozed_till__gte=timezone.now()) | Q(snoozed_till__isnull=True),
+        )
+
+    # Filter for archived or unarchive
+    if archived:
+        notifications = notifications.filter(archived_at__isnull=False)
+    else:
+        notifications = notifications.filter(archived_at__isnull=True)
+
+    # Subscribed issues
+    if type == "watching":
+        notifications = notifications.filter(
+            entity_identifier__in=IssueSubscriber.objects.filter(
+                workspace__slug=slug, subscriber_id=user.id
+            ).values("issue_id")
+        )
+
+    # Assigned Issues
+    if type == "assigned":
+        notifications = notifications.filter(
+            entity_identifier__in=IssueAssignee.objects.filter(
+                workspace__slug=slug, assignee_id=user.id
+            ).values("issue_id")
+        )
+
+    # Created issues
+    if type == "created":
+        if WorkspaceMember.objects.filter(
+            workspace__slug=slug,
+            member=user,
+            role__lt=15,
+            is_active=True,
+        ).exists():
+            return notifications.none()
+        notifications = notifications.filter(
+            entity_identifier__in=Issue.objects.filter(
+                workspace__slug=slug, created_by=user
+            ).values("pk")
+        )
+
+    return notifications
+
+
+def transition_notifications(slug, notifications, action, snoozed_till=None):
+    """
+    Apply the action to the notifications with a single update and return
+    the number of notifications which changed
+    """
+    field = NOTIFICATION_TRANSITIONS[action]
+    if action == "snooze":
+        value = snoozed_till
+    elif action in ("read", "archive"):
+        value = timezone.now()
+    else:
+        value = None
+
+    # Only touch the notifications whose state changes, snoozing again
+    # moves the snooze time
+    notifications = notifications.order_by()
+    if action != "snooze":
+        notifications = notifications.filter(
+            **{f"{field}__isnull": value is not None}
+        )
+
+    # Notifications which leave or enter the unread state
+    if value is not None:
+        unread_changes = notifications.filter(**UNREAD_NOTIFICATION_FILTERS)
+        delta = -1
+    else:
+        unread_changes = notifications.filter(
+            **{
+                lookup: True
+                for lookup in UNREAD_NOTIFICATION_FILTERS
+                if not lookup.startswith(field)
+            },
+            **{f"{field}__isnull": False},
+        )
+        delta = 1
+
+    with transaction.atomic():
+        increments = count_unread_changes(slug, unread_changes, delta)
+        count = notifications.update(
+            **{field: value}, updated_at=timezone.now()
+        )
+
+    apply_unread_changes(increments)
+    return count
@@ -1,10 +1,17 @@
 # Python imports
+import base64
+import json
 import math
+import operator
 from collections import defaultdict
 from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from functools import reduce
+from uuid import UUID
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.db.models import Count, F, Q, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -57,6 +64,67 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+def encode_cursor_value(value):
+    # Keep the full precision of the timestamps compared by the seek
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Unsupported cursor value {value!r}")
+
+
+class KeysetCursor:
+    """
+    Cursor of the keyset pagination. It holds, for every group which has
+    more results, the group values followed by the sort values of the last
+    row returned, and the totals computed on the first page
+    """
+
+    prefix = "k:"
+
+    def __init__(
+        self, boundaries=None, hits=None, max_hits=None, has_results=None
+    ):
+        # None means the first page, an empty list means no more pages
+        self.boundaries = boundaries
+        self.hits = hits
+        self.max_hits = max_hits
+        self.has_results = has_results
+        self.is_prev = False
+
+    def __str__(self):
+        value = json.dumps(
+            {"b": self.boundaries or [], "h": self.hits, "m": self.max_hits},
+            default=encode_cursor_value,
+            separators=(",", ":"),
+        )
+        return self.prefix + base64.urlsafe_b64encode(
+            value.encode()
+        ).decode().rstrip("=")
+
+    def __repr__(self):
+        return f"{type(self).__name__}: boundaries={self.boundaries}"
+
+    def __bool__(self):
+        return bool(self.has_results)
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the keyset cursor from its string format"""
+        if value is None:
+            return cls()
+        try:
+            if not value.startswith(cls.prefix):
+                raise ValueError("Cursor must start with 'k:'")
+            encoded = value[len(cls.prefix) :]
+            data = json.loads(
+                base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            )
+            return cls(data["b"], data.get("h"), data.get("m"))
+        except (TypeError, ValueError, KeyError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -89,6 +157,17 @@ class BadPaginationError(Exception):
     pass
 
 
+def group_max_hits(queryset, group_by_field_name, count_filter, limit):
+    # Pages needed by the largest group
+    largest = (
+        queryset.values(group_by_field_name)
+        .annotate(count=Count("id", filter=count_filter, distinct=True))
+        .order_by("-count")
+        .first()
+    )
+    return math.ceil(largest["count"] / limit) if largest else 0
+
+
 class OffsetPaginator:
     """
     The Offset paginator using the offset and limit
@@ -124,6 +203,9 @@ class OffsetPaginator:
         if cursor is None:
             cursor = Cursor(0, 0, 0)
 
+        if isinstance(cursor, KeysetCursor):
+            return self.get_keyset_result(limit, cursor)
+
         # Get the min from limit and max limit
         limit = min(limit, self.max_limit)
 
@@ -183,6 +265,129 @@ class OffsetPaginator:
     def process_results(self, results):
         raise NotImplementedError
 
+    def keyset_fields(self):
+        """Return the (field, descending, nullable) sort fields of the seek"""
+        fields = [(self.key[0], self.desc, True)] if self.key else []
+        return fields + [("created_at", True, False), ("id", True, False)]
+
+    def keyset_ordering(self):
+        return [
+            (
+                F(field).desc(nulls_last=True)
+                if desc
+                else F(field).asc(nulls_last=True)
+            )
+            for field, desc, _ in self.keyset_fields()
+        ]
+
+    def seek_filter(self, values):
+        """Return the condition matching the rows sorted after the values"""
+        condition = None
+        for (field, desc, nullable), value in reversed(
+            list(zip(self.keyset_fields(), values))
+        ):
+            conditions = []
+            if value is None:
+                # Nulls are sorted last, only the next fields can advance
+                equal = Q(**{f"{field}__isnull": True})
+            else:
+                after = Q(**{f"{field}__{'lt' if desc else 'gt'}": value})
+                conditions.append(
+                    after | Q(**{f"{field}__isnull": True})
+                    if nullable
+                    else after
+                )
+                equal = Q(**{field: value})
+            if condition is not None:
+                conditions.append(equal & condition)
+            condition = reduce(operator.or_, conditions)
+        return condition
+
+    def keyset_totals(self, limit):
+        count = self.queryset.count()
+        return count, math.ceil(count / limit)
+
+    def get_keyset_result(self, limit, cursor, partition=()):
+        """
+        Return the next rows of every partition after the boundaries of
+        the cursor, the cost of a page does not depend on its depth
+        """
+        limit = min(limit, self.max_limit)
+        queryset = self.queryset
+
+        if cursor.boundaries is not None:
+            if not cursor.boundaries:
+                queryset = queryset.none()
+            else:
+                queryset = queryset.filter(
+                    reduce(
+                        operator.or_,
+                        [
+                            Q(**dict(zip(partition, boundary)))
+                            & self.seek_filter(boundary[len(partition) :])
+                            for boundary in cursor.boundaries
+                        ],
+                    )
+                )
+
+        ordering = self.keyset_ordering()
+        sort_fields = [field for field, _, _ in self.keyset_fields()]
+        if partition:
+            queryset = queryset.annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=[F(field) for field in partition],
+                    order_by=ordering,
+                )
+            )
+            results = queryset.filter(row_number__lte=limit).order_by(
+                *ordering
+            )
+            # The last row of every partition and the one after it
+            edges = queryset.filter(
+                row_number__gte=limit, row_number__lte=limit + 1
+            ).values(*partition, "row_number", *sort_fields)
+        else:
+            queryset = queryset.order_by(*ordering)
+            results = queryset[:limit]
+            edges = [
+                {**row, "row_number": row_number}
+                for row_number, row in enumerate(
+                    queryset.values(*sort_fields)[limit - 1 : limit + 1],
+                    start=limit,
+                )
+            ]
+
+        last_rows = {}
+        has_more = set()
+        for row in edges:
+            group = tuple(row[field] for field in partition)
+            if row["row_number"] == limit:
+                last_rows[group] = [
+                    *group,
+                    *(row[field] for field in sort_fields),
+                ]
+            else:
+                has_more.add(group)
+        boundaries = [last_rows[group] for group in has_more]
+
+        # Totals are only computed on the first page and carried after
+        if cursor.boundaries is None:
+            hits, max_hits = self.keyset_totals(limit)
+        else:
+            hits, max_hits = cursor.hits, cursor.max_hits
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=KeysetCursor(boundaries, hits, max_hits, bool(boundaries)),
+            prev=KeysetCursor(has_results=False),
+            hits=hits,
+            max_hits=max_hits,
+        )
+
 
 class GroupedOffsetPaginator(OffsetPaginator):
 
@@ -211,6 +416,31 @@ class GroupedOffsetPaginator(OffsetPaginator):
         self.group_by_fields = group_by_fields
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
+        # Totals of every group, computed once per page
+        self.group_totals = None
+
+    def get_group_totals(self):
+        """
+        Return the results of every group in a single grouped query, the
+        page flags, the hits and the group totals are all derived from it
+        """
+        if self.group_totals is None:
+            self.group_totals = defaultdict(int)
+            for group in (
+                self.queryset.values(self.group_by_field_name)
+                .annotate(
+                    count=Count(
+                        "id",
+                        filter=self.count_filter,
+                        distinct=True,
+                    )
+                )
+                .order_by()
+            ):
+                self.group_totals[
+                    str(group.get(self.group_by_field_name))
+                ] += group.get("count")
+        return self.group_totals
 
     def get_result(self, limit=50, cursor=None):
         # offset is page #
@@ -218,6 +448,11 @@ class GroupedOffsetPaginator(OffsetPaginator):
         if cursor is None:
             cursor = Cursor(0, 0, 0)
 
+        if isinstance(cursor, KeysetCursor):
+            return self.get_keyset_result(
+                limit, cursor, partition=[self.group_by_field_name]
+            )
+
         limit = min(limit, self.max_limit)
 
         # Adjust the initial offset and stop based on the cursor and limit
@@ -268,12 +503,14 @@ class GroupedOffsetPaginator(OffsetPaginator):
             F("created_at").desc(),
         )
 
-        # Adjust cursors based on the grouped results for pagination
+        group_totals = self.get_group_totals().values()
+
+        # A group with more rows than the page stop has a next page
         next_cursor = Cursor(
             limit,
             page + 1,
             False,
-            queryset.filter(row_number__gte=stop).exists(),
+            any(total >= stop for total in group_totals),
         )
 
         # Add previous cursors
@@ -284,59 +521,26 @@ class GroupedOffsetPaginator(OffsetPaginator):
             page > 0,
         )
 
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(
-                    count=Count(
-                        "id",
-                        filter=self.count_filter,
-                        distinct=True,
-                    )
-                )
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
         return CursorResult(
             results=results,
             next=next_cursor,
             prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
+            hits=sum(group_totals),
+            max_hits=math.ceil(max(group_totals, default=0) / limit),
         )
 
-    def __get_total_queryset(self):
-        # Get total items for each group
-        return (
-            self.queryset.values(self.group_by_field_name)
-            .annotate(
-                count=Count(
-                    "id",
-                    filter=self.count_filter,
-                    distinct=True,
-                )
-            )
-            .order_by()
+    def keyset_totals(self, limit):
+        group_totals = self.get_group_totals().values()
+        return sum(group_totals), math.ceil(
+            max(group_totals, default=0) / limit
         )
 
     def __get_total_dict(self):
         # Convert the total into dictionary of keys as group name and value as the total
-        total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(
-                    str(group.get(self.group_by_field_name)), 0
-                )
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-        return total_group_dict
+        return {
+            group: 1 if count == 0 else count
+            for group, count in self.get_group_totals().items()
+        }
 
     def __get_field_dict(self):
         # Create a field dictionary
@@ -349,13 +553,6 @@ class GroupedOffsetPaginator(OffsetPaginator):
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
     def __query_multi_grouper(self, results):
         # Grouping for m2m values
         total_group_dict = self.__get_total_dict()
@@ -364,6 +561,8 @@ class GroupedOffsetPaginator(OffsetPaginator):
         result_group_mapping = defaultdict(set)
         # Preparing a dict to group result by group ID
         grouped_by_field_name = defaultdict(list)
+        # Ids of the results already added to every group
+        added_result_ids = defaultdict(set)
 
         # Iterate over results to fill the above dictionaries
         for result in results:
@@ -380,9 +579,8 @@ class GroupedOffsetPaginator(OffsetPaginator):
             )
             # If a result belongs to multiple groups, add it to each group
             for group_id in group_ids:
-                if not self.__result_already_added(
-                    result, grouped_by_field_name[group_id]
-                ):
+                if result_id not in added_result_ids[group_id]:
+                    added_result_ids[group_id].add(result_id)
                     grouped_by_field_name[group_id].append(result)
 
         # Convert grouped_by_field_name back to a list for each group
@@ -456,6 +654,16 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         if cursor is None:
             cursor = Cursor(0, 0, 0)
 
+        if isinstance(cursor, KeysetCursor):
+            return self.get_keyset_result(
+                limit,
+                cursor,
+                partition=[
+                    self.group_by_field_name,
+                    self.sub_group_by_field_name,
+                ],
+            )
+
         # get the minimum value
         limit = min(limit, self.max_limit)
 
@@ -554,6 +762,11 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             max_hits=max_hits,
         )
 
+    def keyset_totals(self, limit):
+        return self.queryset.count(), group_max_hits(
+            self.queryset, self.group_by_field_name, self.count_filter, limit
+        )
+
     def __get_group_total_queryset(self):
         # Get group totals
         return (
@@ -763,9 +976,15 @@ class BasePaginator:
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
-            input_cursor = cursor_cls.from_string(
-                request.GET.get(self.cursor_name, f"{per_page}:0:0"),
-            )
+            # Keyset pages seek after the last row instead of an offset
+            if request.GET.get("pagination") == "keyset":
+                input_cursor = KeysetCursor.from_string(
+                    request.GET.get(self.cursor_name)
+                )
+            else:
+                input_cursor = cursor_cls.from_string(
+                    request.GET.get(self.cursor_name, f"{per_page}:0:0"),
+                )
         except ValueError:
             raise ParseError(detail="Invalid cursor parameter.")
 
@@ -0,0 +1,428 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.db import models, transaction
+from django.db.models import Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Concat, TruncDate
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    Module,
+    ProgressDailySnapshot,
+    ProgressDimension,
+    ProgressSnapshot,
+)
+
+# Issue field grouped by and snapshot column filled for every dimension
+DIMENSION_FIELDS = {
+    ProgressDimension.STATE_GROUP: ("state__group", "state_group"),
+    ProgressDimension.ASSIGNEE: ("assignees__id", "assignee_id"),
+    ProgressDimension.LABEL: ("labels__id", "label_id"),
+}
+
+# Type of the snapshot columns, the other dimensions leave them empty
+DIMENSION_COLUMNS = {
+    "state_group": models.CharField(),
+    "assignee_id": models.UUIDField(),
+    "label_id": models.UUIDField(),
+}
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+
+def snapshot_lookup(cycle_id=None, module_id=None):
+    return {"cycle_id": cycle_id} if cycle_id else {"module_id": module_id}
+
+
+def snapshot_issues(cycle_id=None, module_id=None):
+    if cycle_id:
+        return Issue.issue_objects.filter(
+            issue_cycle__cycle_id=cycle_id,
+            issue_cycle__deleted_at__isnull=True,
+        )
+    return Issue.issue_objects.filter(
+        issue_module__module_id=module_id,
+        issue_module__deleted_at__isnull=True,
+    )
+
+
+def progress_aggregates():
+    points = Cast("estimate_point__value", FloatField())
+    is_points = Q(estimate_point__estimate__type="points")
+    is_completed = Q(completed_at__isnull=False)
+    return {
+        "total_issues": Count("id"),
+        "completed_issues": Count("id", filter=is_completed),
+        "total_estimate_points": Sum(points, filter=is_points, default=0.0),
+        "completed_estimate_points": Sum(
+            points, filter=is_points & is_completed, default=0.0
+        ),
+    }
+
+
+def progress_distribution(issues):
+    """
+    Aggregates of the issues by state group, assignee and label from a
+    single grouped query, every row only fills the column of its dimension
+    """
+    querysets = []
+    for dimension, (field, column) in DIMENSION_FIELDS.items():
+        columns = {
+            name: F(field) if name == column else Cast(Value(None), output)
+            for name, output in DIMENSION_COLUMNS.items()
+        }
+        querysets.append(
+            issues.annotate(
+                dimension=Value(dimension.value, models.CharField()),
+                **columns,
+            )
+            .values("dimension", *columns)
+            .annotate(**progress_aggregates())
+            .order_by()
+        )
+
+    first, *others = querysets
+    return first.union(*others, all=True)
+
+
+def snapshot_date_range(entity):
+    """Return the dates of a cycle or module, empty without both dates"""
+    if isinstance(entity, Cycle):
+        start_date, end_date = entity.start_date, entity.end_date
+    else:
+        start_date, end_date = entity.start_date, entity.target_date
+
+    if not start_date or not end_date:
+        return []
+
+    if isinstance(entity, Cycle):
+        start_date, end_date = start_date.date(), end_date.date()
+
+    return [
+        start_date + timedelta(days=x)
+        for x in range((end_date - start_date).days + 1)
+    ]
+
+
+def seed_daily_snapshots(entity, issues, lookup, dates, totals):
+    """
+    Backfill the days before the first daily snapshot from the completion
+    dates of the issues, every seeded day carries the current scope
+    """
+    completions = list(
+        issues.filter(completed_at__isnull=False)
+        .annotate(date=TruncDate("completed_at"))
+        .values("date")
+        .annotate(**progress_aggregates())
+        .values("date", "completed_issues", "completed_estimate_points")
+        .order_by("date")
+    )
+
+    rows = []
+    index = 0
+    completed_issues = 0
+    completed_estimate_points = 0
+    for date in dates:
+        while index < len(completions) and completions[index]["date"] <= date:
+            completed_issues += completions[index]["completed_issues"]
+            completed_estimate_points += completions[index][
+                "completed_estimate_points"
+            ]
+            index += 1
+        rows.append(
+            ProgressDailySnapshot(
+                **lookup,
+                date=date,
+                project_id=entity.project_id,
+                workspace_id=entity.workspace_id,
+                total_issues=totals["total_issues"],
+                completed_issues=completed_issues,
+                total_estimate_points=totals["total_estimate_points"],
+                completed_estimate_points=completed_estimate_points,
+            )
+        )
+
+    ProgressDailySnapshot.objects.bulk_create(rows, batch_size=500)
+
+
+def refresh_progress_snapshot(cycle_id=None, module_id=None):
+    """
+    Recompute the distribution rows of a cycle or module and record the
+    totals of today in its daily series
+    """
+    lookup = snapshot_lookup(cycle_id=cycle_id, module_id=module_id)
+    model = Cycle if cycle_id else Module
+
+    with transaction.atomic():
+        # Serialize the refreshes of the same cycle or module
+        entity = (
+            model.objects.select_for_update()
+            .filter(pk=cycle_id or module_id)
+            .first()
+        )
+        if entity is None:
+            return
+
+        issues = snapshot_issues(**lookup)
+
+        rows = [
+            ProgressSnapshot(
+                **lookup,
+                **{key: item[key] for key in item},
+                project_id=entity.project_id,
+                workspace_id=entity.workspace_id,
+            )
+            for item in progress_distribution(issues)
+        ]
+
+        ProgressSnapshot.all_objects.filter(**lookup).delete()
+        ProgressSnapshot.objects.bulk_create(rows)
+
+        # Every issue has exactly one state group, their sum is the total
+        totals = {
+            key: sum(
+                getattr(row, key)
+                for row in rows
+                if row.dimension == ProgressDimension.STATE_GROUP
+            )
+            for key in progress_aggregates()
+        }
+
+        today = timezone.now().date()
+        first_date = (
+            ProgressDailySnapshot.objects.filter(**lookup)
+            .order_by("date")
+            .values_list("date", flat=True)
+            .first()
+        )
+        seed_dates = [
+            date
+            for date in snapshot_date_range(entity)
+            if date < (first_date or today) and date < today
+        ]
+        if seed_dates:
+            seed_daily_snapshots(entity, issues, lookup, seed_dates, totals)
+
+        ProgressDailySnapshot.objects.update_or_create(
+            **lookup,
+            date=today,
+            defaults={
+                **totals,
+                "project_id": entity.project_id,
+                "workspace_id": entity.workspace_id,
+            },
+        )
+
+
+def get_progress_snapshot(cycle_id=None, module_id=None):
+    """Return the distribution rows, materializing them on first read"""
+    lookup = snapshot_lookup(cycle_id=cycle_id, module_id=module_id)
+    if not ProgressDailySnapshot.objects.filter(**lookup).exists():
+        refresh_progress_snapshot(**lookup)
+    return ProgressSnapshot.objects.filter(**lookup)
+
+
+def progress_metrics(row, plot_type):
+    if plot_type == "points":
+        return {
+            "total_estimates": row["total_estimate_points"],
+            "completed_estimates": row["completed_estimate_points"],
+            "pending_estimates": row["total_estimate_points"]
+            - row["completed_estimate_points"],
+        }
+    return {
+        "total_issues": row["total_issues"],
+        "completed_issues": row["completed_issues"],
+        "pending_issues": row["total_issues"] - row["completed_issues"],
+    }
+
+
+def progress_stats(snapshot, estimates=False):
+    """
+    State group breakdown, estimate totals and the assignee and label
+    distributions of a cycle or module, from one read of its snapshot
+    """
+    rows = snapshot.annotate(
+        first_name=F("assignee__first_name"),
+        last_name=F("assignee__last_name"),
+        display_name=F("assignee__display_name"),
+        avatar_url=Case(
+            # If `avatar_asset` exists, use it to generate the asset URL
+            When(
+                assignee__avatar_asset__isnull=False,
+                then=Concat(
+                    Value("/api/assets/v2/static/"),
+                    "assignee__avatar_asset",
+                    Value("/"),
+                ),
+            ),
+            # Otherwise fall back to the `avatar` field
+            When(
+                assignee__avatar_asset__isnull=True,
+                then="assignee__avatar",
+            ),
+            default=Value(None),
+            output_field=models.CharField(),
+        ),
+        label_name=F("label__name"),
+        color=F("label__color"),
+    ).values(
+        "dimension",
+        "state_group",
+        "assignee_id",
+        "first_name",
+        "last_name",
+        "display_name",
+        "avatar_url",
+        "label_id",
+        "label_name",
+        "color",
+        "total_issues",
+        "completed_issues",
+        "total_estimate_points",
+        "completed_estimate_points",
+    )
+
+    groups, assignees, labels = {}, [], []
+    for row in rows:
+        if row["dimension"] == ProgressDimension.STATE_GROUP:
+            groups[row["state_group"]] = row
+        elif row["dimension"] == ProgressDimension.ASSIGNEE:
+            assignees.append(row)
+        else:
+            labels.append(row)
+
+    # Rows without a name, the unassigned and unlabelled ones, come last
+    assignees.sort(
+        key=lambda row: (
+            row["first_name"] is None,
+            row["first_name"] or "",
+            row["last_name"] or "",
+        )
+    )
+    labels.sort(
+        key=lambda row: (row["label_name"] is None, row["label_name"] or "")
+    )
+
+    data = {}
+    for group in STATE_GROUPS:
+        row = groups.get(group, {})
+        data[f"{group}_estimate_points"] = row.get("total_estimate_points", 0)
+        data[f"{group}_issues"] = row.get("total_issues", 0)
+
+    data["total_estimate_points"] = sum(
+        row["total_estimate_points"] for row in groups.values()
+    )
+    data["total_issues"] = sum(row["total_issues"] for row in groups.values())
+
+    def distribution(plot_type):
+        return {
+            "assignees": [
+                {
+                    "first_name": row["first_name"],
+                    "last_name": row["last_name"],
+                    "assignee_id": (
+                        str(row["assignee_id"]) if row["assignee_id"] else None
+                    ),
+                    "avatar_url": row["avatar_url"],
+                    "display_name": row["display_name"],
+                    **progress_metrics(row, plot_type),
+                }
+                for row in assignees
+            ],
+            "labels": [
+                {
+                    "label_name": row["label_name"],
+                    "color": row["color"],
+                    "label_id": (
+                        str(row["label_id"]) if row["label_id"] else None
+                    ),
+                    **progress_metrics(row, plot_type),
+                }
+                for row in labels
+            ],
+        }
+
+    data["distribution"] = distribution("issues")
+    data["estimate_distribution"] = distribution("points") if estimates else {}
+    return data
+
+
+def snapshot_burndown(entity, plot_type, cycle_id=None, module_id=None):
+    """
+    Return the pending issues or estimate points of every day of the cycle
+    or module from its daily snapshots, days without a snapshot carry the
+    last known value and future days are None
+    """
+    dates = snapshot_date_range(entity)
+    if not dates:
+        return {}
+
+    rows = list(
+        ProgressDailySnapshot.objects.filter(
+            **snapshot_lookup(cycle_id=cycle_id, module_id=module_id),
+            date__lte=dates[-1],
+        )
+        .order_by("date")
+        .values(
+            "date",
+            "total_issues",
+            "completed_issues",
+            "total_estimate_points",
+            "completed_estimate_points",
+        )
+    )
+
+    def pending(row):
+        if plot_type == "points":
+            return (
+                row["total_estimate_points"] - row["completed_estimate_points"]
+            )
+        return row["total_issues"] - row["completed_issues"]
+
+    today = timezone.now().date()
+    chart_data = {}
+    index = 0
+    value = pending(rows[0]) if rows else 0
+    for date in dates:
+        while index < len(rows) and rows[index]["date"] <= date:
+            value = pending(rows[index])
+            index += 1
+        chart_data[str(date)] = None if date > today else value
+    return chart_data
+
+
+def frozen_cycle_progress(cycle, estimates=False):
+    """
+    Progress of a cycle as stored in its progress_snapshot, recomputed
+    before the pending issues of the cycle are transferred away
+    """
+    refresh_progress_snapshot(cycle_id=cycle.id)
+    stats = progress_stats(
+        ProgressSnapshot.objects.filter(cycle_id=cycle.id),
+        estimates=estimates,
+    )
+
+    data = {"total_issues": stats["total_issues"]}
+    for group in STATE_GROUPS:
+        data[f"{group}_issues"] = stats[f"{group}_issues"]
+
+    data["distribution"] = {
+        **stats["distribution"],
+        "completion_chart": snapshot_burndown(
+            cycle, plot_type="issues", cycle_id=cycle.id
+        ),
+    }
+    data["estimate_distribution"] = {}
+    if estimates:
+        data["estimate_distribution"] = {
+            **stats["estimate_distribution"],
+            "completion_chart": snapshot_burndown(
+                cycle, plot_type="points", cycle_id=cycle.id
+            ),
+        }
+    return data
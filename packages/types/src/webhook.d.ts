@@ -3,6 +3,7 @@ export interface IWebhook {
   cycle: boolean;
   id: string;
   is_active: boolean;
+  is_batched?: boolean;
   issue: boolean;
   issue_comment: boolean;
   module: boolean;